@@ -0,0 +1,179 @@
+# src/core/module_discovery.py
+
+# Découverte des modules sans les importer : les métadonnées (ModuleInfo) sont lues
+# dans l’arbre syntaxique de leur __init__.py, jamais exécuté. Un module qui importe
+# PySide ou ses panneaux au chargement ne coûte donc rien tant qu’il n’est pas lancé.
+#
+# Le résultat est gardé dans un index sur disque (user_data/module_index.json),
+# invalidé par la date de modification et la taille du fichier, puis par son empreinte :
+# au démarrage, un module inchangé ne coûte qu’un stat().
+
+import ast
+import hashlib
+import json
+import os
+import threading
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Optional
+
+from core.user_data_manager import USER_DATA_DIR
+from models.module_info import ModuleInfo
+
+INDEX_FORMAT_VERSION = 1
+INDEX_FILE_NAME = "module_index.json"
+
+# Variable qui doit être définie à la racine de chaque __init__.py de module
+MODULE_INFO_VARIABLE = "ModuleInfo"
+
+_FIELD_NAMES = {f.name for f in fields(ModuleInfo)}
+
+
+def read_module_info(init_path: Path) -> Optional[ModuleInfo]:
+    """
+    Lit le ModuleInfo d’un __init__.py par analyse statique.
+    Les arguments doivent être des littéraux, ou des variables de la racine
+    du fichier qui valent des littéraux (name = "Parlia" … ModuleInfo(name=name)).
+    Un argument non littéral garde sa valeur par défaut.
+    :return: None si le fichier ne définit pas ModuleInfo ou ne se lit pas.
+    """
+    module_name = init_path.parent.name
+    try:
+        tree = ast.parse(init_path.read_bytes(), filename=str(init_path))
+    except (OSError, SyntaxError) as e:
+        print(f"💥 Lecture impossible de {module_name}: {e}")
+        return None
+
+    constants: dict[str, object] = {}
+    call: Optional[ast.Call] = None
+    for node in tree.body:
+        if not isinstance(node, ast.Assign) or len(node.targets) != 1:
+            continue
+        target = node.targets[0]
+        if not isinstance(target, ast.Name):
+            continue
+
+        if target.id == MODULE_INFO_VARIABLE and isinstance(node.value, ast.Call):
+            call = node.value
+            continue
+        try:
+            constants[target.id] = ast.literal_eval(node.value)
+        except ValueError:
+            constants.pop(target.id, None)
+
+    if call is None:
+        print(f"⛔ Le module '{module_name}' ne contient pas de variable 'ModuleInfo'.")
+        return None
+
+    values = {}
+    for keyword in call.keywords:
+        if keyword.arg not in _FIELD_NAMES:
+            continue
+        try:
+            values[keyword.arg] = _resolve(keyword.value, constants)
+        except ValueError:
+            print(
+                f"⚠️ {module_name} : '{keyword.arg}' n’est pas un littéral, "
+                "valeur par défaut utilisée."
+            )
+    return ModuleInfo(**values)
+
+
+def _resolve(node: ast.expr, constants: dict[str, object]) -> object:
+    if isinstance(node, ast.Name):
+        if node.id in constants:
+            return constants[node.id]
+        raise ValueError(node.id)
+    return ast.literal_eval(node)
+
+
+class ModuleIndex:
+    """
+    Index des ModuleInfo déjà lus, par chemin de __init__.py.
+    Chargé au premier usage et réécrit seulement si une entrée a changé.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._loaded = False
+
+    def module_info(self, init_path: Path) -> Optional[ModuleInfo]:
+        """
+        ModuleInfo du fichier, depuis l’index s’il n’a pas changé, sinon relu.
+        """
+        key = str(init_path.resolve())
+        stat = init_path.stat()
+
+        with self._lock:
+            self._ensure_loaded()
+            entry = self._entries.get(key)
+            if (
+                entry
+                and entry["mtime_ns"] == stat.st_mtime_ns
+                and entry["size"] == stat.st_size
+            ):
+                return ModuleInfo(**entry["info"])
+
+        # Date changée (copie, checkout…) mais contenu identique : pas de nouvelle analyse
+        digest = hashlib.sha256(init_path.read_bytes()).hexdigest()
+        if entry and entry["sha256"] == digest:
+            info = ModuleInfo(**entry["info"])
+        else:
+            info = read_module_info(init_path)
+            if info is None:
+                return None
+
+        with self._lock:
+            self._entries[key] = {
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "sha256": digest,
+                "info": asdict(info),
+            }
+            self._save()
+        return info
+
+    def prune(self, init_paths: list[Path]):
+        """
+        Oublie les modules qui n’existent plus.
+        """
+        keep = {str(p.resolve()) for p in init_paths}
+        with self._lock:
+            self._ensure_loaded()
+            removed = set(self._entries) - keep
+            if removed:
+                for key in removed:
+                    del self._entries[key]
+                self._save()
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"[WARN] Index des modules illisible, reconstruit : {e}")
+            return
+        if content.get("version") == INDEX_FORMAT_VERSION:
+            self._entries = content.get("entries", {})
+
+    def _save(self):
+        content = {"version": INDEX_FORMAT_VERSION, "entries": self._entries}
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(content, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[ERREUR] Index des modules non sauvegardé : {e}")
+
+
+# Singleton global (partagé par la barre latérale et l’accueil)
+module_index = ModuleIndex(USER_DATA_DIR / INDEX_FILE_NAME)
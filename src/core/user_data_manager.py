@@ -2,12 +2,26 @@
 UserDataManager - Gestion centralisée des fichiers de sauvegarde utilisateur pour Vølund.
 Crée automatiquement le dossier `user_data/` et les fichiers JSON de chaque module si besoin.
 Expose des méthodes typées et simples pour lire, écrire, charger, sauvegarder.
+
+Les documents lus restent en mémoire : une lecture ne coûte qu’un stat() pour vérifier
+que le fichier n’a pas été modifié par ailleurs (mtime). Les écritures sont regroupées :
+plusieurs set() rapprochés ne donnent qu’une sauvegarde, écrite dans un fichier temporaire
+puis renommée (atomique : un arrêt brutal ne laisse jamais un JSON à moitié écrit).
+Un set() qui ne change rien n’écrit rien, et batch() regroupe une suite de lectures
+et d’écritures en une seule lecture-modification-écriture.
 """
 
+import atexit
+import copy
 import json
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from typing import Optional
 
+from utils.settings import Settings
+
 # Dossier où seront stockés tous les fichiers utilisateur
 USER_DATA_DIR = Path("user_data")
 
@@ -17,90 +31,250 @@ MODULES = ["parlia", "tracker", "volund"]  # à adapter si besoin
 # Version actuelle du format des données utilisateur
 USER_DATA_VERSION = 1
 
+# Délai de regroupement des écritures avant la sauvegarde sur disque
+FLUSH_DELAY_SECONDS = 0.5
+
+# Stockages disponibles (Settings.USER_DATA_BACKEND)
+BACKEND_JSON = "json"
+BACKEND_SQLITE = "sqlite"
+
+
+def read_document(path: Path) -> dict:
+    """
+    Lit un fichier JSON en toute sécurité. Si le fichier est vide ou corrompu,
+    retourne une structure vide par défaut pour éviter les plantages.
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        return {"version": USER_DATA_VERSION, "data": {}}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            content = json.load(f)
+    except json.JSONDecodeError:
+        print(f"[ERREUR] Fichier JSON corrompu ou vide : {path}")
+        return {"version": USER_DATA_VERSION, "data": {}}
+    content.setdefault("data", {})
+    return content
+
 
 class UserDataManager:
-    def __init__(self):
+    def __init__(
+        self,
+        directory: Path = USER_DATA_DIR,
+        flush_delay: float = FLUSH_DELAY_SECONDS,
+    ):
         """
         Initialise le gestionnaire, crée le dossier user_data s'il n'existe pas,
         et initialise les fichiers JSON pour chaque module si absents.
+        :param flush_delay: Attente après un set() avant d’écrire (0 : écriture immédiate).
         """
-        USER_DATA_DIR.mkdir(exist_ok=True)
+        self.directory = directory
+        self.flush_delay = flush_delay
 
-        for module_name in MODULES:
-            file_path = USER_DATA_DIR / f"{module_name}.json"
-            if not file_path.exists():
-                self._write_file(file_path, {"version": USER_DATA_VERSION, "data": {}})
+        # Contenus en mémoire ({"version", "data"}) et mtime du fichier lu ou écrit
+        self._documents: dict[str, dict] = {}
+        self._mtimes: dict[str, Optional[int]] = {}
+        self._dirty: set[str] = set()
+        # Réentrant : flush() est appelé sous verrou par set() quand le délai est nul
+        self._lock = threading.RLock()
+        self._flush_timer: Optional[threading.Timer] = None
+        # Transaction en cours (imbrications comprises) et modules déjà vérifiés sur disque
+        self._batch_depth = 0
+        self._batch_checked: set[str] = set()
+
+        self.init()
+        # Les écritures en attente partent aussi à la fermeture normale de l’application
+        atexit.register(self.flush)
 
     def init(self):
         """
         Initialise le répertoire user_data et crée les fichiers pour chaque module si nécessaire.
         """
-        if not USER_DATA_DIR.exists():
-            USER_DATA_DIR.mkdir()
+        self.directory.mkdir(exist_ok=True)
 
         for module_name in MODULES:
-            file_path = USER_DATA_DIR / f"{module_name}.json"
+            file_path = self._path(module_name)
             if not file_path.exists():
                 self._write_file(file_path, {"version": USER_DATA_VERSION, "data": {}})
 
     def get(self, module_name: str, key: str) -> Optional[object]:
         """
-        Récupère une valeur depuis le fichier JSON du module.
+        Récupère une valeur depuis le document du module (copie : la modifier
+        ne change rien tant que set() n’est pas appelé).
         """
-        data = self.load(module_name)
-        return data.get(key)
+        with self._lock:
+            value = self._document(module_name)["data"].get(key)
+            return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
 
     def set(self, module_name: str, key: str, value: object):
         """
-        Modifie une valeur en mémoire et sauvegarde immédiatement le fichier JSON.
+        Modifie une valeur en mémoire ; la sauvegarde suit après flush_delay.
+        Une valeur identique à celle enregistrée ne déclenche aucune écriture.
         """
-        file_path = USER_DATA_DIR / f"{module_name}.json"
-        content = self._read_file(file_path)
-        content["data"][key] = value
-        self._write_file(file_path, content)
+        with self._lock:
+            data = self._document(module_name)["data"]
+            if key in data and data[key] == value:
+                return
+            data[key] = copy.deepcopy(value)
+            self._mark_dirty(module_name)
 
     def load(self, module_name: str) -> dict:
         """
         Charge les données du module, sans les métadonnées (version).
         """
-        file_path = USER_DATA_DIR / f"{module_name}.json"
-        content = self._read_file(file_path)
-        return content.get("data", {})
+        with self._lock:
+            return copy.deepcopy(self._document(module_name).get("data", {}))
 
     def save(self, module_name: str, data: dict):
         """
-        Sauvegarde un dictionnaire complet dans le fichier du module.
+        Remplace toutes les données du module.
         """
-        file_path = USER_DATA_DIR / f"{module_name}.json"
-        content = {"version": USER_DATA_VERSION, "data": data}
-        self._write_file(file_path, content)
+        with self._lock:
+            if self._document(module_name).get("data") == data:
+                return
+            self._documents[module_name] = {
+                "version": USER_DATA_VERSION,
+                "data": copy.deepcopy(data),
+            }
+            self._mark_dirty(module_name)
 
-    def _read_file(self, path: Path) -> dict:
+    @contextmanager
+    def batch(self):
         """
-        Lit un fichier JSON en toute sécurité. Si le fichier est vide ou corrompu,
-        retourne une structure vide par défaut pour éviter les plantages.
+        Transaction : les get()/set() du bloc partagent une seule lecture du disque
+        et ne donnent qu’une sauvegarde, à la sortie du bloc le plus externe.
+        Le verrou est gardé pendant tout le bloc (lecture-modification-écriture
+        sans interférence d’un autre thread).
+
+            with user_data.batch():
+                state = user_data.get("volund", "module_state")
+                ...
+                user_data.set("volund", "module_state", state)
         """
-        if not path.exists() or path.stat().st_size == 0:
-            return {"version": USER_DATA_VERSION, "data": {}}
-        try:
-            with open(path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except json.JSONDecodeError:
-            print(f"[ERREUR] Fichier JSON corrompu ou vide : {path}")
-            return {"version": USER_DATA_VERSION, "data": {}}
+        with self._lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            finally:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._batch_checked.clear()
+                    if self._dirty:
+                        self._schedule_flush()
 
-    def _write_file(self, path: Path, content: dict):
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(content, f, indent=2, ensure_ascii=False)
+    def flush(self):
+        """
+        Écrit tout de suite les modules modifiés (une écriture atomique par fichier).
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+
+            for module_name in sorted(self._dirty):
+                path = self._path(module_name)
+                # Échec : le module reste à écrire (ancien mtime), retenté au prochain flush
+                if self._write_file(path, self._documents[module_name]):
+                    self._mtimes[module_name] = self._mtime(path)
+                    self._dirty.discard(module_name)
 
     def get_version(self, module_name: str) -> int:
         """
         Récupère la version du fichier utilisateur du module.
         """
-        file_path = USER_DATA_DIR / f"{module_name}.json"
-        content = self._read_file(file_path)
-        return content.get("version", 0)
+        with self._lock:
+            return self._document(module_name).get("version", 0)
+
+    def _path(self, module_name: str) -> Path:
+        return self.directory / f"{module_name}.json"
+
+    def _document(self, module_name: str) -> dict:
+        """
+        Document du module, relu seulement si le fichier a changé sur disque
+        (modification externe) et qu’aucune écriture n’est en attente.
+        """
+        # Dans une transaction, le fichier n’est vérifié qu’une fois
+        if module_name in self._batch_checked:
+            return self._documents[module_name]
+        if self._batch_depth:
+            self._batch_checked.add(module_name)
+
+        path = self._path(module_name)
+        mtime = self._mtime(path)
+        cached = module_name in self._documents
+
+        if cached and (
+            mtime == self._mtimes.get(module_name) or module_name in self._dirty
+        ):
+            if module_name in self._dirty and mtime != self._mtimes.get(module_name):
+                print(
+                    f"[WARN] {path} modifié ailleurs : les changements en attente l’emportent."
+                )
+                self._mtimes[module_name] = mtime
+            return self._documents[module_name]
+
+        self._documents[module_name] = self._read_file(path)
+        self._mtimes[module_name] = mtime
+        return self._documents[module_name]
+
+    def _mark_dirty(self, module_name: str):
+        self._dirty.add(module_name)
+        # Dans une transaction, la sauvegarde attend la fin du bloc
+        if not self._batch_depth:
+            self._schedule_flush()
+
+    def _schedule_flush(self):
+        if self.flush_delay <= 0:
+            self.flush()
+            return
+
+        # Debounce : chaque écriture repousse la sauvegarde
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _read_file(self, path: Path) -> dict:
+        return read_document(path)
+
+    def _write_file(self, path: Path, content: dict) -> bool:
+        """
+        Écriture atomique : fichier temporaire synchronisé sur disque, puis renommage.
+        :return: False si l’écriture a échoué (le fichier d’origine est intact).
+        """
+        tmp_path = path.with_suffix(".json.tmp")
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(content, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[ERREUR] Sauvegarde de {path} échouée : {e}")
+            return False
+        return True
+
+
+def create_user_data_manager(backend: str = Settings.USER_DATA_BACKEND):
+    """
+    Gestionnaire correspondant au stockage choisi (JSON par défaut).
+    """
+    if backend == BACKEND_SQLITE:
+        # Import local : user_data_sqlite reprend les constantes de ce module
+        from core.user_data_sqlite import SqliteUserDataManager
+
+        return SqliteUserDataManager()
+    if backend != BACKEND_JSON:
+        print(f"[WARN] Stockage inconnu « {backend} » : utilisation de JSON.")
+    return UserDataManager()
 
 
 # Singleton global
-user_data = UserDataManager()
+user_data = create_user_data_manager()
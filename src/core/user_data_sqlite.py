@@ -0,0 +1,224 @@
+"""
+SqliteUserDataManager - Stockage des données utilisateur dans une base SQLite (mode WAL).
+Même interface que UserDataManager, mais une ligne par clé : un set() ne réécrit que
+la valeur concernée, quelle que soit la taille du reste du module.
+
+Au premier démarrage, les fichiers `user_data/*.json` existants sont importés une fois
+(ils restent en place, comme sauvegarde). Une seule connexion, protégée par un verrou :
+les appels peuvent venir de n’importe quel thread (raccourcis, QThreads, minuteries).
+"""
+
+import atexit
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from core.user_data_manager import (
+    MODULES,
+    USER_DATA_DIR,
+    USER_DATA_VERSION,
+    read_document,
+)
+
+# Nom du fichier de base dans le dossier user_data
+DATABASE_NAME = "user_data.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS modules (
+    module TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    module TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (module, key)
+) WITHOUT ROWID;
+"""
+
+# La valeur n’est réécrite que si elle change : un set() identique ne produit rien dans le WAL
+UPSERT = """
+INSERT INTO entries (module, key, value) VALUES (?, ?, ?)
+ON CONFLICT (module, key) DO UPDATE SET value = excluded.value
+WHERE value != excluded.value
+"""
+
+
+class SqliteUserDataManager:
+    def __init__(self, directory: Path = USER_DATA_DIR):
+        """
+        Ouvre (ou crée) la base, puis importe les fichiers JSON pas encore migrés.
+        """
+        self.directory = directory
+        self._lock = threading.RLock()
+        self._batch_depth = 0
+        self._connection: Optional[sqlite3.Connection] = None
+
+        self.init()
+        atexit.register(self.close)
+
+    def init(self):
+        """
+        Crée le dossier, la base et le schéma si nécessaire, puis migre les JSON.
+        """
+        with self._lock:
+            if self._connection is not None:
+                return
+
+            self.directory.mkdir(exist_ok=True)
+            # Autocommit : chaque set() hors transaction est validé aussitôt
+            self._connection = sqlite3.connect(
+                self.directory / DATABASE_NAME,
+                check_same_thread=False,
+                isolation_level=None,
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            # En WAL, NORMAL reste cohérent après un arrêt brutal (seul le dernier commit peut manquer)
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+
+            with self.batch():
+                self._migrate_json_files()
+                for module_name in MODULES:
+                    self._ensure_module(module_name, USER_DATA_VERSION)
+
+    def get(self, module_name: str, key: str) -> Optional[object]:
+        """
+        Récupère une valeur (nouvel objet à chaque appel).
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM entries WHERE module = ? AND key = ?",
+                (module_name, key),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, module_name: str, key: str, value: object):
+        """
+        Enregistre une valeur : une seule ligne est écrite, et rien si elle est inchangée.
+        """
+        encoded = self._encode(value)
+        with self._lock:
+            self._ensure_module(module_name, USER_DATA_VERSION)
+            self._connection.execute(UPSERT, (module_name, key, encoded))
+
+    def load(self, module_name: str) -> dict:
+        """
+        Charge toutes les données du module.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT key, value FROM entries WHERE module = ?", (module_name,)
+            ).fetchall()
+        return {key: json.loads(value) for key, value in rows}
+
+    def save(self, module_name: str, data: dict):
+        """
+        Remplace toutes les données du module.
+        """
+        with self.batch():
+            if self.load(module_name) == data:
+                return
+            self._connection.execute(
+                "DELETE FROM entries WHERE module = ?", (module_name,)
+            )
+            for key, value in data.items():
+                self.set(module_name, key, value)
+
+    @contextmanager
+    def batch(self):
+        """
+        Transaction : les écritures du bloc sont validées ensemble à la sortie
+        du bloc le plus externe, et toutes annulées si une exception en sort.
+        Le verrou est gardé pendant tout le bloc.
+        """
+        with self._lock:
+            if self._batch_depth == 0:
+                self._connection.execute("BEGIN IMMEDIATE")
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self._connection.execute("ROLLBACK")
+                raise
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._connection.execute("COMMIT")
+
+    def flush(self):
+        """
+        Rien en attente : chaque écriture est validée immédiatement (ou en fin de batch).
+        """
+
+    def get_version(self, module_name: str) -> int:
+        """
+        Récupère la version des données du module.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT version FROM modules WHERE module = ?", (module_name,)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def close(self):
+        """
+        Ferme la connexion (le WAL est reversé dans la base).
+        """
+        with self._lock:
+            if self._connection is None:
+                return
+            self._connection.close()
+            self._connection = None
+
+    def _ensure_module(self, module_name: str, version: int):
+        self._connection.execute(
+            "INSERT OR IGNORE INTO modules (module, version) VALUES (?, ?)",
+            (module_name, version),
+        )
+
+    def _migrate_json_files(self):
+        """
+        Import unique des fichiers JSON : un module déjà présent dans la base est ignoré.
+        Seuls les documents de données utilisateur ({"version", "data"}) sont repris :
+        les caches rangés dans le même dossier (transcriptions, index des modules) restent à part.
+        """
+        known = {
+            row[0] for row in self._connection.execute("SELECT module FROM modules")
+        }
+        for path in sorted(self.directory.glob("*.json")):
+            module_name = path.stem
+            if module_name in known:
+                continue
+
+            if not self._is_user_data_document(path):
+                continue
+
+            document = read_document(path)
+            self._ensure_module(module_name, document.get("version", USER_DATA_VERSION))
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entries (module, key, value) VALUES (?, ?, ?)",
+                [
+                    (module_name, key, self._encode(value))
+                    for key, value in document["data"].items()
+                ],
+            )
+            print(f"[INFO] {path.name} importé dans {DATABASE_NAME}.")
+
+    @staticmethod
+    def _is_user_data_document(path: Path) -> bool:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+        return isinstance(content, dict) and isinstance(content.get("data"), dict)
+
+    @staticmethod
+    def _encode(value: object) -> str:
+        # Clés triées : deux valeurs égales donnent le même texte (comparaison de l’upsert)
+        return json.dumps(value, ensure_ascii=False, sort_keys=True)
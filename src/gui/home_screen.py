@@ -13,6 +13,7 @@ from PySide6.QtWidgets import (
 )
 
 from core.module_manager import ModuleManager
+from core.user_data_manager import user_data
 from models.module_info import ModuleInfo
 from utils.module_state import set_module_favorite
 from utils.settings import Settings
@@ -89,13 +90,15 @@ class HomeScreen(QWidget):
     def _add_modules_to_grid(self, modules):
         """Ajoute les modules à la grille."""
         row, col = 0, 1
-        for module in modules:
-            card = self.create_module_card(module)
-            self.grid_layout.addWidget(card, row, col)
-            col += 1
-            if col > 3:
-                col = 0
-                row += 1
+        # Les étoiles enregistrent leur état initial : une seule sauvegarde pour toutes
+        with user_data.batch():
+            for module in modules:
+                card = self.create_module_card(module)
+                self.grid_layout.addWidget(card, row, col)
+                col += 1
+                if col > 3:
+                    col = 0
+                    row += 1
 
     def create_module_card(self, module):
         card = self._create_clickable_frame()
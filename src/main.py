@@ -1,12 +1,15 @@
+import multiprocessing
 import sys
 
-from PySide6.QtWidgets import QApplication
 
-from core.user_data_manager import user_data
-from gui.main_window import MainWindow
+def main():
+    # Imports ici et non en tête : un processus fils "spawn" réimporte ce fichier
+    # (sous le nom __mp_main__) et ne doit charger ni Qt ni l’interface
+    from PySide6.QtWidgets import QApplication
 
+    from core.user_data_manager import user_data
+    from gui.main_window import MainWindow
 
-def main():
     # ✅ Initialisation du dossier / fichiers user_data/
     user_data.init()
 
@@ -17,4 +20,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Exécutable figé : les processus fils (capture, transcription) repartent d’ici
+    multiprocessing.freeze_support()
     main()
@@ -0,0 +1,229 @@
+# modules/parlia/batch.py
+
+# Transcription en lot, sans interface (Qt n’est jamais importé).
+# Chaque processus du pool charge le modèle une seule fois via whisper_manager,
+# puis transcrit les fichiers qu’on lui confie. Les résultats sont ajoutés au fichier
+# de sortie au fil de l’eau : une exécution interrompue reprend là où elle s’était arrêtée.
+#
+# Depuis src/ :
+#   python -m modules.parlia.batch "D:/reunions" -m medium.pt -o reunions.jsonl -j 4
+#   python -m modules.parlia.batch "D:/reunions/**/*.m4a" -m small -f text -o reunions.txt
+
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Optional
+
+from modules.parlia.config import config
+from modules.parlia.core import whisper_manager
+from modules.parlia.core.audio_utils import WHISPER_SAMPLE_RATE
+from modules.parlia.core.parallel_transcriber import load_model_in_worker
+from modules.parlia.core.transcription_engines import DEFAULT_ENGINE
+from modules.parlia.core.vad import trim_silence
+
+AUDIO_EXTENSIONS = (".wav", ".mp3", ".m4a", ".flac", ".ogg", ".opus", ".webm", ".mp4")
+
+FORMAT_JSONL = "jsonl"
+FORMAT_TEXT = "text"
+TEXT_HEADER = "=== {file} ==="
+
+
+def collect_files(source: str) -> list[Path]:
+    """
+    Fichiers audio d’un dossier (non récursif) ou d’un motif glob ("**" accepté).
+    """
+    path = Path(source)
+    if path.is_dir():
+        candidates = path.iterdir()
+    else:
+        candidates = (Path(p) for p in glob.glob(source, recursive=True))
+
+    return sorted(
+        p.resolve()
+        for p in candidates
+        if p.is_file() and p.suffix.lower() in AUDIO_EXTENSIONS
+    )
+
+
+def read_done_files(output: Path, output_format: str) -> set[str]:
+    """
+    Fichiers déjà transcrits d’après la sortie existante (les échecs sont retentés).
+    """
+    if not output.exists():
+        return set()
+
+    done = set()
+    prefix, suffix = TEXT_HEADER.split("{file}")
+    with open(output, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if output_format == FORMAT_JSONL:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Dernière ligne tronquée par une interruption
+                if "text" in record:
+                    done.add(record["file"])
+            elif line.startswith(prefix) and line.endswith(suffix):
+                done.add(line[len(prefix) : len(line) - len(suffix)])
+    return done
+
+
+def format_result(result: dict, output_format: str) -> str:
+    if output_format == FORMAT_JSONL:
+        return json.dumps(result, ensure_ascii=False) + "\n"
+    return f"{TEXT_HEADER.format(file=result['file'])}\n{result['text']}\n\n"
+
+
+# === Côté processus de travail ===
+
+_trim = True  # Suppression des silences, fixée par l’initialiseur
+
+
+def _init_worker(model: str, engine_name: str, threads: int, trim: bool):
+    """
+    Initialiseur du pool : borne les threads de calcul puis charge le modèle une fois.
+    """
+    load_model_in_worker(model, engine_name, threads)
+
+    global _trim
+    _trim = trim
+
+
+def _transcribe_file(path: str) -> dict:
+    start = time.monotonic()
+    try:
+        audio = whisper_manager.load_audio(path)
+        audio_seconds = len(audio) / WHISPER_SAMPLE_RATE
+
+        removed = 0.0
+        if _trim:
+            audio, removed = trim_silence(
+                audio,
+                WHISPER_SAMPLE_RATE,
+                frame_ms=config.vad.frame_ms,
+                padding_ms=config.vad.padding_ms,
+                max_pause_seconds=config.vad.max_pause_seconds,
+            )
+        text = whisper_manager.transcribe(audio) if len(audio) else ""
+    except Exception as e:
+        return {"file": path, "error": str(e)}
+
+    return {
+        "file": path,
+        "text": text,
+        "audio_seconds": round(audio_seconds, 2),
+        "silence_removed_seconds": round(removed, 2),
+        "decode_seconds": round(time.monotonic() - start, 2),
+        "model": whisper_manager.get_current_model_key() or "",
+    }
+
+
+# === Côté processus principal ===
+
+
+def run(
+    source: str,
+    model: str,
+    output: Path,
+    output_format: str = FORMAT_JSONL,
+    workers: Optional[int] = None,
+    engine_name: str = DEFAULT_ENGINE,
+    trim: bool = True,
+) -> int:
+    """
+    Transcrit les fichiers de `source` absents de `output`.
+    :return: Nombre de fichiers en échec.
+    """
+    files = collect_files(source)
+    done = read_done_files(output, output_format)
+    todo = [str(p) for p in files if str(p) not in done]
+    print(
+        f"[INFO] {len(files)} fichier(s), {len(files) - len(todo)} déjà transcrit(s)."
+    )
+    if not todo:
+        return 0
+
+    cores = os.cpu_count() or 1
+    workers = max(1, min(workers or cores, len(todo)))
+    threads = max(1, cores // workers)
+    print(f"[INFO] {workers} processus × {threads} thread(s), modèle {model}.")
+
+    failures = 0
+    started = time.monotonic()
+    with open(output, "a", encoding="utf-8") as out, ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(model, engine_name, threads, trim),
+    ) as pool:
+        futures = [pool.submit(_transcribe_file, path) for path in todo]
+        try:
+            for index, future in enumerate(as_completed(futures), start=1):
+                result = future.result()
+                if "error" in result:
+                    failures += 1
+                    print(f"[ERREUR] {result['file']} : {result['error']}")
+                    if output_format == FORMAT_JSONL:
+                        out.write(format_result(result, output_format))
+                else:
+                    out.write(format_result(result, output_format))
+                    print(f"[{index}/{len(todo)}] {result['file']}")
+                # Chaque résultat est sur disque avant le suivant : reprise possible
+                out.flush()
+        except KeyboardInterrupt:
+            print("[INFO] Interruption : relancer la même commande pour reprendre.")
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    elapsed = time.monotonic() - started
+    print(f"[INFO] Terminé en {elapsed:.1f}s ({failures} échec(s)).")
+    return failures
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m modules.parlia.batch",
+        description="Transcription en lot de fichiers audio, sans interface.",
+    )
+    parser.add_argument("source", help="Dossier ou motif glob de fichiers audio")
+    parser.add_argument(
+        "-m",
+        "--model",
+        required=True,
+        help="Nom intégré (tiny, small…), fichier du dossier modèles ou chemin absolu",
+    )
+    parser.add_argument("-o", "--output", required=True, type=Path)
+    parser.add_argument(
+        "-f", "--format", choices=[FORMAT_JSONL, FORMAT_TEXT], default=FORMAT_JSONL
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, default=None, help="Processus (défaut : cœurs)"
+    )
+    parser.add_argument("-e", "--engine", default=DEFAULT_ENGINE)
+    parser.add_argument(
+        "--keep-silence", action="store_true", help="Ne pas retirer les silences"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        failures = run(
+            args.source,
+            args.model,
+            args.output,
+            output_format=args.format,
+            workers=args.workers,
+            engine_name=args.engine,
+            trim=not args.keep_silence,
+        )
+    except KeyboardInterrupt:
+        return 130
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 # modules/parlia/config.py
 
+import os
+
 
 class Timeouts:
     @property
@@ -19,6 +21,169 @@ class Timeouts:
         return 1.0
 
 
+class StreamingConfig:
+    @property
+    def segment_seconds(self) -> float:
+        """Durée visée d’un segment envoyé à Whisper pendant l’enregistrement."""
+        return 10.0
+
+    @property
+    def split_search_seconds(self) -> float:
+        """Fenêtre (fin de segment) dans laquelle on cherche un silence pour couper."""
+        return 1.5
+
+    @property
+    def prompt_context_chars(self) -> int:
+        """Nombre de caractères du texte précédent passés en contexte à Whisper."""
+        return 200
+
+
+class CaptureConfig:
+    @property
+    def ring_seconds(self) -> float:
+        """Audio que le callback peut mettre en attente avant que le thread de capture le vide."""
+        return 5.0
+
+    @property
+    def drain_interval_ms(self) -> int:
+        """Intervalle entre deux vidages du tampon circulaire (et mises à jour du chrono)."""
+        return 50
+
+    @property
+    def telemetry_rate_hz(self) -> float:
+        """Mises à jour par seconde au plus du chrono et de l’indicateur de niveau."""
+        return 20.0
+
+    @property
+    def late_drain_factor(self) -> float:
+        """Un vidage est compté en retard au-delà de ce multiple de drain_interval_ms."""
+        return 3.0
+
+    @property
+    def max_rate_error(self) -> float:
+        """Écart toléré entre fréquence effective et nominale avant d’alerter."""
+        return 0.01
+
+    @property
+    def disk_block_seconds(self) -> float:
+        """Bloc écrit d’un coup en enregistrement sur disque (seule mémoire utilisée)."""
+        return 2.0
+
+    @property
+    def preroll_seconds(self) -> float:
+        """Audio gardé avant l’appui sur le raccourci quand le micro reste armé."""
+        return 1.5
+
+
+class EndpointingConfig:
+    @property
+    def silence_options(self) -> list[float]:
+        """Silences finaux proposés pour l’arrêt automatique (0 : désactivé)."""
+        return [0.0, 0.8, 1.5, 3.0]
+
+    @property
+    def min_speech_seconds(self) -> float:
+        """Parole à entendre avant qu’un silence puisse arrêter la prise."""
+        return 0.3
+
+    @property
+    def frame_ms(self) -> int:
+        return 30
+
+    @property
+    def energy_ratio(self) -> float:
+        """Seuil de parole, en multiple du bruit de fond."""
+        return 3.0
+
+
+class VadConfig:
+    @property
+    def frame_ms(self) -> int:
+        """Durée d’une trame d’analyse (énergie, passages par zéro)."""
+        return 30
+
+    @property
+    def padding_ms(self) -> int:
+        """Marge gardée autour de la parole pour ne pas couper attaques et fins de mots."""
+        return 200
+
+    @property
+    def max_pause_seconds(self) -> float:
+        """Durée maximale gardée d’une pause interne."""
+        return 0.6
+
+
+class ChunkingConfig:
+    @property
+    def min_parallel_seconds(self) -> float:
+        """Durée à partir de laquelle une prise est découpée et décodée en parallèle."""
+        return 60.0
+
+    @property
+    def chunk_seconds(self) -> float:
+        """Durée visée d’un morceau (une fenêtre Whisper)."""
+        return 30.0
+
+    @property
+    def split_search_seconds(self) -> float:
+        """Fenêtre (fin de morceau) dans laquelle on cherche un silence pour couper."""
+        return 3.0
+
+    @property
+    def overlap_seconds(self) -> float:
+        """Chevauchement entre morceaux, dédoublonné au recollage."""
+        return 1.0
+
+    @property
+    def workers(self) -> int:
+        """Processus de décodage (chacun garde son propre modèle en mémoire)."""
+        return max(1, min(4, (os.cpu_count() or 1) // 2))
+
+    @property
+    def pool_idle_seconds(self) -> float:
+        """Délai sans prise après lequel le pool de décodage parallèle est arrêté."""
+        return 120.0
+
+
+class TranscriptionCacheConfig:
+    @property
+    def max_entries(self) -> int:
+        """Nombre de textes transcrits gardés en cache (LRU)."""
+        return 500
+
+    @property
+    def file_name(self) -> str:
+        """Fichier de persistance du cache, dans user_data/."""
+        return "parlia_transcriptions.json"
+
+    @property
+    def flush_delay_seconds(self) -> float:
+        """Attente après le dernier ajout avant de réécrire le fichier du cache."""
+        return 2.0
+
+
+class HistoryConfig:
+    @property
+    def file_name(self) -> str:
+        """Base de l’historique des transcriptions, dans user_data/."""
+        return "parlia_history.db"
+
+    @property
+    def page_size(self) -> int:
+        """Entrées chargées à chaque défilement en bas de liste."""
+        return 50
+
+    @property
+    def search_delay_ms(self) -> int:
+        """Attente après la dernière frappe avant de lancer la recherche."""
+        return 200
+
+    @property
+    def preview_chars(self) -> int:
+        """Longueur de l’aperçu d’une dictée dans la liste."""
+        return 160
+
+
 class ParliaConfig:
     @property
     def hotkey(self) -> str:
@@ -40,6 +205,34 @@ class ParliaConfig:
     def default_countdown_message(self) -> str:
         return "Attention, vous avez {n} seconde(s) pour vous focus sur VS Code..."
 
+    @property
+    def streaming(self) -> "StreamingConfig":
+        return StreamingConfig()
+
+    @property
+    def capture(self) -> "CaptureConfig":
+        return CaptureConfig()
+
+    @property
+    def vad(self) -> "VadConfig":
+        return VadConfig()
+
+    @property
+    def endpointing(self) -> "EndpointingConfig":
+        return EndpointingConfig()
+
+    @property
+    def chunking(self) -> "ChunkingConfig":
+        return ChunkingConfig()
+
+    @property
+    def transcription_cache(self) -> "TranscriptionCacheConfig":
+        return TranscriptionCacheConfig()
+
+    @property
+    def history(self) -> "HistoryConfig":
+        return HistoryConfig()
+
 
 # ✅ L’instance typée
 config = ParliaConfig()
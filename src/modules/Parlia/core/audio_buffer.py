@@ -0,0 +1,70 @@
+# modules/parlia/core/audio_buffer.py
+
+# Tampon NumPy préalloué pour une prise audio.
+# Le micro y écrit directement ses échantillons int16 ; Whisper lit ensuite
+# une version float32 16 kHz, sans passer par un fichier WAV ni par ffmpeg.
+
+import wave
+
+import numpy as np
+
+from modules.parlia.core.audio_utils import to_whisper_input
+
+
+class AudioBuffer:
+    def __init__(self, capacity_seconds: float, sample_rate: int):
+        """
+        :param capacity_seconds: Durée maximale de la prise (taille du tampon).
+        :param sample_rate: Fréquence d’échantillonnage de la capture.
+        """
+        self.sample_rate = sample_rate
+        self._data = np.empty(int(capacity_seconds * sample_rate), dtype=np.int16)
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    @property
+    def duration(self) -> float:
+        """Durée enregistrée, en secondes."""
+        return self._length / self.sample_rate
+
+    @property
+    def is_full(self) -> bool:
+        return self._length >= len(self._data)
+
+    def append(self, data: bytes | np.ndarray) -> bool:
+        """
+        Copie un bloc PCM int16 (octets ou tableau) à la suite du tampon.
+        Retourne False si le tampon est plein (le surplus est ignoré).
+        """
+        chunk = data if isinstance(data, np.ndarray) else np.frombuffer(data, np.int16)
+        free = len(self._data) - self._length
+        count = min(len(chunk), free)
+
+        self._data[self._length : self._length + count] = chunk[:count]
+        self._length += count
+        return count == len(chunk)
+
+    def samples(self, start: int = 0, end: int | None = None) -> np.ndarray:
+        """
+        Vue (sans copie) sur les échantillons int16 enregistrés.
+        """
+        end = self._length if end is None else min(end, self._length)
+        return self._data[start:end]
+
+    def to_whisper_input(self, start: int = 0, end: int | None = None) -> np.ndarray:
+        """
+        Échantillons [start:end] convertis en float32 16 kHz pour Whisper.
+        """
+        return to_whisper_input(self.samples(start, end), self.sample_rate)
+
+    def write_wav(self, path: str):
+        """
+        Écrit la prise dans un fichier WAV (utilisé seulement pour l’archivage).
+        """
+        with wave.open(path, "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(self.sample_rate)
+            wf.writeframes(self.samples().tobytes())
@@ -0,0 +1,62 @@
+# modules/parlia/core/audio_utils.py
+
+# Petites fonctions NumPy pour préparer l’audio brut du micro avant Whisper.
+# Whisper attend un tableau float32 mono à 16 kHz, normalisé dans [-1, 1].
+
+import numpy as np
+
+WHISPER_SAMPLE_RATE = 16000
+
+
+def resample_linear(samples: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """
+    Ré-échantillonne un signal mono par interpolation linéaire (sortie float64).
+    Suffisant pour de la voix vers 16 kHz, sans passer par ffmpeg.
+    """
+    if src_rate == dst_rate or len(samples) == 0:
+        return samples
+
+    duration = len(samples) / src_rate
+    dst_len = int(round(duration * dst_rate))
+    src_positions = np.arange(len(samples), dtype=np.float64)
+    dst_positions = np.linspace(0, len(samples) - 1, dst_len, dtype=np.float64)
+    return np.interp(dst_positions, src_positions, samples)
+
+
+def to_whisper_input(samples: np.ndarray, src_rate: int) -> np.ndarray:
+    """
+    Échantillons int16 du micro → tableau float32 16 kHz prêt pour Whisper.
+    Le ré-échantillonnage lit directement l’int16 ; la normalisation se fait
+    ensuite en place dans le tableau float32 de sortie.
+    """
+    if src_rate == WHISPER_SAMPLE_RATE:
+        resampled = samples
+    else:
+        resampled = resample_linear(samples, src_rate, WHISPER_SAMPLE_RATE)
+
+    out = np.empty(len(resampled), dtype=np.float32)
+    np.multiply(resampled, 1.0 / 32768.0, out=out, casting="same_kind")
+    return out
+
+
+def find_quiet_split(
+    samples: np.ndarray, sample_rate: int, search_seconds: float, frame_ms: int = 20
+) -> int:
+    """
+    Cherche le point le plus silencieux dans les `search_seconds` finales du signal.
+    Retourne l’index d’échantillon où couper, pour éviter de trancher un mot en deux.
+    """
+    frame_len = max(1, int(sample_rate * frame_ms / 1000))
+    search_len = min(len(samples), int(sample_rate * search_seconds))
+    n_frames = search_len // frame_len
+
+    if n_frames == 0:
+        return len(samples)
+
+    start = len(samples) - n_frames * frame_len
+    frames = samples[start:].astype(np.float32).reshape(n_frames, frame_len)
+    energy = np.mean(frames * frames, axis=1)
+    quietest = int(np.argmin(energy))
+
+    # On coupe au milieu de la trame la plus calme
+    return start + quietest * frame_len + frame_len // 2
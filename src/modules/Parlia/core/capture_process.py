@@ -0,0 +1,189 @@
+# modules/parlia/core/capture_process.py
+
+# Capture audio dans un processus séparé : le callback PortAudio ne partage plus
+# le GIL avec le décodage torch ni avec Qt. Le processus reste démarré entre
+# les prises et n’ouvre le micro que sur commande ; les échantillons passent
+# par un SharedRingBuffer, les commandes et accusés par deux files.
+#
+# Le fils ("spawn") importe ce module et réimporte le script de lancement sous le nom
+# __mp_main__ : ni l’un ni l’autre n’importe Qt ou torch au chargement (main.py
+# n’importe l’interface que dans main()).
+
+import multiprocessing
+import queue
+import threading
+import time
+from typing import Optional
+
+import numpy as np
+
+from modules.parlia.core.shared_ring_buffer import SharedRingBuffer
+
+try:
+    import win32api
+    import win32process
+except ImportError:
+    win32process = None
+
+CMD_START = "start"
+CMD_STOP = "stop"
+CMD_QUIT = "quit"
+
+EVENT_STARTED = "started"
+EVENT_STOPPED = "stopped"
+EVENT_ERROR = "error"
+
+# Intervalle de vérification que le fils est vivant pendant l’attente d’un accusé
+POLL_SECONDS = 0.1
+
+
+def run_capture(shm_name: str, capacity: int, commands, events):
+    """
+    Point d’entrée du processus de capture.
+    Commandes : (start, fréquence, taille de bloc), (stop,), (quit,).
+    """
+    import pyaudio
+
+    if win32process is not None:
+        win32process.SetPriorityClass(
+            win32api.GetCurrentProcess(), win32process.HIGH_PRIORITY_CLASS
+        )
+
+    ring = SharedRingBuffer.attach(shm_name, capacity)
+    audio = pyaudio.PyAudio()
+    stream = None
+
+    def on_audio(in_data, frame_count, time_info, status):
+        ring.count_device_status(
+            bool(status & pyaudio.paInputOverflow),
+            bool(status & pyaudio.paInputUnderflow),
+        )
+        ring.write(np.frombuffer(in_data, dtype=np.int16))
+        return None, pyaudio.paContinue
+
+    try:
+        while True:
+            command = commands.get()
+            if command[0] == CMD_START and stream is None:
+                _, rate, chunk_size = command
+                try:
+                    stream = audio.open(
+                        format=pyaudio.paInt16,
+                        channels=1,
+                        rate=rate,
+                        input=True,
+                        frames_per_buffer=chunk_size,
+                        stream_callback=on_audio,
+                    )
+                except OSError as e:
+                    events.put((EVENT_ERROR, str(e)))
+                else:
+                    events.put((EVENT_STARTED,))
+            elif command[0] == CMD_STOP:
+                if stream is not None:
+                    stream.stop_stream()
+                    stream.close()
+                    stream = None
+                events.put((EVENT_STOPPED,))
+            elif command[0] == CMD_QUIT:
+                break
+    finally:
+        if stream is not None:
+            stream.close()
+        audio.terminate()
+        ring.close()
+
+
+class CaptureProcess:
+    """
+    Côté processus principal : pilote le processus de capture et possède le bloc partagé.
+    """
+
+    def __init__(self, capacity: int, timeout: float = 5.0):
+        """
+        :param capacity: Taille du tampon partagé, en échantillons.
+        :param timeout: Attente maximale d’un accusé du processus (secondes).
+        """
+        self.capacity = capacity
+        self.timeout = timeout
+        self.ring = SharedRingBuffer.create(capacity)
+        # Une prise à la fois : la suivante attend que la précédente ait tout vidé
+        self._in_use = threading.Lock()
+
+        # "spawn" partout : un fork hériterait des threads Qt et de l’état de torch
+        self._context = multiprocessing.get_context("spawn")
+        self._start_process()
+
+    def _start_process(self):
+        # Files neuves : celles d’un fils mort peuvent contenir des messages orphelins
+        self._commands = self._context.Queue()
+        self._events = self._context.Queue()
+        self._process = self._context.Process(
+            target=run_capture,
+            args=(self.ring.name, self.capacity, self._commands, self._events),
+            name="parlia-capture",
+            daemon=True,
+        )
+        self._process.start()
+
+    @property
+    def is_alive(self) -> bool:
+        return self._process.is_alive()
+
+    def _wait_event(self) -> Optional[tuple]:
+        """
+        Attend un accusé, sans aller au bout du délai si le fils meurt entre-temps.
+        """
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                return self._events.get(timeout=POLL_SECONDS)
+            except queue.Empty:
+                if not self._process.is_alive() or time.monotonic() >= deadline:
+                    return None
+
+    def begin(self, rate: int, chunk_size: int) -> SharedRingBuffer:
+        """
+        Ouvre le micro dans le processus de capture.
+        :return: Le tampon partagé, vidé, que remplit le processus.
+            Appeler release() une fois la prise entièrement lue.
+        :raises OSError: Ouverture refusée, processus muet ou encore occupé.
+        """
+        if not self._in_use.acquire(timeout=self.timeout):
+            raise OSError("Le processus de capture est encore occupé.")
+
+        if not self._process.is_alive():
+            # Fils mort (pilote, plantage) : relancé une fois, sinon repli immédiat
+            print("[WARN] Processus de capture arrêté, redémarrage.")
+            self._start_process()
+
+        self.ring.reset()
+        self._commands.put((CMD_START, rate, chunk_size))
+        event = self._wait_event()
+        if event is None or event[0] == EVENT_ERROR:
+            self._in_use.release()
+            raise OSError(
+                event[1] if event else "Le processus de capture ne répond pas."
+            )
+        return self.ring
+
+    def end(self) -> bool:
+        """
+        Ferme le micro ; au retour, plus rien n’est écrit dans le tampon.
+        :return: False si le processus n’a pas confirmé à temps.
+        """
+        self._commands.put((CMD_STOP,))
+        event = self._wait_event()
+        return event is not None and event[0] == EVENT_STOPPED
+
+    def release(self):
+        """Le tampon a été vidé : la prise suivante peut le remettre à zéro."""
+        self._in_use.release()
+
+    def shutdown(self):
+        if self._process.is_alive():
+            self._commands.put((CMD_QUIT,))
+            self._process.join(self.timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+        self.ring.close()
@@ -0,0 +1,69 @@
+# modules/parlia/core/chunking.py
+
+# Découpage d’une longue prise en morceaux indépendants, coupés sur des silences,
+# puis recollage des textes. Les morceaux se chevauchent légèrement : les mots
+# décodés deux fois à une jointure sont retirés au recollage.
+
+import re
+
+import numpy as np
+
+from modules.parlia.core.audio_utils import find_quiet_split
+
+
+def plan_chunks(
+    samples: np.ndarray,
+    sample_rate: int,
+    chunk_seconds: float,
+    search_seconds: float,
+    overlap_seconds: float,
+) -> list[tuple[int, int]]:
+    """
+    Bornes (début, fin) des morceaux. Chaque coupe tombe sur le point le plus calme
+    des `search_seconds` finales du morceau ; chaque morceau après le premier
+    recommence `overlap_seconds` avant la coupe précédente.
+    """
+    chunk_len = int(chunk_seconds * sample_rate)
+    overlap = int(overlap_seconds * sample_rate)
+
+    cuts = []
+    start = 0
+    while len(samples) - start > chunk_len:
+        start += find_quiet_split(
+            samples[start : start + chunk_len], sample_rate, search_seconds
+        )
+        cuts.append(start)
+    cuts.append(len(samples))
+
+    chunks = []
+    previous = 0
+    for cut in cuts:
+        chunks.append((max(0, previous - overlap), cut))
+        previous = cut
+    return chunks
+
+
+def _normalize(word: str) -> str:
+    return re.sub(r"[^\w]", "", word.lower())
+
+
+def stitch_texts(texts: list[str], max_overlap_words: int = 12) -> str:
+    """
+    Recolle les textes des morceaux dans l’ordre. À chaque jointure, le plus long
+    suffixe du texte précédent répété en tête du suivant (casse et ponctuation
+    ignorées) n’est gardé qu’une fois.
+    """
+    words: list[str] = []
+    for text in texts:
+        next_words = text.split()
+        tail = [_normalize(w) for w in words[-max_overlap_words:]]
+        head = [_normalize(w) for w in next_words[:max_overlap_words]]
+
+        overlap = 0
+        for size in range(min(len(tail), len(head)), 0, -1):
+            if tail[-size:] == head[:size]:
+                overlap = size
+                break
+        words += next_words[overlap:]
+
+    return " ".join(words)
@@ -0,0 +1,74 @@
+# modules/parlia/core/device_caps.py
+
+# Fréquences d’échantillonnage acceptées par les micros, sondées une fois
+# par périphérique puis gardées dans une table (persistée par l’appelant).
+# Le but : capturer directement à 16 kHz quand le micro le permet.
+
+from typing import Optional
+
+from modules.parlia.core.audio_utils import WHISPER_SAMPLE_RATE
+
+# Par ordre de préférence après 16 kHz : 48 kHz se réduit d’un rapport entier (3:1)
+CANDIDATE_RATES = [WHISPER_SAMPLE_RATE, 48000, 32000, 44100, 22050, 96000]
+
+
+def device_key(device_info: dict) -> str:
+    """Identité stable d’un périphérique : API hôte + nom (l’index change d’une session à l’autre)."""
+    return f"{device_info.get('hostApi', 0)}:{device_info.get('name', '')}"
+
+
+def probe_rates(pa, device_info: dict, sample_format: int) -> list[int]:
+    """
+    Fréquences candidates acceptées en entrée mono par le périphérique.
+    """
+    rates = []
+    for rate in CANDIDATE_RATES:
+        try:
+            if pa.is_format_supported(
+                rate,
+                input_device=device_info["index"],
+                input_channels=1,
+                input_format=sample_format,
+            ):
+                rates.append(rate)
+        except ValueError:
+            pass  # PyAudio signale un format refusé par une exception
+    return rates
+
+
+def choose_capture_rate(supported: list[int], default_rate: int) -> int:
+    """
+    16 kHz si possible, sinon la première fréquence acceptée par ordre de préférence,
+    sinon la fréquence par défaut du périphérique.
+    """
+    for rate in CANDIDATE_RATES:
+        if rate in supported:
+            return rate
+    return default_rate
+
+
+class DeviceCapabilities:
+    def __init__(self, table: Optional[dict] = None):
+        """
+        :param table: Table {device_key: [fréquences]} déjà connue (persistée).
+        """
+        self.table: dict[str, list[int]] = dict(table or {})
+
+    def capture_rate(
+        self, pa, device_info: dict, sample_format: int
+    ) -> tuple[int, bool]:
+        """
+        Fréquence de capture pour ce périphérique ; ne sonde que s’il est inconnu.
+        :return: (fréquence, True si la table vient d’être complétée).
+        """
+        key = device_key(device_info)
+        probed = key not in self.table
+        if probed:
+            self.table[key] = probe_rates(pa, device_info, sample_format)
+
+        default_rate = int(device_info.get("defaultSampleRate", 44100))
+        return choose_capture_rate(self.table[key], default_rate), probed
+
+    def forget(self, device_info: dict):
+        """Oublie un périphérique (ex. ouverture refusée) : il sera sondé à nouveau."""
+        self.table.pop(device_key(device_info), None)
@@ -0,0 +1,279 @@
+# modules/parlia/core/disk_audio.py
+
+# Prise enregistrée directement sur disque, pour les longues sessions.
+# Les échantillons passent par un bloc préalloué de taille fixe, écrit en une fois
+# dans un WAV ".partial.wav" dont l’en-tête est corrigé après chaque bloc :
+# la mémoire ne dépend pas de la durée, et un arrêt brutal laisse un fichier lisible
+# (récupéré au démarrage suivant par recover_partial_recordings()).
+# En fin de prise, le WAV peut être compressé en FLAC ou Opus (soundfile, optionnel).
+
+import os
+import struct
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from modules.parlia.core.audio_utils import to_whisper_input
+
+try:
+    import soundfile
+except ImportError:
+    soundfile = None
+
+WAV_HEADER_SIZE = 44
+SAMPLE_WIDTH = 2  # int16 mono
+
+PARTIAL_SUFFIX = ".partial.wav"
+RECOVERED_SUFFIX = ".recovered.wav"
+
+FORMAT_WAV = "wav"
+FORMAT_FLAC = "flac"
+FORMAT_OPUS = "opus"
+# Extension et sous-type soundfile de chaque format compressé
+COMPRESSED_FORMATS = {
+    FORMAT_FLAC: (".flac", "FLAC", "PCM_16"),
+    FORMAT_OPUS: (".opus", "OGG", "OPUS"),
+}
+ENCODE_BLOCK_SAMPLES = 1 << 16
+
+
+def wav_header(sample_rate: int, data_bytes: int) -> bytes:
+    """En-tête PCM 16 bits mono de 44 octets."""
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_bytes,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,  # PCM
+        1,  # Mono
+        sample_rate,
+        sample_rate * SAMPLE_WIDTH,
+        SAMPLE_WIDTH,
+        16,
+        b"data",
+        data_bytes,
+    )
+
+
+def _read_wav_rate(path: Path) -> int:
+    with open(path, "rb") as f:
+        header = f.read(WAV_HEADER_SIZE)
+    return struct.unpack_from("<I", header, 24)[0]
+
+
+def _patch_header(f, sample_rate: int, data_bytes: int):
+    position = f.tell()
+    f.seek(0)
+    f.write(wav_header(sample_rate, data_bytes))
+    f.seek(position)
+
+
+def encode_archive(wav_path: Path, archive_format: str) -> Path:
+    """
+    Compresse un WAV en FLAC ou Opus par blocs (mémoire constante), puis supprime le WAV.
+    Sans soundfile, ou en cas d’échec, le WAV est gardé tel quel.
+    :return: Chemin du fichier d’archive final.
+    """
+    if archive_format not in COMPRESSED_FORMATS:
+        return wav_path
+    if soundfile is None:
+        print("[WARN] soundfile absent : archive gardée en WAV.")
+        return wav_path
+
+    suffix, container, subtype = COMPRESSED_FORMATS[archive_format]
+    target = wav_path.with_suffix(suffix)
+    sample_rate = _read_wav_rate(wav_path)
+    samples = np.memmap(wav_path, dtype=np.int16, mode="r", offset=WAV_HEADER_SIZE)
+    try:
+        with soundfile.SoundFile(
+            target, "w", sample_rate, 1, subtype=subtype, format=container
+        ) as out:
+            for start in range(0, len(samples), ENCODE_BLOCK_SAMPLES):
+                out.write(np.asarray(samples[start : start + ENCODE_BLOCK_SAMPLES]))
+    except (RuntimeError, ValueError) as e:
+        print(
+            f"[WARN] Compression {archive_format} échouée, archive gardée en WAV : {e}"
+        )
+        target.unlink(missing_ok=True)
+        return wav_path
+    finally:
+        del samples  # Libère le fichier avant sa suppression (Windows)
+
+    wav_path.unlink()
+    return target
+
+
+def recover_partial_recordings(directory: Path) -> list[Path]:
+    """
+    Répare les prises interrompues (en-tête recalculé d’après la taille du fichier)
+    et les renomme en ".recovered.wav".
+    :return: Fichiers récupérés.
+    """
+    recovered = []
+    for partial in sorted(directory.glob(f"*{PARTIAL_SUFFIX}")):
+        size = partial.stat().st_size
+        if size < WAV_HEADER_SIZE:
+            partial.unlink()
+            continue
+
+        data_bytes = (size - WAV_HEADER_SIZE) // SAMPLE_WIDTH * SAMPLE_WIDTH
+        with open(partial, "r+b") as f:
+            _patch_header(f, _read_wav_rate(partial), data_bytes)
+            f.truncate(WAV_HEADER_SIZE + data_bytes)
+
+        target = partial.with_name(
+            partial.name[: -len(PARTIAL_SUFFIX)] + RECOVERED_SUFFIX
+        )
+        os.replace(partial, target)
+        recovered.append(target)
+    return recovered
+
+
+class DiskAudioBuffer:
+    """
+    Même interface qu’AudioBuffer (append, samples, to_whisper_input…),
+    mais les échantillons vivent dans un fichier.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        sample_rate: int,
+        capacity_seconds: Optional[float] = None,
+        block_seconds: float = 2.0,
+    ):
+        """
+        :param path: Fichier WAV final ; la prise s’écrit d’abord dans "<nom>.partial.wav".
+        :param capacity_seconds: Durée maximale, ou None pour une prise sans limite.
+        :param block_seconds: Taille du bloc mémoire écrit d’un coup sur disque.
+        """
+        self.sample_rate = sample_rate
+        self.path = path.with_suffix(".wav")
+        self.partial_path = path.with_name(path.stem + PARTIAL_SUFFIX)
+        self._capacity = (
+            None if capacity_seconds is None else int(capacity_seconds * sample_rate)
+        )
+
+        self._block = np.empty(max(1, int(block_seconds * sample_rate)), np.int16)
+        self._block_length = 0
+        self._written = 0  # Échantillons déjà sur disque
+        self._closed = False
+
+        self.partial_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.partial_path, "w+b")
+        self._file.write(wav_header(sample_rate, 0))
+
+    def __len__(self) -> int:
+        return self._written + self._block_length
+
+    @property
+    def duration(self) -> float:
+        return len(self) / self.sample_rate
+
+    @property
+    def is_full(self) -> bool:
+        return self._capacity is not None and len(self) >= self._capacity
+
+    def append(self, data: bytes | np.ndarray) -> bool:
+        """
+        Copie un bloc PCM int16 ; chaque bloc mémoire plein part sur disque.
+        Retourne False si la capacité est atteinte (le surplus est ignoré).
+        """
+        chunk = data if isinstance(data, np.ndarray) else np.frombuffer(data, np.int16)
+        count = len(chunk)
+        if self._capacity is not None:
+            count = min(count, self._capacity - len(self))
+
+        copied = 0
+        while copied < count:
+            room = len(self._block) - self._block_length
+            step = min(room, count - copied)
+            end = self._block_length + step
+            self._block[self._block_length : end] = chunk[copied : copied + step]
+            self._block_length = end
+            copied += step
+            if self._block_length == len(self._block):
+                self._write_block()
+
+        return count == len(chunk)
+
+    def _write_block(self):
+        if self._block_length == 0:
+            return
+        self._file.seek(0, os.SEEK_END)
+        self._file.write(self._block[: self._block_length].tobytes())
+        self._written += self._block_length
+        self._block_length = 0
+
+        # En-tête à jour et données sur disque : le fichier reste lisible après un crash
+        _patch_header(self._file, self.sample_rate, self._written * SAMPLE_WIDTH)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def samples(self, start: int = 0, end: int | None = None) -> np.ndarray:
+        """
+        Échantillons int16 [start:end] : vue sur le fichier une fois la prise finalisée,
+        copie lue sur disque (et bloc mémoire) pendant l’enregistrement.
+        """
+        end = len(self) if end is None else min(end, len(self))
+        start = min(start, end)
+
+        if self._closed:
+            return self._read_closed()[start:end]
+        if start == end:
+            return self._block[:0].copy()
+
+        parts = []
+        if start < self._written:
+            disk_end = min(end, self._written)
+            self._file.seek(WAV_HEADER_SIZE + start * SAMPLE_WIDTH)
+            raw = self._file.read((disk_end - start) * SAMPLE_WIDTH)
+            parts.append(np.frombuffer(raw, dtype=np.int16))
+        if end > self._written:
+            parts.append(
+                self._block[
+                    max(start, self._written) - self._written : end - self._written
+                ]
+            )
+        return np.concatenate(parts) if len(parts) > 1 else parts[0].copy()
+
+    def _read_closed(self) -> np.ndarray:
+        if self.path.suffix == ".wav":
+            return np.memmap(
+                self.path,
+                dtype=np.int16,
+                mode="r",
+                offset=WAV_HEADER_SIZE,
+                shape=(self._written,),
+            )
+        data, _ = soundfile.read(self.path, dtype="int16")
+        return data
+
+    def to_whisper_input(self, start: int = 0, end: int | None = None) -> np.ndarray:
+        return to_whisper_input(self.samples(start, end), self.sample_rate)
+
+    def finalize(self, archive_format: str = FORMAT_WAV) -> Path:
+        """
+        Écrit le dernier bloc, ferme le fichier et lui donne son nom définitif
+        (compressé si demandé). La prise reste lisible via samples().
+        :return: Chemin du fichier final.
+        """
+        if self._closed:
+            return self.path
+
+        self._write_block()
+        self._file.close()
+        self._closed = True
+        os.replace(self.partial_path, self.path)
+
+        self.path = encode_archive(self.path, archive_format)
+        return self.path
+
+    def write_wav(self, path: str):
+        """Compatibilité avec AudioBuffer : copie la prise finalisée en WAV."""
+        with open(path, "wb") as f:
+            f.write(wav_header(self.sample_rate, len(self) * SAMPLE_WIDTH))
+            f.write(np.ascontiguousarray(self.samples()).tobytes())
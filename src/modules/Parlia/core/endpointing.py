@@ -0,0 +1,80 @@
+# modules/parlia/core/endpointing.py
+
+# Détection de fin d’énoncé pendant la capture (dictée mains libres).
+# Chaque bloc vidé par l’enregistreur est découpé en trames dont l’énergie est
+# calculée d’un coup (NumPy) ; la fin est atteinte quand, après assez de parole,
+# le silence final dure `silence_seconds`.
+
+from typing import Optional
+
+import numpy as np
+
+
+class EndpointDetector:
+    def __init__(
+        self,
+        sample_rate: int,
+        silence_seconds: float,
+        min_speech_seconds: float = 0.3,
+        frame_ms: int = 30,
+        energy_ratio: float = 3.0,
+        min_energy: float = 1e-5,
+    ):
+        """
+        :param silence_seconds: Silence final qui termine l’énoncé.
+        :param min_speech_seconds: Parole à entendre avant de pouvoir s’arrêter
+            (un micro ouvert sans rien dire ne coupe pas la prise).
+        :param energy_ratio: Seuil de parole, en multiple du bruit de fond.
+        :param min_energy: Seuil plancher (float32 normalisé) pour un micro très silencieux.
+        """
+        self.frame_len = max(1, int(sample_rate * frame_ms / 1000))
+        self.frame_seconds = self.frame_len / sample_rate
+        self.silence_seconds = silence_seconds
+        self.min_speech_seconds = min_speech_seconds
+        self.energy_ratio = energy_ratio
+        self.min_energy = min_energy
+
+        self.noise_floor: Optional[float] = None
+        self.speech_seconds = 0.0
+        self.trailing_silence_seconds = 0.0
+        self._pending = np.zeros(0, dtype=np.float32)  # Fin de bloc sans trame complète
+
+    @property
+    def endpoint_reached(self) -> bool:
+        return (
+            self.speech_seconds >= self.min_speech_seconds
+            and self.trailing_silence_seconds >= self.silence_seconds
+        )
+
+    def process(self, samples: np.ndarray) -> bool:
+        """
+        Ajoute un bloc (int16 ou float32 mono) à l’analyse.
+        :return: True dès que la fin d’énoncé est atteinte.
+        """
+        if samples.dtype == np.int16:
+            samples = samples.astype(np.float32) / 32768.0
+        samples = np.concatenate((self._pending, samples))
+
+        n_frames = len(samples) // self.frame_len
+        self._pending = samples[n_frames * self.frame_len :]
+        if n_frames == 0:
+            return self.endpoint_reached
+
+        frames = samples[: n_frames * self.frame_len].reshape(n_frames, self.frame_len)
+        energy = np.mean(np.square(frames), axis=1)
+
+        # Bruit de fond : plus faible 10e centile vu jusqu’ici (le pré-enregistrement aide)
+        chunk_floor = float(np.percentile(energy, 10))
+        if self.noise_floor is None or chunk_floor < self.noise_floor:
+            self.noise_floor = chunk_floor
+        threshold = max(self.min_energy, self.noise_floor * self.energy_ratio)
+
+        speech = np.flatnonzero(energy > threshold)
+        if len(speech):
+            self.speech_seconds += len(speech) * self.frame_seconds
+            silent_frames = n_frames - 1 - speech[-1]
+            self.trailing_silence_seconds = silent_frames * self.frame_seconds
+        else:
+            self.trailing_silence_seconds += n_frames * self.frame_seconds
+
+        return self.endpoint_reached
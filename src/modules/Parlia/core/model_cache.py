@@ -0,0 +1,87 @@
+# modules/parlia/core/model_cache.py
+
+# Cache LRU des modèles chargés, borné par un budget mémoire.
+# Indépendant de Whisper : la taille d’un modèle est donnée par `size_of`.
+
+from collections import OrderedDict
+from typing import Callable, Optional
+
+
+class ModelCache:
+    def __init__(self, budget_bytes: int, size_of: Callable[[object], int]):
+        """
+        :param budget_bytes: Mémoire maximale occupée par les modèles résidents.
+        :param size_of: Fonction donnant l’empreinte mémoire (octets) d’un modèle.
+        """
+        self.budget_bytes = budget_bytes
+        self._size_of = size_of
+        self._entries: OrderedDict[str, tuple[object, int]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(size for _, size in self._entries.values())
+
+    def keys(self) -> list[str]:
+        """Clés résidentes, de la moins récemment utilisée à la plus récente."""
+        return list(self._entries.keys())
+
+    def get(self, key: str) -> Optional[object]:
+        """
+        Retourne le modèle s’il est résident (et le marque comme le plus récent).
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: str, model: object) -> list[str]:
+        """
+        Ajoute un modèle comme le plus récent, puis évince les moins récents
+        tant que le budget est dépassé. Le modèle ajouté n’est jamais évincé.
+        :return: Les clés évincées.
+        """
+        self._entries[key] = (model, self._size_of(model))
+        self._entries.move_to_end(key)
+        return self._evict_over_budget()
+
+    def remove(self, key: str) -> bool:
+        return self._entries.pop(key, None) is not None
+
+    def clear(self):
+        self._entries.clear()
+
+    def set_budget(self, budget_bytes: int) -> list[str]:
+        self.budget_bytes = budget_bytes
+        return self._evict_over_budget()
+
+    def stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "resident": self.keys(),
+            "total_bytes": self.total_bytes,
+            "budget_bytes": self.budget_bytes,
+        }
+
+    def _evict_over_budget(self) -> list[str]:
+        evicted = []
+        while len(self._entries) > 1 and self.total_bytes > self.budget_bytes:
+            key, _ = self._entries.popitem(last=False)
+            evicted.append(key)
+            self.evictions += 1
+        return evicted
@@ -0,0 +1,141 @@
+# modules/parlia/core/parallel_transcriber.py
+
+# Décodage parallèle des longues prises : la prise est découpée sur des silences
+# (voir chunking.py), chaque morceau est transcrit par un processus du pool,
+# puis les textes sont recollés dans l’ordre.
+#
+# Chaque processus charge le modèle actif une seule fois. Le pool est recréé
+# quand le modèle change, et arrêté par whisper_service après un temps sans prise.
+# Aucun import Qt : utilisable aussi hors interface.
+
+import os
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+import numpy as np
+
+from modules.parlia.config import config
+from modules.parlia.core import whisper_manager
+from modules.parlia.core.audio_utils import WHISPER_SAMPLE_RATE
+from modules.parlia.core.chunking import plan_chunks, stitch_texts
+from modules.parlia.core.transcription_engines import get_engine
+
+
+def load_model_in_worker(model: str, engine_name: str, threads: int):
+    """
+    Initialiseur de pool : borne les threads de calcul du processus,
+    puis charge le modèle une seule fois.
+    """
+    # Avant tout import de torch dans ce processus
+    os.environ["OMP_NUM_THREADS"] = str(threads)
+    get_engine("ctranslate2").cpu_threads = threads
+
+    if not whisper_manager.load_model(model, engine_name=engine_name):
+        raise RuntimeError(f"Modèle introuvable ou moteur indisponible : {model}")
+
+    torch = sys.modules.get("torch")
+    if torch is not None:
+        torch.set_num_threads(threads)
+
+
+def _transcribe_chunk(samples: np.ndarray) -> str:
+    return whisper_manager.transcribe(samples)
+
+
+def _ready() -> bool:
+    return whisper_manager.is_model_loaded()
+
+
+class ParallelTranscriber:
+    def __init__(self, workers: int):
+        self.workers = workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._model_key: Optional[str] = None
+        # Préparé depuis l’UI, utilisé par le thread de transcription, arrêté au repos
+        self._lock = threading.Lock()
+
+    def is_long(self, samples: np.ndarray) -> bool:
+        """Vrai si la prise vaut d’être découpée (et si le pool a plusieurs processus)."""
+        min_samples = config.chunking.min_parallel_seconds * WHISPER_SAMPLE_RATE
+        return self.workers > 1 and len(samples) >= min_samples
+
+    @property
+    def is_running(self) -> bool:
+        return self._pool is not None
+
+    def prepare(self):
+        """
+        Démarre le pool et y charge le modèle actif, sans attendre :
+        à appeler quand la prise en cours devient longue, pendant l’enregistrement.
+        Sans effet si le pool tourne déjà avec ce modèle, ou s’il n’aurait qu’un processus.
+        """
+        if self.workers <= 1:
+            return
+        if self._pool is not None and (
+            self._model_key == whisper_manager.get_current_model_key()
+        ):
+            return
+
+        pool = self._ensure_pool()
+        if pool is not None:
+            for _ in range(self.workers):
+                pool.submit(_ready)
+
+    def transcribe(self, samples: np.ndarray) -> str:
+        chunks = plan_chunks(
+            samples,
+            WHISPER_SAMPLE_RATE,
+            chunk_seconds=config.chunking.chunk_seconds,
+            search_seconds=config.chunking.split_search_seconds,
+            overlap_seconds=config.chunking.overlap_seconds,
+        )
+        pool = self._ensure_pool() if len(chunks) > 1 else None
+        if pool is None:
+            return whisper_manager.transcribe(samples)
+
+        print(f"[INFO] Décodage parallèle : {len(chunks)} morceaux.")
+        try:
+            futures = [
+                pool.submit(_transcribe_chunk, samples[start:end])
+                for start, end in chunks
+            ]
+            texts = [future.result() for future in futures]
+        except BrokenProcessPool as e:
+            # Pool inutilisable (modèle non chargeable, processus tué) : décodage en série
+            print(f"[ERREUR] Pool de décodage indisponible : {e}")
+            self.shutdown()
+            return whisper_manager.transcribe(samples)
+
+        return stitch_texts(texts)
+
+    def _ensure_pool(self) -> Optional[ProcessPoolExecutor]:
+        model_key = whisper_manager.get_current_model_key()
+        if model_key is None:
+            return None
+        with self._lock:
+            if self._pool is not None and model_key == self._model_key:
+                return self._pool
+
+            self._shutdown_pool()
+            engine_name, model_ref = model_key.split(":", 1)
+            threads = max(1, (os.cpu_count() or 1) // self.workers)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=load_model_in_worker,
+                initargs=(model_ref, engine_name, threads),
+            )
+            self._model_key = model_key
+            return self._pool
+
+    def shutdown(self):
+        with self._lock:
+            self._shutdown_pool()
+
+    def _shutdown_pool(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        self._pool = None
+        self._model_key = None
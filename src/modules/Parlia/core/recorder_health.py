@@ -0,0 +1,141 @@
+# modules/parlia/core/recorder_health.py
+
+# Santé d’une prise : pertes signalées par le périphérique et par le tampon
+# circulaire, vidages en retard, gigue de la boucle de vidage, et fréquence
+# effective mesurée contre l’horloge murale. Ces mesures sont gardées avec la prise
+# pour régler tailles de blocs et de tampons sur des données réelles.
+
+import math
+import time
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class RecorderHealth:
+    nominal_rate: int
+    duration_seconds: float
+    effective_rate: float  # Échantillons reçus par seconde d’horloge (0 si trop court)
+    device_overflows: int
+    device_underflows: int
+    ring_overflows: int
+    dropped_samples: int
+    late_drains: int
+    drain_jitter_ms: float  # Écart type de l’intervalle entre deux vidages
+    max_drain_delay_ms: float  # Plus grand retard sur l’intervalle prévu
+    # Incertitude de la mesure de fréquence : les échantillons arrivent par blocs,
+    # le compte peut être faux d’un bloc (±block / durée), sans aucun défaut réel
+    rate_tolerance: float = 0.0
+
+    @property
+    def rate_error(self) -> float:
+        """Écart relatif entre fréquence effective et nominale (0 si non mesurée)."""
+        if not self.effective_rate:
+            return 0.0
+        return self.effective_rate / self.nominal_rate - 1
+
+    def is_degraded(self, max_rate_error: float = 0.01) -> bool:
+        """Des échantillons ont manqué, ou l’horloge du périphérique dérive."""
+        return bool(
+            self.device_overflows
+            or self.ring_overflows
+            or self.dropped_samples
+            or abs(self.rate_error) > max_rate_error + self.rate_tolerance
+        )
+
+    def to_dict(self) -> dict:
+        values = asdict(self)
+        values["rate_error"] = self.rate_error
+        return {
+            name: round(value, 3) if isinstance(value, float) else value
+            for name, value in values.items()
+        }
+
+
+class HealthMonitor:
+    """
+    Suit la boucle de vidage du thread de capture (une mesure par vidage, en O(1)).
+    """
+
+    def __init__(
+        self,
+        nominal_rate: int,
+        interval_seconds: float,
+        late_factor: float = 3.0,
+        min_rate_seconds: float = 2.0,
+        block_frames: int = 0,
+    ):
+        """
+        :param interval_seconds: Intervalle prévu entre deux vidages.
+        :param late_factor: Un vidage est en retard au-delà de `late_factor` intervalles.
+        :param min_rate_seconds: Durée minimale pour mesurer la fréquence effective.
+        :param block_frames: Trames livrées par callback du périphérique (pas de mesure).
+        """
+        self.nominal_rate = nominal_rate
+        self.interval = interval_seconds
+        self.late_factor = late_factor
+        self.min_rate_seconds = min_rate_seconds
+        self.block_frames = block_frames
+
+        self.late_drains = 0
+        self.max_delay = 0.0
+        self._first: Optional[float] = None
+        self._last: Optional[float] = None
+        self._samples_after_first = 0
+        # Moyenne et variance des intervalles (Welford)
+        self._count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def on_drain(self, sample_count: int, now: Optional[float] = None):
+        """
+        :param sample_count: Échantillons lus à ce vidage (à la fréquence du micro).
+        """
+        now = time.monotonic() if now is None else now
+        if self._first is None:
+            # Le premier vidage contient aussi l’attente d’ouverture (et le pré-enregistrement)
+            self._first = self._last = now
+            return
+
+        delta = now - self._last
+        self._last = now
+        self._samples_after_first += sample_count
+
+        self._count += 1
+        diff = delta - self._mean
+        self._mean += diff / self._count
+        self._m2 += diff * (delta - self._mean)
+
+        delay = delta - self.interval
+        self.max_delay = max(self.max_delay, delay)
+        if delta > self.interval * self.late_factor:
+            self.late_drains += 1
+
+    def finish(
+        self,
+        device_overflows: int = 0,
+        device_underflows: int = 0,
+        ring_overflows: int = 0,
+        dropped_samples: int = 0,
+    ) -> RecorderHealth:
+        span = (self._last - self._first) if self._first is not None else 0.0
+        measured = span >= self.min_rate_seconds
+        effective_rate = self._samples_after_first / span if measured else 0.0
+        rate_tolerance = (
+            self.block_frames / (span * self.nominal_rate) if measured else 0.0
+        )
+        jitter = math.sqrt(self._m2 / self._count) if self._count > 1 else 0.0
+
+        return RecorderHealth(
+            nominal_rate=self.nominal_rate,
+            duration_seconds=span,
+            effective_rate=effective_rate,
+            device_overflows=device_overflows,
+            device_underflows=device_underflows,
+            ring_overflows=ring_overflows,
+            dropped_samples=dropped_samples,
+            late_drains=self.late_drains,
+            drain_jitter_ms=jitter * 1000,
+            max_drain_delay_ms=max(0.0, self.max_delay) * 1000,
+            rate_tolerance=rate_tolerance,
+        )
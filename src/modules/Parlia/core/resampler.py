@@ -0,0 +1,70 @@
+# modules/parlia/core/resampler.py
+
+# Ré-échantillonnage polyphasé par blocs, pour convertir la capture vers 16 kHz
+# au fil de l’eau quand le périphérique ne sait pas enregistrer à 16 kHz.
+# Filtre passe-bas à fenêtre de Kaiser, décomposé en L phases ; chaque bloc
+# est traité d’un seul produit vectorisé, l’historique assure la continuité.
+
+from math import gcd
+
+import numpy as np
+
+
+class PolyphaseResampler:
+    def __init__(self, src_rate: int, dst_rate: int, taps_per_phase: int = 48):
+        """
+        :param taps_per_phase: Coefficients par phase (qualité du filtre / coût).
+        """
+        divisor = gcd(src_rate, dst_rate)
+        self.up = dst_rate // divisor
+        self.down = src_rate // divisor
+        self.taps = taps_per_phase
+
+        self._phases = self._design_filter()
+
+        # Historique initial nul : la première sortie dispose déjà de `taps` entrées
+        self._history = np.zeros(self.taps - 1, dtype=np.float32)
+        self._history_start = -(
+            self.taps - 1
+        )  # Index global du premier échantillon gardé
+        self._next_output = 0  # Index global de la prochaine sortie
+
+    def _design_filter(self) -> np.ndarray:
+        """
+        Coefficients rangés par phase : phases[p, k] = h[p + k * up].
+        """
+        length = self.taps * self.up
+        # Coupure sous la plus basse des deux fréquences de Nyquist (marge anti-repliement)
+        cutoff = 0.45 / max(self.up, self.down)
+        n = np.arange(length) - (length - 1) / 2
+        h = 2 * cutoff * np.sinc(2 * cutoff * n) * np.kaiser(length, 8.0)
+        h *= self.up / h.sum() * self.up  # Gain unitaire après insertion des zéros
+        return h.reshape(self.taps, self.up).T.astype(np.float32) / self.up
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """
+        Ré-échantillonne un bloc (int16 ou float) ; retourne des float32 à la même échelle.
+        Les blocs successifs s’enchaînent sans discontinuité.
+        """
+        data = np.concatenate((self._history, samples.astype(np.float32)))
+        available_end = self._history_start + len(data)  # Index global exclusif
+
+        # Sorties dont le dernier échantillon d’entrée nécessaire est disponible
+        last_output = (available_end * self.up - 1) // self.down
+        outputs = np.arange(self._next_output, last_output + 1, dtype=np.int64)
+
+        positions = outputs * self.down
+        input_index = positions // self.up - self._history_start
+        phase = positions % self.up
+
+        # Fenêtre de `taps` entrées par sortie, de la plus récente à la plus ancienne
+        window = input_index[:, None] - np.arange(self.taps)
+        result = np.einsum("ij,ij->i", data[window], self._phases[phase])
+
+        if len(outputs):
+            self._next_output = int(outputs[-1]) + 1
+        next_input = (self._next_output * self.down) // self.up
+        keep_from = next_input - (self.taps - 1) - self._history_start
+        self._history = data[keep_from:]
+        self._history_start += keep_from
+        return result.astype(np.float32, copy=False)
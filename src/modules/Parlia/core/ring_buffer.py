@@ -0,0 +1,123 @@
+# modules/parlia/core/ring_buffer.py
+
+# Tampon circulaire préalloué entre le callback audio (producteur) et le thread
+# qui vide la capture (consommateur). Sans verrou : chaque côté n’avance que sa
+# propre position, et ne la publie qu’après avoir copié les données.
+# Les positions sont des compteurs croissants ; l’index réel est pris modulo la capacité.
+
+import numpy as np
+
+# Positions et compteurs, rangés dans un petit tableau int64 : une sous-classe
+# peut le placer en mémoire partagée (voir shared_ring_buffer)
+WRITE_POS, READ_POS, OVERFLOWS, DROPPED_SAMPLES, UNDERFLOWS = range(5)
+STATE_FIELDS = 5
+
+
+class RingBuffer:
+    def __init__(self, capacity: int, dtype=np.int16):
+        """
+        :param capacity: Nombre d’échantillons gardés en attente au maximum.
+        """
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._state = np.zeros(STATE_FIELDS, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return int(self._state[WRITE_POS] - self._state[READ_POS])
+
+    @property
+    def free(self) -> int:
+        return self.capacity - len(self)
+
+    @property
+    def overflows(self) -> int:
+        """Écritures tronquées : le consommateur n’a pas suivi."""
+        return int(self._state[OVERFLOWS])
+
+    @property
+    def dropped_samples(self) -> int:
+        return int(self._state[DROPPED_SAMPLES])
+
+    @property
+    def underflows(self) -> int:
+        """Lectures sur un tampon vide."""
+        return int(self._state[UNDERFLOWS])
+
+    def write(self, samples: np.ndarray) -> int:
+        """
+        Côté producteur. Copie ce qui tient ; le surplus est compté comme perdu.
+        :return: Nombre d’échantillons écrits.
+        """
+        count = min(len(samples), self.free)
+        if count < len(samples):
+            self._state[OVERFLOWS] += 1
+            self._state[DROPPED_SAMPLES] += len(samples) - count
+
+        write_pos = int(self._state[WRITE_POS])
+        start = write_pos % self.capacity
+        first = min(count, self.capacity - start)
+        self._data[start : start + first] = samples[:first]
+        self._data[: count - first] = samples[first:count]
+
+        self._state[WRITE_POS] = write_pos + count
+        return count
+
+    def read(self, max_count: int | None = None) -> np.ndarray:
+        """
+        Côté consommateur. Retire et retourne (copie) tout ce qui est disponible,
+        ou au plus `max_count` échantillons.
+        """
+        count = len(self)
+        if max_count is not None:
+            count = min(count, max_count)
+        if count == 0:
+            self._state[UNDERFLOWS] += 1
+            return self._data[:0].copy()
+
+        read_pos = int(self._state[READ_POS])
+        start = read_pos % self.capacity
+        first = min(count, self.capacity - start)
+        out = np.concatenate(
+            (self._data[start : start + first], self._data[: count - first])
+        )
+
+        self._state[READ_POS] = read_pos + count
+        return out
+
+
+class HistoryBuffer:
+    """
+    Derniers `capacity` échantillons d’un flux, écrasés au fil de l’eau (pré-enregistrement).
+    Écrit par le callback audio uniquement ; lu par ce même callback au début d’une prise,
+    donc sans concurrence. Mémoire fixe, une copie par bloc : rien d’autre à payer.
+    """
+
+    def __init__(self, capacity: int, dtype=np.int16):
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=dtype)
+        self._write_pos = 0
+
+    def __len__(self) -> int:
+        return min(self._write_pos, self.capacity)
+
+    def write(self, samples: np.ndarray):
+        # Seule la fin d’un bloc plus long que l’historique compte
+        samples = samples[-self.capacity :]
+        count = len(samples)
+        start = self._write_pos % self.capacity
+        first = min(count, self.capacity - start)
+        self._data[start : start + first] = samples[:first]
+        self._data[: count - first] = samples[first:]
+        self._write_pos += count
+
+    def snapshot(self) -> np.ndarray:
+        """Copie de l’historique, du plus ancien au plus récent échantillon."""
+        count = len(self)
+        start = (self._write_pos - count) % self.capacity
+        first = min(count, self.capacity - start)
+        return np.concatenate(
+            (self._data[start : start + first], self._data[: count - first])
+        )
+
+    def clear(self):
+        self._write_pos = 0
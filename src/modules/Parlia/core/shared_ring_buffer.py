@@ -0,0 +1,77 @@
+# modules/parlia/core/shared_ring_buffer.py
+
+# Tampon circulaire de RingBuffer placé dans un bloc multiprocessing.shared_memory :
+# le processus de capture écrit, le processus Vølund lit directement le même bloc
+# (ni pipe ni sérialisation). Un seul producteur et un seul consommateur, comme RingBuffer.
+#
+# Disposition du bloc : état int64 (positions, compteurs) puis les échantillons.
+
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from modules.parlia.core.ring_buffer import STATE_FIELDS, RingBuffer
+
+# Champs ajoutés à l’état : signalés par le périphérique dans le processus de capture
+DEVICE_OVERFLOWS, DEVICE_UNDERFLOWS = STATE_FIELDS, STATE_FIELDS + 1
+SHARED_STATE_FIELDS = STATE_FIELDS + 2
+STATE_BYTES = SHARED_STATE_FIELDS * np.dtype(np.int64).itemsize
+
+
+class SharedRingBuffer(RingBuffer):
+    def __init__(self, memory: shared_memory.SharedMemory, capacity: int, owner: bool):
+        """
+        Utiliser create() (processus principal) ou attach() (processus de capture).
+        """
+        self.capacity = capacity
+        self._memory = memory
+        self._owner = owner
+        self._state = np.ndarray(
+            (SHARED_STATE_FIELDS,), dtype=np.int64, buffer=memory.buf
+        )
+        self._data = np.ndarray(
+            (capacity,), dtype=np.int16, buffer=memory.buf, offset=STATE_BYTES
+        )
+
+    @classmethod
+    def create(cls, capacity: int) -> "SharedRingBuffer":
+        size = STATE_BYTES + capacity * np.dtype(np.int16).itemsize
+        memory = shared_memory.SharedMemory(create=True, size=size)
+        ring = cls(memory, capacity, owner=True)
+        ring._state[:] = 0
+        return ring
+
+    @classmethod
+    def attach(cls, name: str, capacity: int) -> "SharedRingBuffer":
+        return cls(shared_memory.SharedMemory(name=name), capacity, owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    @property
+    def device_overflows(self) -> int:
+        return int(self._state[DEVICE_OVERFLOWS])
+
+    @property
+    def device_underflows(self) -> int:
+        return int(self._state[DEVICE_UNDERFLOWS])
+
+    def count_device_status(self, overflow: bool, underflow: bool):
+        """Côté producteur : statuts du callback PortAudio."""
+        if overflow:
+            self._state[DEVICE_OVERFLOWS] += 1
+        if underflow:
+            self._state[DEVICE_UNDERFLOWS] += 1
+
+    def reset(self):
+        """Remet positions et compteurs à zéro ; seulement quand le producteur est arrêté."""
+        self._state[:] = 0
+
+    def close(self):
+        """Détache le bloc ; le créateur le libère aussi."""
+        # Les vues NumPy doivent disparaître avant la fermeture du bloc
+        self._state = self._data = None
+        self._memory.close()
+        if self._owner:
+            self._memory.unlink()
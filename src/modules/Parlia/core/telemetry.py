@@ -0,0 +1,106 @@
+# modules/parlia/core/telemetry.py
+
+# Mesures du signal d’entrée pendant la capture, et canal de publication limité
+# en fréquence. Le thread de capture mesure chaque bloc (NumPy, sans boucle) ;
+# le canal fusionne les mesures et n’en laisse passer qu’une par intervalle,
+# pour que l’UI ne reçoive qu’une vingtaine de signaux par seconde.
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Callable, Generic, Optional, TypeVar
+
+import numpy as np
+
+SILENCE_DBFS = -90.0
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class InputLevels:
+    rms: float  # Pleine échelle = 1.0
+    peak: float
+    clipped_samples: int  # Échantillons à pleine échelle (saturation)
+    sample_count: int
+
+    @property
+    def rms_dbfs(self) -> float:
+        return 20 * math.log10(self.rms) if self.rms > 0 else SILENCE_DBFS
+
+    @property
+    def peak_dbfs(self) -> float:
+        return 20 * math.log10(self.peak) if self.peak > 0 else SILENCE_DBFS
+
+    def merge(self, other: "InputLevels") -> "InputLevels":
+        """Mesures des deux blocs réunis (RMS pondéré par le nombre d’échantillons)."""
+        count = self.sample_count + other.sample_count
+        if count == 0:
+            return self
+        energy = (
+            self.rms**2 * self.sample_count + other.rms**2 * other.sample_count
+        ) / count
+        return InputLevels(
+            rms=math.sqrt(energy),
+            peak=max(self.peak, other.peak),
+            clipped_samples=self.clipped_samples + other.clipped_samples,
+            sample_count=count,
+        )
+
+
+def measure_levels(samples: np.ndarray) -> InputLevels:
+    """
+    RMS, crête et saturation d’un bloc int16 ou float32 (pleine échelle ±1).
+    """
+    if len(samples) == 0:
+        return InputLevels(0.0, 0.0, 0, 0)
+
+    if samples.dtype == np.int16:
+        # Saturé : valeur extrême de l’entier, quel que soit le signe
+        clipped = np.count_nonzero((samples >= 32767) | (samples <= -32768))
+        scaled = samples.astype(np.float32) / 32768.0
+    else:
+        scaled = samples.astype(np.float32, copy=False)
+        clipped = np.count_nonzero(np.abs(scaled) >= 0.999)
+
+    return InputLevels(
+        rms=float(np.sqrt(np.mean(np.square(scaled)))),
+        peak=float(np.max(np.abs(scaled))),
+        clipped_samples=int(clipped),
+        sample_count=len(samples),
+    )
+
+
+class CoalescingChannel(Generic[T]):
+    """
+    Fusionne les valeurs publiées et en délivre au plus `max_rate_hz` par seconde.
+    Utilisé par un seul thread (le producteur), qui émet ce que publish() retourne.
+    """
+
+    def __init__(self, max_rate_hz: float, merge: Callable[[T, T], T]):
+        self.interval = 1.0 / max_rate_hz
+        self._merge = merge
+        self._pending: Optional[T] = None
+        self._last_delivery: Optional[float] = None
+
+    def publish(self, value: T, now: Optional[float] = None) -> Optional[T]:
+        """
+        :return: La valeur fusionnée si l’intervalle est écoulé, sinon None (gardée).
+        """
+        now = time.monotonic() if now is None else now
+        self._pending = (
+            value if self._pending is None else self._merge(self._pending, value)
+        )
+
+        if (
+            self._last_delivery is not None
+            and now - self._last_delivery < self.interval
+        ):
+            return None
+        self._last_delivery = now
+        return self.flush()
+
+    def flush(self) -> Optional[T]:
+        """Délivre ce qui reste en attente, sans tenir compte de l’intervalle."""
+        value, self._pending = self._pending, None
+        return value
@@ -0,0 +1,175 @@
+# modules/parlia/core/transcription_cache.py
+
+# Cache des textes transcrits, adressé par le contenu : la clé est l’empreinte
+# des échantillons, du modèle et des options de décodage. Une même prise
+# retranscrite avec le même modèle ne repasse pas par Whisper.
+#
+# LRU en mémoire, persisté en JSON (écriture atomique). Thread-safe : consulté
+# par le thread de transcription comme par le thread UI.
+# Les sauvegardes sont regroupées : le fichier est réécrit par une minuterie,
+# après `flush_delay` sans nouvel ajout, jamais sur le thread de transcription.
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+CACHE_FORMAT_VERSION = 1
+
+# Délai de regroupement des ajouts avant la sauvegarde sur disque
+FLUSH_DELAY_SECONDS = 2.0
+
+
+def cache_key(audio: np.ndarray, model_key: str, **options) -> str:
+    """
+    Empreinte SHA-256 d’un audio (dtype et échantillons), du modèle
+    et des options de décodage (les options None sont ignorées).
+    """
+    digest = hashlib.sha256()
+    samples = np.ascontiguousarray(audio)
+    digest.update(samples.dtype.str.encode())
+    digest.update(memoryview(samples).cast("B"))
+    digest.update(b"\0" + model_key.encode())
+
+    for name in sorted(options):
+        if options[name] is not None:
+            digest.update(f"\0{name}={options[name]}".encode())
+
+    return digest.hexdigest()
+
+
+class TranscriptionCache:
+    def __init__(
+        self,
+        path: Optional[Path],
+        max_entries: int,
+        flush_delay: float = FLUSH_DELAY_SECONDS,
+    ):
+        """
+        :param path: Fichier JSON de persistance (None : cache en mémoire seulement).
+        :param max_entries: Nombre de textes gardés, les moins récents sont évincés.
+        :param flush_delay: Attente après le dernier ajout avant d’écrire le fichier.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.flush_delay = flush_delay
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+        # Une seule écriture à la fois, hors du verrou des entrées
+        self._save_lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+
+        # Les ajouts en attente partent aussi à la fermeture normale de l’application
+        if path is not None:
+            atexit.register(self.flush)
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._ensure_loaded()
+            return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            self._ensure_loaded()
+            text = self._entries.get(key)
+            if text is None:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return text
+
+    def put(self, key: str, text: str):
+        with self._lock:
+            self._ensure_loaded()
+            self._entries[key] = text
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._mark_dirty()
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._loaded = True
+            self._mark_dirty()
+
+    def flush(self):
+        """
+        Écrit tout de suite les ajouts en attente (appelé aussi à la fermeture).
+        """
+        with self._save_lock:
+            with self._lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                if not self._dirty:
+                    return
+                self._dirty = False
+                entries = list(self._entries.items())
+
+            if not self._save(entries):
+                with self._lock:
+                    self._dirty = True
+
+    def _ensure_loaded(self):
+        """
+        Lecture paresseuse du fichier : rien n’est lu tant que le cache ne sert pas.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                content = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            print(f"[ERREUR] Cache de transcriptions illisible : {self.path}")
+            return
+
+        if content.get("version") != CACHE_FORMAT_VERSION:
+            return
+        # Les entrées sont écrites de la moins récente à la plus récente
+        for key, text in content.get("entries", []):
+            self._entries[key] = text
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _mark_dirty(self):
+        if self.path is None:
+            return
+        self._dirty = True
+
+        # Debounce : chaque ajout repousse la sauvegarde
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+        self._flush_timer = threading.Timer(self.flush_delay, self.flush)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _save(self, entries: list[tuple[str, str]]) -> bool:
+        content = {"version": CACHE_FORMAT_VERSION, "entries": entries}
+        tmp_path = self.path.with_suffix(".tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(content, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[ERREUR] Sauvegarde du cache de transcriptions échouée : {e}")
+            return False
+        return True
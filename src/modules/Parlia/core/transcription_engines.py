@@ -0,0 +1,363 @@
+# modules/parlia/core/transcription_engines.py
+
+# Moteurs de transcription interchangeables derrière whisper_manager.
+# Chaque moteur sait lister, charger, préchauffer et utiliser ses propres modèles ;
+# whisper_manager ne connaît que cette interface.
+#
+# - "whisper" : openai-whisper sur PyTorch (moteur historique), avec variantes int8
+#   quantifiées dynamiquement et mises en cache dans <dossier modèles>/quantized/
+# - "ctranslate2" : faster-whisper / CTranslate2, int8 sur CPU
+
+import os
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+import numpy as np
+
+from modules.parlia.core.audio_utils import WHISPER_SAMPLE_RATE
+
+# Étapes du chargement : (pourcentage, libellé) transmis au progress_callback
+PHASE_READING = (10, "Lecture du checkpoint")
+PHASE_BUILDING = (50, "Construction du modèle")
+PHASE_QUANTIZING = (65, "Quantification int8")
+PHASE_WARMUP = (80, "Préchauffage")
+PHASE_DONE = (100, "Prêt")
+
+BUILTIN_MODELS = ["tiny", "base", "small", "medium", "large"]
+
+# Suffixe désignant la variante quantifiée int8 d’un checkpoint ("medium.pt:int8").
+# ":" est interdit dans les noms de fichiers Windows : pas de collision possible.
+INT8_SUFFIX = ":int8"
+QUANTIZED_FOLDER = "quantized"
+
+ProgressCallback = Callable[[int, str], None]
+AudioInput = Union[str, np.ndarray]
+
+
+def report(progress_callback: Optional[ProgressCallback], phase: tuple[int, str]):
+    if progress_callback:
+        progress_callback(*phase)
+
+
+def has_quantized_layers(model: object) -> bool:
+    from torch.ao.nn.quantized.dynamic import Linear as DynamicLinear
+
+    return any(isinstance(m, DynamicLinear) for m in model.modules())
+
+
+def quantize_linear_layers(model: object) -> object:
+    """
+    Quantification dynamique int8 des couches Linear, y compris whisper.model.Linear.
+    quantize_dynamic compare le type exact des couches : sans entrée dédiée, la
+    sous-classe de Whisper serait ignorée et le modèle resterait en float32.
+    :raises RuntimeError: Aucune couche convertie.
+    """
+    import torch
+    from torch.ao.nn.quantized.dynamic import Linear as DynamicLinear
+    from torch.ao.quantization.quantization_mappings import (
+        get_default_dynamic_quant_module_mappings,
+    )
+    from whisper.model import Linear as WhisperLinear
+
+    class WhisperDynamicLinear(DynamicLinear):
+        @classmethod
+        def from_float(cls, mod):
+            # from_float n’accepte que nn.Linear : couche recopiée, mêmes paramètres
+            linear = torch.nn.Linear(
+                mod.in_features, mod.out_features, bias=mod.bias is not None
+            )
+            linear.weight = mod.weight
+            linear.bias = mod.bias
+            linear.qconfig = mod.qconfig
+            return DynamicLinear.from_float(linear)
+
+    mapping = {
+        **get_default_dynamic_quant_module_mappings(),
+        WhisperLinear: WhisperDynamicLinear,
+    }
+    quantized = torch.ao.quantization.quantize_dynamic(
+        model, {torch.nn.Linear, WhisperLinear}, dtype=torch.qint8, mapping=mapping
+    )
+
+    if not has_quantized_layers(quantized):
+        raise RuntimeError("Quantification int8 : aucune couche Linear convertie.")
+    return quantized
+
+
+class TranscriptionEngine(ABC):
+    """
+    Interface commune des moteurs. `model_ref` est soit un nom de modèle intégré,
+    soit un chemin absolu vers un modèle du dossier utilisateur.
+    Un moteur incomplet échoue dès sa construction, pas en pleine transcription.
+    """
+
+    name: str = ""
+    label: str = ""
+
+    @abstractmethod
+    def is_available(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def list_models(self, folder: str) -> list[str]:
+        """Modèles utilisables par ce moteur dans le dossier utilisateur."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(
+        self, model_ref: str, progress_callback: Optional[ProgressCallback] = None
+    ) -> object:
+        raise NotImplementedError
+
+    @abstractmethod
+    def transcribe(
+        self, model: object, audio: AudioInput, initial_prompt: Optional[str] = None
+    ) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load_audio(self, path: str) -> np.ndarray:
+        """Décode un fichier audio (tout format lu par le moteur) en float32 16 kHz."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def model_size_bytes(self, model: object) -> int:
+        """Empreinte mémoire estimée du modèle chargé (pour le cache LRU)."""
+        raise NotImplementedError
+
+    def warm_up(self, model: object):
+        """
+        Première inférence sur une seconde de silence : les initialisations paresseuses
+        sont payées ici plutôt qu’à la première dictée.
+        """
+        silence = np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32)
+        self.transcribe(model, silence)
+
+
+class WhisperTorchEngine(TranscriptionEngine):
+    name = "whisper"
+    label = "Whisper (PyTorch)"
+
+    def is_available(self) -> bool:
+        try:
+            import whisper  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def list_models(self, folder: str) -> list[str]:
+        # Chaque checkpoint est proposé en pleine précision et en variante int8
+        models = []
+        for f in sorted(os.listdir(folder)):
+            if f.endswith((".pt", ".bin")):
+                models += [f, f + INT8_SUFFIX]
+        return models
+
+    def load(
+        self, model_ref: str, progress_callback: Optional[ProgressCallback] = None
+    ) -> object:
+        import whisper
+
+        if model_ref.endswith(INT8_SUFFIX):
+            path = Path(model_ref[: -len(INT8_SUFFIX)])
+            return self._load_quantized(path, progress_callback)
+
+        # Modèle intégré : téléchargé/lu par Whisper directement
+        if model_ref in BUILTIN_MODELS:
+            report(progress_callback, PHASE_READING)
+            return whisper.load_model(model_ref)
+
+        return self._load_checkpoint_file(Path(model_ref), progress_callback)
+
+    @staticmethod
+    def quantized_path(path: Path) -> Path:
+        """Emplacement de la variante int8 en cache d’un checkpoint."""
+        return path.parent / QUANTIZED_FOLDER / f"{path.stem}.int8.pt"
+
+    def _load_quantized(
+        self, path: Path, progress_callback: Optional[ProgressCallback]
+    ) -> object:
+        """
+        Variante int8 d’un checkpoint : couches Linear quantifiées dynamiquement (CPU).
+        Produite une fois puis relue directement depuis le cache disque.
+        """
+        import torch
+
+        cached = self.quantized_path(path)
+        if cached.is_file():
+            report(progress_callback, PHASE_READING)
+            # Module complet picklé : les couches quantifiées n’ont pas de state_dict standard
+            model = torch.load(cached, map_location="cpu", weights_only=False)
+            if has_quantized_layers(model):
+                return model
+            # Cache écrit par une version qui ne convertissait aucune couche
+            print(f"[WARN] Variante int8 non quantifiée, reconstruite : {cached}")
+
+        # La quantification dynamique ne s’exécute que sur CPU
+        model = self._load_checkpoint_file(path, progress_callback, device="cpu")
+
+        report(progress_callback, PHASE_QUANTIZING)
+        quantized = quantize_linear_layers(model)
+
+        # Écriture atomique : un cache tronqué ne doit jamais être relu
+        cached.parent.mkdir(exist_ok=True)
+        tmp_path = cached.with_suffix(".tmp")
+        torch.save(quantized, tmp_path)
+        os.replace(tmp_path, cached)
+        print(f"[INFO] Variante int8 mise en cache : {cached}")
+
+        return quantized
+
+    def _load_checkpoint_file(
+        self,
+        path: Path,
+        progress_callback: Optional[ProgressCallback],
+        device: Optional[str] = None,
+    ) -> object:
+        """
+        Équivalent de whisper.load_model(path), découpé pour remonter les étapes.
+        """
+        import torch
+        import whisper
+        from whisper.model import ModelDimensions
+
+        if device is None:
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+
+        report(progress_callback, PHASE_READING)
+        with open(path, "rb") as fp:
+            checkpoint = torch.load(fp, map_location=device)
+
+        report(progress_callback, PHASE_BUILDING)
+        dims = ModelDimensions(**checkpoint["dims"])
+        model = whisper.Whisper(dims)
+        model.load_state_dict(checkpoint["model_state_dict"])
+        return model.to(device)
+
+    def transcribe(
+        self, model: object, audio: AudioInput, initial_prompt: Optional[str] = None
+    ) -> str:
+        result = model.transcribe(
+            audio,
+            initial_prompt=initial_prompt,
+            fp16=model.device.type != "cpu",
+        )
+
+        # Ajout d’un log pour vérification
+        print("[DEBUG] Résultat brut de Whisper :", result)
+
+        text = result.get("text", "")
+        return text.strip() if isinstance(text, str) else ""
+
+    def load_audio(self, path: str) -> np.ndarray:
+        import whisper
+
+        return whisper.load_audio(path, sr=WHISPER_SAMPLE_RATE)
+
+    def model_size_bytes(self, model: object) -> int:
+        # Poids et buffers : l’essentiel du RSS d’un modèle PyTorch
+        return sum(_tensor_bytes(value) for value in model.state_dict().values())
+
+
+def _tensor_bytes(value) -> int:
+    """
+    Taille d’une entrée de state_dict. Les couches quantifiées y rangent
+    des tuples (poids, biais) et des dtypes à côté des tenseurs.
+    """
+    if isinstance(value, (tuple, list)):
+        return sum(_tensor_bytes(item) for item in value)
+    if hasattr(value, "element_size"):
+        return value.numel() * value.element_size()
+    return 0
+
+
+class CTranslate2Engine(TranscriptionEngine):
+    """
+    faster-whisper (CTranslate2) en int8 sur CPU. Les modèles du dossier utilisateur
+    sont des répertoires convertis (contenant un model.bin) ; les noms intégrés
+    sont téléchargés déjà convertis.
+    """
+
+    name = "ctranslate2"
+    label = "CTranslate2 int8 (CPU)"
+
+    # Threads de calcul par modèle (0 : tous les cœurs). Fixé au chargement.
+    cpu_threads = 0
+
+    # Taille approximative en mémoire des modèles intégrés une fois quantifiés en int8
+    BUILTIN_SIZES_MB = {
+        "tiny": 45,
+        "base": 80,
+        "small": 260,
+        "medium": 800,
+        "large": 1600,
+    }
+
+    def is_available(self) -> bool:
+        try:
+            import faster_whisper  # noqa: F401
+        except ImportError:
+            return False
+        return True
+
+    def list_models(self, folder: str) -> list[str]:
+        return [
+            d for d in os.listdir(folder) if (Path(folder) / d / "model.bin").is_file()
+        ]
+
+    def load(
+        self, model_ref: str, progress_callback: Optional[ProgressCallback] = None
+    ) -> object:
+        from faster_whisper import WhisperModel
+
+        report(progress_callback, PHASE_READING)
+        report(progress_callback, PHASE_BUILDING)
+        model = WhisperModel(
+            model_ref,
+            device="cpu",
+            compute_type="int8",
+            cpu_threads=self.cpu_threads or os.cpu_count() or 0,
+        )
+        # WhisperModel ne garde pas son chemin : utile pour estimer sa taille
+        model.parlia_model_ref = model_ref
+        return model
+
+    def transcribe(
+        self, model: object, audio: AudioInput, initial_prompt: Optional[str] = None
+    ) -> str:
+        segments, info = model.transcribe(audio, initial_prompt=initial_prompt)
+        # Les segments sont générés paresseusement : le décodage a lieu ici
+        text = "".join(segment.text for segment in segments)
+        print(
+            f"[DEBUG] CTranslate2 : langue={info.language}, durée={info.duration:.1f}s"
+        )
+        return text.strip()
+
+    def load_audio(self, path: str) -> np.ndarray:
+        from faster_whisper.audio import decode_audio
+
+        return decode_audio(path, sampling_rate=WHISPER_SAMPLE_RATE)
+
+    def model_size_bytes(self, model: object) -> int:
+        model_ref = getattr(model, "parlia_model_ref", "")
+        weights = Path(model_ref) / "model.bin"
+        if weights.is_file():
+            return weights.stat().st_size
+
+        return self.BUILTIN_SIZES_MB.get(model_ref, 500) * 1024 * 1024
+
+
+ENGINES: dict[str, TranscriptionEngine] = {
+    engine.name: engine for engine in (WhisperTorchEngine(), CTranslate2Engine())
+}
+
+DEFAULT_ENGINE = WhisperTorchEngine.name
+
+
+def get_engine(name: str) -> TranscriptionEngine:
+    return ENGINES.get(name, ENGINES[DEFAULT_ENGINE])
+
+
+def available_engines() -> list[TranscriptionEngine]:
+    return [engine for engine in ENGINES.values() if engine.is_available()]
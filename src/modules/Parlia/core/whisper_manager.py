@@ -1,104 +1,255 @@
 # 🔄 Module singleton pour gérer le modèle Whisper dans Parlia
 
-# Ce fichier garantit qu’un seul modèle Whisper est chargé à la fois.
-# Toutes les opérations de transcription passent par ici.
-
+# Ce fichier garde un cache LRU de modèles Whisper résidents (borné en mémoire)
+# et un seul modèle actif à la fois. Toutes les opérations de transcription passent par ici ;
+# le travail réel est délégué au moteur choisi (voir transcription_engines.py).
+
+import gc
+import threading
+import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
+
+import numpy as np
+
+from modules.parlia.core.model_cache import ModelCache
+from modules.parlia.core.transcription_engines import (
+    BUILTIN_MODELS,
+    INT8_SUFFIX,
+    PHASE_DONE,
+    PHASE_WARMUP,
+    ProgressCallback,
+    TranscriptionEngine,
+    get_engine,
+)
+from modules.parlia.core.transcription_engines import report as _report
+from modules.parlia.services.parlia_data import (
+    get_engine_name,
+    get_model_cache_budget_mb,
+    get_model_folder_path,
+)
+from modules.parlia.services.parlia_state_manager import parlia_state
 
-import whisper  # Assure-toi d’avoir `openai-whisper` installé via `pip install -U openai-whisper`
 
-from modules.parlia.services.parlia_state_manager import parlia_state
+@dataclass
+class LoadedModel:
+    """Modèle résident : le moteur qui l’a chargé, l’objet modèle et sa taille."""
+
+    engine: TranscriptionEngine
+    model: object
+    size_bytes: int
+
 
-_current_model: Optional[whisper.Whisper] = None  # type: Optional[whisper.Whisper]
+_cache = ModelCache(
+    get_model_cache_budget_mb() * 1024 * 1024,
+    size_of=lambda loaded: loaded.size_bytes,
+)
+_cache_lock = threading.Lock()
 
+_current: Optional[LoadedModel] = None
+_current_key: Optional[str] = None
 
-def load_model(model_path: str):
+# Durée du dernier chargement réel (hors cache), lue par le ModelLoader
+_last_load_seconds: Optional[float] = None
+
+
+def load_model(
+    model_path: str,
+    progress_callback: Optional[ProgressCallback] = None,
+    engine_name: Optional[str] = None,
+) -> bool:
     """
-    Charge un modèle Whisper, soit depuis un nom intégré, soit depuis un fichier dans le dossier utilisateur.
+    Charge un modèle avec le moteur choisi dans les préférences, soit depuis un nom intégré,
+    soit depuis le dossier utilisateur (ou un chemin absolu), puis le préchauffe.
+    Appelable depuis un thread de travail : ne touche pas à l’état UI.
+    :param progress_callback: Reçoit (pourcentage, libellé) à chaque étape.
+    :param engine_name: Moteur à utiliser à la place de celui des préférences.
+    :return: True si le modèle est chargé et prêt.
     """
-    global _current_model
+    global _current, _current_key, _last_load_seconds
+
+    _last_load_seconds = None
+    engine = get_engine(engine_name or get_engine_name())
+    if not engine.is_available():
+        print(f"[ERREUR] Moteur de transcription indisponible : {engine.label}")
+        return False
+
+    key = get_model_key(model_path, engine_name=engine.name)
+    if key is None:
+        return False
+    model_ref = key.split(":", 1)[1]
+
+    with _cache_lock:
+        cached = _cache.get(key)
+    if cached is not None:
+        # Modèle déjà résident : bascule instantanée
+        print(f"[INFO] Modèle déjà en cache, activation : {model_path}")
+        _current, _current_key = cached, key
+        _report(progress_callback, PHASE_DONE)
+        return True
+
+    print(f"[INFO] Chargement via {engine.label} : {model_ref}")
+    start = time.monotonic()
+    model = engine.load(model_ref, progress_callback)
+    load_seconds = time.monotonic() - start
+
+    _report(progress_callback, PHASE_WARMUP)
+    engine.warm_up(model)
+    loaded = LoadedModel(engine, model, engine.model_size_bytes(model))
+
+    with _cache_lock:
+        _cache.budget_bytes = get_model_cache_budget_mb() * 1024 * 1024
+        evicted = _cache.put(key, loaded)
+    _current, _current_key = loaded, key
+    _last_load_seconds = load_seconds
+
+    if evicted:
+        print(f"[INFO] Modèles évincés du cache : {evicted}")
+        _release_memory()
+
+    _report(progress_callback, PHASE_DONE)
+    print(f"[INFO] ✅ Modèle chargé avec succès : {model_path}")
+    return True
 
-    if _current_model is not None:
-        print("[INFO] Un modèle est déjà chargé. Ignorer la demande.")
-        return
 
-    # Cas 1 : modèle intégré (fourni par Whisper directement)
-    if model_path in ["tiny", "base", "small", "medium", "large"]:
-        print(f"[INFO] Chargement du modèle Whisper intégré : {model_path}")
-        _current_model = whisper.load_model(model_path)
+def get_model_key(model_path: str, engine_name: Optional[str] = None) -> Optional[str]:
+    """
+    Identité d’un modèle pour le moteur choisi : "<moteur>:<référence>".
+    Sert de clé au cache et aux mesures de performance.
+    """
+    model_ref = _resolve_model_ref(model_path)
+    if model_ref is None:
+        return None
+    return f"{get_engine(engine_name or get_engine_name()).name}:{model_ref}"
+
+
+def get_last_load_seconds() -> Optional[float]:
+    """
+    Durée du dernier chargement (None s’il venait du cache ou a échoué).
+    """
+    return _last_load_seconds
+
 
-    else:
-        # Cas 2 : modèle custom => récupérer le dossier sélectionné par l'utilisateur
-        from modules.parlia.services.parlia_data import get_model_folder_path
+def _resolve_model_ref(model_path: str) -> Optional[str]:
+    """
+    Référence d’un modèle pour son moteur : son nom pour un modèle intégré,
+    sinon le chemin absolu dans le dossier utilisateur.
+    Le suffixe d’une variante (":int8") est conservé.
+    """
+    if model_path.endswith(INT8_SUFFIX):
+        base_ref = _resolve_model_ref(model_path[: -len(INT8_SUFFIX)])
+        return base_ref + INT8_SUFFIX if base_ref else None
 
-        model_dir = get_model_folder_path()
+    if model_path in BUILTIN_MODELS:
+        return model_path
 
-        if not model_dir:
-            print(
-                "[ERREUR] Aucun dossier modèle défini dans les préférences utilisateur."
-            )
-            return
+    if Path(model_path).is_absolute() and Path(model_path).exists():
+        return str(Path(model_path).resolve())
 
-        full_path = Path(model_dir) / model_path
+    model_dir = get_model_folder_path()
 
-        if full_path.exists():
-            print(
-                f"[INFO] Chargement du modèle Whisper depuis fichier : {full_path.resolve()}"
-            )
-            _current_model = whisper.load_model(str(full_path))
-        else:
-            print(f"[ERREUR] Le modèle spécifié est introuvable : {full_path}")
-            return
+    if not model_dir:
+        print("[ERREUR] Aucun dossier modèle défini dans les préférences utilisateur.")
+        return None
 
-    print(f"[INFO] ✅ Modèle chargé avec succès : {model_path}")
-    parlia_state.set_whisper_ready(True)
+    full_path = Path(model_dir) / model_path
+
+    if not full_path.exists():
+        print(f"[ERREUR] Le modèle spécifié est introuvable : {full_path}")
+        return None
+
+    return str(full_path.resolve())
+
+
+def _release_memory():
+    gc.collect()
+    try:
+        import torch
+
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except ImportError:
+        pass
 
 
 def unload_model():
     """
-    Décharge le modèle actuellement chargé.
+    Désactive le modèle courant. Il reste dans le cache pour une réactivation
+    instantanée ; clear_model_cache() libère réellement la mémoire.
     """
-    global _current_model
+    global _current, _current_key
 
-    if _current_model is None:
+    if _current is None:
         print("[INFO] Aucun modèle à décharger.")
         return
 
     print(f"[INFO] Déchargement du modèle.")
-    _current_model = None
+    _current, _current_key = None, None
     parlia_state.set_whisper_ready(False)
 
 
+def clear_model_cache():
+    """
+    Vide le cache : tous les modèles résidents, sauf l’actif, sont libérés.
+    """
+    with _cache_lock:
+        for key in _cache.keys():
+            if key != _current_key:
+                _cache.remove(key)
+    _release_memory()
+
+
+def get_cache_stats() -> dict:
+    """
+    Compteurs du cache : hits, misses, evictions, modèles résidents et mémoire.
+    """
+    with _cache_lock:
+        return _cache.stats()
+
+
 def is_model_loaded() -> bool:
     """
     Retourne True si un modèle est actuellement chargé.
     """
-    return _current_model is not None
+    return _current is not None
+
+
+def get_current_model_key() -> Optional[str]:
+    """
+    Retourne l’identité du modèle actif : "<moteur>:<nom intégré ou chemin absolu>".
+    """
+    return _current_key
 
 
 def get_model():
     """
     Retourne l’instance du modèle actuel.
     """
-    return _current_model
+    return _current.model if _current else None
 
 
-def transcribe(audio_path: str) -> str:
+def load_audio(path: str) -> np.ndarray:
     """
-    Transcrit un fichier audio en texte via le modèle Whisper chargé.
+    Décode un fichier audio en float32 16 kHz avec le moteur du modèle actif.
     """
-    if _current_model is None:
+    loaded = _current
+    if loaded is None:
         raise RuntimeError("Aucun modèle Whisper n'est chargé.")
+    return loaded.engine.load_audio(path)
 
-    print(f"[INFO] Lancement de la transcription réelle via Whisper.")
-    result = _current_model.transcribe(audio_path)
 
-    # Ajout d’un log pour vérification
-    print("[DEBUG] Résultat brut de Whisper :", result)
+def transcribe(
+    audio: Union[str, np.ndarray], initial_prompt: Optional[str] = None
+) -> str:
+    """
+    Transcrit un fichier audio (chemin) ou un tableau float32 16 kHz en texte
+    via le modèle Whisper chargé.
+    :param initial_prompt: Texte précédent, pour garder le contexte entre segments.
+    """
+    loaded = _current
+    if loaded is None:
+        raise RuntimeError("Aucun modèle Whisper n'est chargé.")
 
-    text = result.get("text", "")
-    if isinstance(text, str):
-        return text.strip()
-    else:
-        return ""
+    print(f"[INFO] Lancement de la transcription réelle via {loaded.engine.label}.")
+    return loaded.engine.transcribe(loaded.model, audio, initial_prompt=initial_prompt)
@@ -0,0 +1,175 @@
+# modules/parlia/db/history_db.py
+
+# Historique des transcriptions dans une base SQLite locale (mode WAL).
+# Le texte est indexé en plein texte (FTS5, accents ignorés, recherche par préfixe) :
+# une recherche parmi des milliers de dictées reste instantanée.
+#
+# Les pages sont lues par clé (id < dernier id affiché) plutôt que par OFFSET :
+# charger la page suivante coûte autant que la première, même loin dans l’historique.
+
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS transcriptions (
+    id INTEGER PRIMARY KEY,
+    created_at TEXT NOT NULL,
+    text TEXT NOT NULL,
+    audio_seconds REAL NOT NULL DEFAULT 0,
+    decode_seconds REAL NOT NULL DEFAULT 0,
+    latency_seconds REAL NOT NULL DEFAULT 0,
+    silence_removed_seconds REAL NOT NULL DEFAULT 0,
+    model TEXT NOT NULL DEFAULT '',
+    audio_path TEXT
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS transcriptions_fts USING fts5(
+    text,
+    content='transcriptions',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS transcriptions_ai AFTER INSERT ON transcriptions BEGIN
+    INSERT INTO transcriptions_fts (rowid, text) VALUES (new.id, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS transcriptions_ad AFTER DELETE ON transcriptions BEGIN
+    INSERT INTO transcriptions_fts (transcriptions_fts, rowid, text)
+    VALUES ('delete', old.id, old.text);
+END;
+CREATE TRIGGER IF NOT EXISTS transcriptions_au AFTER UPDATE ON transcriptions BEGIN
+    INSERT INTO transcriptions_fts (transcriptions_fts, rowid, text)
+    VALUES ('delete', old.id, old.text);
+    INSERT INTO transcriptions_fts (rowid, text) VALUES (new.id, new.text);
+END;
+"""
+
+COLUMNS = (
+    "id, created_at, text, audio_seconds, decode_seconds, "
+    "latency_seconds, silence_removed_seconds, model, audio_path"
+)
+
+
+@dataclass(frozen=True)
+class HistoryEntry:
+    id: int
+    created_at: str
+    text: str
+    audio_seconds: float
+    decode_seconds: float
+    latency_seconds: float
+    silence_removed_seconds: float
+    model: str
+    audio_path: Optional[str]
+
+
+def fts_query(search: str) -> str:
+    """
+    Requête FTS5 à partir de la saisie : chaque mot doit apparaître, en préfixe
+    ("transcri" trouve "transcription"). La ponctuation est ignorée, pas interprétée.
+    """
+    words = re.findall(r"\w+", search)
+    return " ".join(f'"{word}"*' for word in words)
+
+
+class TranscriptionHistory:
+    """
+    Base ouverte au premier usage (aucun accès disque à l’import).
+    Thread-safe : une connexion protégée par un verrou.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+
+    def add(
+        self,
+        text: str,
+        audio_seconds: float = 0.0,
+        decode_seconds: float = 0.0,
+        latency_seconds: float = 0.0,
+        silence_removed_seconds: float = 0.0,
+        model: str = "",
+        audio_path: Optional[str] = None,
+    ) -> int:
+        """
+        Enregistre une transcription terminée.
+        :return: Identifiant de l’entrée.
+        """
+        with self._lock:
+            cursor = self._db().execute(
+                "INSERT INTO transcriptions (created_at, text, audio_seconds, "
+                "decode_seconds, latency_seconds, silence_removed_seconds, model, "
+                "audio_path) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    time.strftime("%Y-%m-%d %H:%M:%S"),
+                    text,
+                    round(audio_seconds, 3),
+                    round(decode_seconds, 3),
+                    round(latency_seconds, 3),
+                    round(silence_removed_seconds, 3),
+                    model,
+                    audio_path,
+                ),
+            )
+            return cursor.lastrowid
+
+    def search(
+        self, search: str = "", before_id: Optional[int] = None, limit: int = 50
+    ) -> list[HistoryEntry]:
+        """
+        Une page d’entrées, des plus récentes aux plus anciennes.
+        :param search: Mots recherchés (vide : tout l’historique).
+        :param before_id: Id de la dernière entrée de la page précédente.
+        """
+        query = fts_query(search)
+        conditions, params = [], []
+        if query:
+            conditions.append(
+                "id IN (SELECT rowid FROM transcriptions_fts "
+                "WHERE transcriptions_fts MATCH ?)"
+            )
+            params.append(query)
+        if before_id is not None:
+            conditions.append("id < ?")
+            params.append(before_id)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        sql = f"SELECT {COLUMNS} FROM transcriptions {where} ORDER BY id DESC LIMIT ?"
+        with self._lock:
+            rows = self._db().execute(sql, (*params, limit)).fetchall()
+        return [HistoryEntry(*row) for row in rows]
+
+    def count(self, search: str = "") -> int:
+        """
+        Nombre d’entrées correspondant à la recherche.
+        """
+        query = fts_query(search)
+        if query:
+            sql = "SELECT COUNT(*) FROM transcriptions_fts WHERE transcriptions_fts MATCH ?"
+            params = (query,)
+        else:
+            sql, params = "SELECT COUNT(*) FROM transcriptions", ()
+        with self._lock:
+            return self._db().execute(sql, params).fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _db(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.executescript(SCHEMA)
+        return self._connection
@@ -1,59 +1,317 @@
 # 🎙️ AudioService - Service d’enregistrement audio pour Vølund / Parlia
 
+import json
 import os
 
 # import threading
 import time
-import wave
 from pathlib import Path
+from typing import Optional
 
+import numpy as np
 from PySide6.QtCore import QObject, QThread, Signal
 
+from modules.parlia.config import config
+from modules.parlia.core.audio_buffer import AudioBuffer
+from modules.parlia.core.audio_utils import WHISPER_SAMPLE_RATE, find_quiet_split
+from modules.parlia.core.capture_process import CaptureProcess
+from modules.parlia.core.device_caps import CANDIDATE_RATES, DeviceCapabilities
+from modules.parlia.core.disk_audio import (
+    DiskAudioBuffer,
+    encode_archive,
+    recover_partial_recordings,
+)
+from modules.parlia.core.endpointing import EndpointDetector
+from modules.parlia.core.recorder_health import HealthMonitor, RecorderHealth
+from modules.parlia.core.resampler import PolyphaseResampler
+from modules.parlia.core.ring_buffer import HistoryBuffer, RingBuffer
+from modules.parlia.core.telemetry import CoalescingChannel, InputLevels, measure_levels
+from modules.parlia.services.parlia_data import (
+    get_archive_audio,
+    get_archive_format,
+    get_device_caps,
+    get_disk_recording,
+    set_device_caps,
+)
+
 try:
     import pyaudio
 except ImportError:
     pyaudio = None
 
+SAMPLE_RATE = 44100  # Fréquence de repli si le périphérique n’a pas pu être sondé
+CHUNK_SIZE = 1024
+
 
 class AudioRecorder(QObject):
     finished = Signal()
+    take_ready = Signal(int, object)  # (take_id, AudioBuffer)
+    # Fin d’énoncé ou durée max atteinte, sans appui sur stop
+    auto_stopped = Signal(int)
     update_time = Signal(float)
+    levels_changed = Signal(object)  # InputLevels fusionnés
+    health_ready = Signal(int, object)  # (take_id, RecorderHealth)
 
-    def __init__(self, service):
+    def __init__(
+        self,
+        service,
+        take_id: int,
+        capture_rate: int = SAMPLE_RATE,
+        segment_sink=None,
+        auto_stop_silence: float = 0.0,
+    ):
+        """
+        :param take_id: Identifiant de la prise (tampon et fichier d’archive propres).
+        :param capture_rate: Fréquence d’ouverture du micro ; la prise est stockée à 16 kHz.
+        :param segment_sink: Callable recevant, en mode continu, chaque segment terminé
+            (float32 16 kHz) pendant l’enregistrement, puis None à la fin de la prise.
+        :param auto_stop_silence: Silence final (secondes) qui termine la prise ; 0 : jamais.
+        """
         super().__init__()
         self.service = service
-        self.frames = []
+        self.take_id = take_id
+        self.buffer = service.create_take_buffer(take_id)
+        self._set_capture_rate(capture_rate)
         self._running = True
+        self._segment_sink = segment_sink
+        self._segment_offset = 0  # Premier échantillon pas encore envoyé
+        # Avec le micro armé : l’historique est recopié par le callback avant le premier bloc
+        self.needs_preroll = service.preroll is not None
+        self._process_capture = False  # Micro ouvert par le processus de capture
+        # Flux PortAudio propre à la prise : ouvert et fermé par ce thread uniquement
+        self._stream = None
+        self._health: Optional[HealthMonitor] = None  # Créé une fois la source ouverte
+        self.endpoint = None
+        if auto_stop_silence > 0:
+            self.endpoint = EndpointDetector(
+                WHISPER_SAMPLE_RATE,
+                auto_stop_silence,
+                min_speech_seconds=config.endpointing.min_speech_seconds,
+                frame_ms=config.endpointing.frame_ms,
+                energy_ratio=config.endpointing.energy_ratio,
+            )
+
+        # Chrono et niveaux : une émission par intervalle, quelle que soit la cadence de vidage
+        self._telemetry = CoalescingChannel(
+            config.capture.telemetry_rate_hz, InputLevels.merge
+        )
+
+        self.device_overflows = 0  # Signalés par le périphérique (statut du callback)
+        self.device_underflows = 0
+
+    @property
+    def overflows(self) -> int:
+        return self.device_overflows + self.ring.overflows
+
+    @property
+    def underflows(self) -> int:
+        return self.device_underflows + self.ring.underflows
+
+    def _set_capture_rate(self, capture_rate: int):
+        self.capture_rate = capture_rate
+        # Rempli par le callback PortAudio (fréquence du micro), vidé en bloc par run()
+        self.ring = RingBuffer(int(config.capture.ring_seconds * capture_rate))
+        # Sans 16 kHz natif, conversion bloc par bloc pendant la capture
+        self.resampler = (
+            None
+            if capture_rate == WHISPER_SAMPLE_RATE
+            else PolyphaseResampler(capture_rate, WHISPER_SAMPLE_RATE)
+        )
 
     def stop(self):
         self._running = False
 
-    def run(self):
-        import time
+    def _flush_segment(self, final: bool = False):
+        """
+        Envoie au segment_sink l’audio accumulé depuis le dernier segment,
+        en coupant sur un silence dès que la durée d’un segment est atteinte.
+        Avec `final=True`, envoie toute la fin de la prise.
+        """
+        pending_count = len(self.buffer) - self._segment_offset
+        sample_rate = self.buffer.sample_rate
+        segment_samples = int(config.streaming.segment_seconds * sample_rate)
+
+        if not final and pending_count < segment_samples:
+            return
 
+        if final:
+            cut = pending_count
+        else:
+            pending = self.buffer.samples(self._segment_offset)
+            cut = find_quiet_split(
+                pending, sample_rate, config.streaming.split_search_seconds
+            )
+
+        if cut > 0:
+            end = self._segment_offset + cut
+            self._segment_sink(self.buffer.to_whisper_input(self._segment_offset, end))
+        self._segment_offset += cut
+
+    def capture(self, samples: np.ndarray, status: int):
+        """
+        Thread audio : copie dans le tampon circulaire, rien d’autre.
+        """
+        if status & pyaudio.paInputOverflow:
+            self.device_overflows += 1
+        if status & pyaudio.paInputUnderflow:
+            self.device_underflows += 1
+        self.ring.write(samples)
+
+    def _on_audio(self, in_data, frame_count, time_info, status):
+        """Callback PortAudio du flux propre à la prise (micro non armé)."""
+        self.capture(np.frombuffer(in_data, dtype=np.int16), status)
+        return None, pyaudio.paContinue
+
+    def _drain(self) -> np.ndarray:
+        """
+        Vide le tampon circulaire en un seul bloc dans le tampon de la prise.
+        :return: Le bloc ajouté (int16 16 kHz).
+        """
+        samples = self.ring.read()
+        if self._health is not None:
+            self._health.on_drain(len(samples))
+        if len(samples):
+            self._publish_levels(measure_levels(samples))
+        if len(samples) and self.resampler:
+            resampled = np.rint(self.resampler.process(samples))
+            samples = np.clip(resampled, -32768, 32767).astype(np.int16)
+        if len(samples):
+            self.buffer.append(samples)
+        return samples
+
+    def _publish_levels(self, levels: InputLevels):
+        """
+        Mesures du bloc brut (avant rééchantillonnage, pour voir la vraie saturation),
+        transmises à l’UI au rythme du canal.
+        """
+        ready = self._telemetry.publish(levels)
+        if ready is not None:
+            self.levels_changed.emit(ready)
+            self.update_time.emit(time.monotonic() - self.service.start_time)
+
+    def _open_stream(self):
         audio = self.service.audio
-        stream = audio.open(
-            format=audio.get_format_from_width(2),
+        return audio.open(
+            format=pyaudio.paInt16,
             channels=1,
-            rate=44100,
+            rate=self.capture_rate,
             input=True,
-            frames_per_buffer=1024,
+            frames_per_buffer=CHUNK_SIZE,
+            stream_callback=self._on_audio,
         )
-        self.service.stream = stream
+
+    def _start_capture(self):
+        """
+        Branche la prise sur une source : flux armé (pré-enregistrement),
+        processus de capture, ou flux PortAudio propre à la prise.
+        """
+        if self.needs_preroll:
+            # Flux déjà ouvert : la prise commence par les dernières secondes entendues
+            self.service.attach_recorder(self)
+            return
+
+        capture_process = self.service.capture_process
+        if capture_process is not None:
+            try:
+                self.ring = capture_process.begin(self.capture_rate, CHUNK_SIZE)
+                self._process_capture = True
+                return
+            except OSError as e:
+                print(
+                    f"[WARN] Capture hors processus impossible, repli sur un thread : {e}"
+                )
+
+        try:
+            stream = self._open_stream()
+        except OSError as e:
+            # Table périmée (autre micro, pilote changé) : on resonde à la prochaine prise
+            print(f"[WARN] Ouverture à {self.capture_rate} Hz refusée : {e}")
+            self.service.forget_device_caps()
+            self._set_capture_rate(self.service.default_device_rate())
+            stream = self._open_stream()
+        self._stream = self.service.stream = stream
+
+    def _stop_capture(self):
+        """
+        Arrête la source, toujours depuis le thread de la prise : stop_recording()
+        ne fait que terminer la boucle, le flux n’est jamais fermé par deux threads.
+        """
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.stop_stream()
+            stream.close()
+            if self.service.stream is stream:
+                self.service.stream = None
+
+        self.service.detach_recorder(self)
+        if self._process_capture and not self.service.capture_process.end():
+            print("[WARN] Le processus de capture n’a pas confirmé l’arrêt.")
+
+    def run(self):
+        self._start_capture()
+        source = "processus dédié" if self._process_capture else "thread"
+        print(f"[INFO] Capture à {self.capture_rate} Hz ({source}).")
         self.service.start_time = time.monotonic()
         print("Enregistrement démarré...")
 
-        while (
-            self._running
-            and (time.monotonic() - self.service.start_time) < self.service.max_duration
-        ):
-            data = stream.read(1024)
-            self.frames.append(data)
-            elapsed = time.monotonic() - self.service.start_time
-            self.update_time.emit(elapsed)
-
-        self.service._save_audio(self.frames)
-        print("Enregistrement terminé.")
+        # Un vidage (et un signal) par intervalle, au lieu d’un par bloc de 1024
+        interval = config.capture.drain_interval_ms / 1000
+        self._health = HealthMonitor(
+            self.capture_rate,
+            interval,
+            config.capture.late_drain_factor,
+            block_frames=CHUNK_SIZE,
+        )
+        while self._running and not self.buffer.is_full:
+            time.sleep(interval)
+            samples = self._drain()
+
+            if self._segment_sink:
+                self._flush_segment()
+
+            if self.endpoint and len(samples) and self.endpoint.process(samples):
+                elapsed = time.monotonic() - self.service.start_time
+                print(f"[INFO] Fin d’énoncé détectée après {elapsed:.1f}s.")
+                break
+
+        if self._running:
+            # Arrêt sans appui sur stop : l’UI enchaîne comme si l’utilisateur avait arrêté
+            self._running = False
+            self.auto_stopped.emit(self.take_id)
+
+        self._stop_capture()
+        # Le vidage final suit l’arrêt du flux : il ne compte pas dans la régularité
+        monitor, self._health = self._health, None
+        # Ce que le callback a écrit avant l’arrêt du flux (un tampon vide ici n’est pas un sous-débit)
+        if len(self.ring):
+            self._drain()
+        if self._process_capture:
+            # Statuts du callback, comptés dans le processus de capture
+            self.device_overflows = self.ring.device_overflows
+            self.device_underflows = self.ring.device_underflows
+        self.service.overflow_count += self.overflows
+        self.service.underflow_count += self.underflows
+
+        if self._segment_sink:
+            # Le reste de la prise puis la fin de flux, avant l’archivage éventuel
+            self._flush_segment(final=True)
+            self._segment_sink(None)
+
+        health = monitor.finish(
+            device_overflows=self.device_overflows,
+            device_underflows=self.device_underflows,
+            ring_overflows=self.ring.overflows,
+            dropped_samples=self.ring.dropped_samples,
+        )
+        self.service._finalize_take(self.take_id, self.buffer, health)
+
+        if health.is_degraded(config.capture.max_rate_error):
+            print(f"[WARN] Prise {self.take_id} dégradée : {health.to_dict()}")
+        if self._process_capture:
+            self.service.capture_process.release()
+        print(f"Enregistrement terminé (prise {self.take_id}).")
+        self.health_ready.emit(self.take_id, health)
+        self.take_ready.emit(self.take_id, self.buffer)
         self.finished.emit()
 
 
@@ -64,23 +322,68 @@ class AudioService:
         :param max_duration: Durée maximale de l’enregistrement en secondes.
         """
         self.max_duration = max_duration
-        self.output_path = Path("temp_audio") / "current_record.wav"
+        self.output_dir = Path("temp_audio")
+        self.output_path = self.output_dir / "current_record.wav"
         self.is_recording = False
         self.start_time = None
         self.audio = pyaudio.PyAudio() if pyaudio else None
         self.stream = None
+        self.last_buffer: Optional[AudioBuffer] = None
+        self.last_health: Optional[RecorderHealth] = None
+        # Fichier audio archivé de chaque prise, repris par l’historique des transcriptions
+        self._take_audio_paths: dict[int, Path] = {}
+        self._next_take_id = 1
+        # Cumuls sur toutes les prises, lus par le gouverneur CPU
+        self.overflow_count = 0
+        self.underflow_count = 0
+        self._thread_priority = QThread.Priority.HighPriority
+        self.device_caps = DeviceCapabilities(get_device_caps())
+        # Micro armé en continu (optionnel) : historique des dernières secondes
+        self.preroll: Optional[HistoryBuffer] = None
+        self._armed_stream = None
+        self._armed_rate = None
+        self._recorder: Optional[AudioRecorder] = None
+        # Capture dans un processus séparé (optionnel), démarré une fois pour toutes les prises
+        self.capture_process: Optional[CaptureProcess] = None
+        self._limited = True  # Durée max fixée pour la prise en cours
         self._thread = None
         self._worker = None
 
         os.makedirs(self.output_path.parent, exist_ok=True)
+        for path in recover_partial_recordings(self.output_dir):
+            print(f"[WARN] Prise interrompue récupérée : {path}")
 
-    def start_recording(self):
+    def start_recording(
+        self, max_duration=None, segment_sink=None, take_id=None, auto_stop_silence=0.0
+    ) -> int:
+        """
+        Démarre l’enregistrement d’une nouvelle prise dans un QThread.
+        :param max_duration: Durée maximale en secondes (taille du tampon préalloué).
+        :param segment_sink: Optionnel, reçoit les segments au fil de l’eau (mode continu).
+        :param take_id: Identifiant de la prise (par défaut, un compteur interne).
+        :param auto_stop_silence: Silence final (secondes) qui arrête la prise ; 0 : jamais.
+        :return: L’identifiant de la prise.
+        """
         if self.is_recording:
             raise RuntimeError("Enregistrement déjà en cours.")
 
+        if max_duration:
+            self.max_duration = max_duration
+        self._limited = bool(max_duration)
+
+        if take_id is None:
+            take_id = self._next_take_id
+        self._next_take_id = max(self._next_take_id, take_id) + 1
+
         self.is_recording = True
         self._thread = QThread()
-        self._worker = AudioRecorder(self)
+        self._worker = AudioRecorder(
+            self,
+            take_id,
+            self._negotiate_capture_rate(),
+            segment_sink=segment_sink,
+            auto_stop_silence=auto_stop_silence,
+        )
         self._worker.moveToThread(self._thread)
 
         self._thread.started.connect(self._worker.run)
@@ -88,27 +391,203 @@ class AudioService:
         self._worker.finished.connect(self._worker.deleteLater)
         self._thread.finished.connect(self._thread.deleteLater)
 
-        self._thread.start()
+        self._thread.start(self._thread_priority)
+        return take_id
+
+    def set_preroll_enabled(self, enabled: bool):
+        """
+        Arme (ou désarme) le micro en dehors des prises : un flux reste ouvert
+        et garde les `preroll_seconds` dernières secondes, ajoutées au début de la prise suivante.
+        """
+        if self.is_recording:
+            raise RuntimeError("Enregistrement en cours.")
+        if enabled == (self._armed_stream is not None) or self.audio is None:
+            return
+
+        if not enabled:
+            self._armed_stream.stop_stream()
+            self._armed_stream.close()
+            self._armed_stream = None
+            self.preroll = None
+            print("[INFO] Micro désarmé.")
+            return
+
+        rate = self._negotiate_capture_rate()
+        preroll_seconds = min(
+            config.capture.preroll_seconds, config.capture.ring_seconds
+        )
+        self.preroll = HistoryBuffer(int(preroll_seconds * rate))
+        try:
+            self._armed_stream = self.audio.open(
+                format=pyaudio.paInt16,
+                channels=1,
+                rate=rate,
+                input=True,
+                frames_per_buffer=CHUNK_SIZE,
+                stream_callback=self._on_armed_audio,
+            )
+        except OSError as e:
+            print(f"[WARN] Impossible d’armer le micro à {rate} Hz : {e}")
+            self.preroll = None
+            return
+        self._armed_rate = rate
+        print(
+            f"[INFO] Micro armé à {rate} Hz ({preroll_seconds:.1f}s de pré-enregistrement)."
+        )
+
+    def set_capture_process_enabled(self, enabled: bool):
+        """
+        Démarre (ou arrête) le processus de capture. Les prises suivantes y ouvrent
+        le micro, hors du GIL de Vølund, sauf si le micro est armé (pré-enregistrement).
+        """
+        if self.is_recording:
+            raise RuntimeError("Enregistrement en cours.")
+        if enabled == (self.capture_process is not None) or self.audio is None:
+            return
+
+        if not enabled:
+            self.capture_process.shutdown()
+            self.capture_process = None
+            print("[INFO] Processus de capture arrêté.")
+            return
+
+        # Dimensionné pour la plus haute fréquence candidate
+        capacity = int(config.capture.ring_seconds * max(CANDIDATE_RATES))
+        self.capture_process = CaptureProcess(capacity)
+        print("[INFO] Processus de capture démarré.")
+
+    def _on_armed_audio(self, in_data, frame_count, time_info, status):
+        """
+        Callback PortAudio du flux armé : alimente l’historique et, pendant une prise,
+        le tampon de l’enregistreur (précédé une fois de l’historique, sans trou ni doublon).
+        """
+        samples = np.frombuffer(in_data, dtype=np.int16)
+        recorder = self._recorder
+        if recorder is not None:
+            if recorder.needs_preroll:
+                recorder.needs_preroll = False
+                recorder.ring.write(self.preroll.snapshot())
+            recorder.capture(samples, status)
+        self.preroll.write(samples)
+        return None, pyaudio.paContinue
+
+    def attach_recorder(self, recorder: "AudioRecorder"):
+        self._recorder = recorder
+
+    def detach_recorder(self, recorder: "AudioRecorder"):
+        if self._recorder is recorder:
+            self._recorder = None
+
+    def create_take_buffer(self, take_id: int) -> AudioBuffer | DiskAudioBuffer:
+        """
+        Tampon de la prise : en mémoire (préalloué à la durée max), ou sur disque
+        pour les longues sessions, sans limite si aucune durée max n’est choisie.
+        """
+        if not get_disk_recording():
+            return AudioBuffer(self.max_duration, WHISPER_SAMPLE_RATE)
+
+        stamp = time.strftime("%Y%m%d_%H%M%S")
+        return DiskAudioBuffer(
+            self.output_dir / f"session_{stamp}_{take_id}.wav",
+            WHISPER_SAMPLE_RATE,
+            capacity_seconds=self.max_duration if self._limited else None,
+            block_seconds=config.capture.disk_block_seconds,
+        )
+
+    def _negotiate_capture_rate(self) -> int:
+        """
+        Fréquence de capture du micro par défaut : 16 kHz s’il l’accepte.
+        Le sondage n’a lieu qu’à la première utilisation d’un périphérique.
+        """
+        if self._armed_stream is not None:
+            return self._armed_rate
+
+        try:
+            device_info = self.audio.get_default_input_device_info()
+        except OSError:
+            return SAMPLE_RATE
+
+        rate, probed = self.device_caps.capture_rate(
+            self.audio, device_info, pyaudio.paInt16
+        )
+        if probed:
+            print(
+                f"[INFO] Fréquences de {device_info['name']} : {self.device_caps.table}"
+            )
+            set_device_caps(self.device_caps.table)
+        return rate
+
+    def forget_device_caps(self):
+        """
+        Appelé depuis le thread de capture : la table n’est corrigée qu’en mémoire,
+        le nouveau sondage (thread UI, prise suivante) la persistera.
+        """
+        try:
+            self.device_caps.forget(self.audio.get_default_input_device_info())
+        except OSError:
+            pass
+
+    def default_device_rate(self) -> int:
+        try:
+            info = self.audio.get_default_input_device_info()
+        except OSError:
+            return SAMPLE_RATE
+        return int(info.get("defaultSampleRate", SAMPLE_RATE))
+
+    def set_thread_priority(self, priority: QThread.Priority):
+        """
+        Priorité du thread de capture, pour la prise en cours et les suivantes.
+        """
+        self._thread_priority = priority
+        if self._thread is not None and self.is_recording:
+            self._thread.setPriority(priority)
 
     def stop_recording(self):
         if not self.is_recording:
             raise RuntimeError("Aucun enregistrement en cours.")
         self.is_recording = False
 
+        # Le thread de la prise ferme lui-même sa source après son dernier vidage
         if self._worker:
             self._worker.stop()
 
-        if self.stream:
-            self.stream.stop_stream()
-            self.stream.close()
-            self.stream = None
-
         return str(self.output_path)
 
     def connect_timer(self, slot):
         if self._worker:
             self._worker.update_time.connect(slot)
 
+    def connect_levels(self, slot):
+        """
+        Connecte un slot appelé avec les InputLevels du micro
+        (au plus telemetry_rate_hz fois par seconde).
+        """
+        if self._worker:
+            self._worker.levels_changed.connect(slot)
+
+    def connect_health(self, slot):
+        """
+        Connecte un slot appelé avec (take_id, RecorderHealth) en fin de prise.
+        """
+        if self._worker:
+            self._worker.health_ready.connect(slot)
+
+    def connect_auto_stopped(self, slot):
+        """
+        Connecte un slot appelé avec take_id quand la prise s’arrête seule
+        (fin d’énoncé détectée ou durée maximale atteinte).
+        """
+        if self._worker:
+            self._worker.auto_stopped.connect(slot)
+
+    def connect_finished(self, slot):
+        """
+        Connecte un slot appelé avec (take_id, AudioBuffer) quand la prise
+        est complète et disponible en mémoire.
+        """
+        if self._worker:
+            self._worker.take_ready.connect(slot)
+
     def get_elapsed_time(self):
         """
         Retourne la durée écoulée depuis le début de l’enregistrement.
@@ -119,24 +598,70 @@ class AudioService:
 
     def get_last_audio_path(self) -> str:
         """
-        Retourne le chemin du dernier fichier audio enregistré.
+        Retourne le chemin du dernier fichier audio archivé.
         """
         return str(self.output_path)
 
-    def _save_audio(self, frames):
+    def get_last_audio(self) -> Optional[np.ndarray]:
+        """
+        Retourne la dernière prise en float32 16 kHz, prête pour Whisper.
+        """
+        if self.last_buffer is None or len(self.last_buffer) == 0:
+            return None
+        return self.last_buffer.to_whisper_input()
+
+    def _finalize_take(
+        self,
+        take_id: int,
+        buffer: AudioBuffer | DiskAudioBuffer,
+        health: Optional[RecorderHealth] = None,
+    ):
+        """
+        Garde la prise pour la transcription. Une prise sur disque est close et
+        renommée (compressée si demandé) ; une prise en mémoire n’est écrite
+        (un fichier par prise) que si l’archivage est activé.
+        Chaque fichier de prise est accompagné de ses métadonnées (<prise>.json).
+        """
+        self.last_buffer = buffer
+        self.last_health = health
+        archived = False
+
+        if isinstance(buffer, DiskAudioBuffer):
+            self.output_path = buffer.finalize(get_archive_format())
+            archived = True
+            print(f"[INFO] Prise enregistrée : {self.output_path}")
+        elif get_archive_audio():
+            wav_path = self.output_dir / f"record_{take_id}.wav"
+            buffer.write_wav(str(wav_path))
+            self.output_path = encode_archive(wav_path, get_archive_format())
+            archived = True
+            print(f"[INFO] Prise archivée : {self.output_path}")
+
+        if archived:
+            self._take_audio_paths[take_id] = self.output_path
+            self._write_take_metadata(take_id, buffer, health)
+
+    def pop_take_audio_path(self, take_id: int) -> Optional[Path]:
         """
-        Sauvegarde les données audio dans un fichier WAV.
+        Fichier audio archivé de la prise (None si la prise n’a pas été gardée).
         """
-        if not pyaudio:
-            raise RuntimeError("PyAudio n'est pas disponible.")
-        if not self.audio:
-            raise RuntimeError("L'objet PyAudio n'a pas pu être initialisé.")
+        return self._take_audio_paths.pop(take_id, None)
 
-        with wave.open(str(self.output_path), "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(self.audio.get_sample_size(pyaudio.paInt16))
-            wf.setframerate(44100)
-            wf.writeframes(b"".join(frames))
+    def _write_take_metadata(self, take_id: int, buffer, health):
+        metadata = {
+            "take_id": take_id,
+            "audio": self.output_path.name,
+            "duration_seconds": round(buffer.duration, 3),
+            "sample_rate": buffer.sample_rate,
+            "recorded_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "health": health.to_dict() if health else None,
+        }
+        path = self.output_path.with_suffix(".json")
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(metadata, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"[ERREUR] Métadonnées de prise non écrites : {e}")
 
     def __del__(self):
         """
@@ -145,6 +670,11 @@ class AudioService:
         if self.stream is not None:
             self.stream.stop_stream()
             self.stream.close()
+        if self._armed_stream is not None:
+            self._armed_stream.stop_stream()
+            self._armed_stream.close()
+        if self.capture_process is not None:
+            self.capture_process.shutdown()
         if self.audio:
             self.audio.terminate()
 
@@ -0,0 +1,212 @@
+# modules/parlia/services/cpu_governor.py
+
+# Partage du CPU entre capture audio, interface et transcription.
+# Pendant un enregistrement, la capture et l’UI passent avant le décodage :
+# torch utilise moins de cœurs et le thread de transcription baisse en priorité.
+# Au repos, la transcription reprend tous les cœurs.
+#
+# Deux compteurs mesurent l’effet d’un préréglage : débordements du flux audio
+# (comptés par audio_service) et blocages de la boucle Qt (UiStallMonitor).
+
+import os
+import sys
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from PySide6.QtCore import QObject, QThread, QTimer
+
+from modules.parlia.services.audioService import audio_service
+from modules.parlia.services.parlia_data import get_cpu_preset, set_cpu_preset
+from modules.parlia.services.parlia_state_manager import parlia_state
+from modules.parlia.services.whisper_service import whisper_service
+
+try:
+    import win32api
+    import win32process
+except ImportError:
+    win32process = None
+
+PRESET_LATENCY = "latency"
+PRESET_BALANCED = "balanced"
+PRESET_THROUGHPUT = "throughput"
+
+
+@dataclass(frozen=True)
+class GovernorPreset:
+    # Cœurs laissés à la capture et à l’UI pendant un enregistrement, puis au repos
+    reserved_cores_recording: int
+    reserved_cores_idle: int
+    # Fixé une seule fois : torch refuse de le changer ensuite
+    interop_threads: int
+    # Transcription en basse priorité pendant un enregistrement
+    lower_transcription_priority: bool
+    # Capture en priorité maximale et processus en priorité haute pendant un enregistrement
+    raise_capture_priority: bool
+
+
+PRESETS: dict[str, GovernorPreset] = {
+    PRESET_LATENCY: GovernorPreset(2, 1, 1, True, True),
+    PRESET_BALANCED: GovernorPreset(1, 0, 1, True, False),
+    PRESET_THROUGHPUT: GovernorPreset(0, 0, 2, False, False),
+}
+
+
+class UiStallMonitor(QObject):
+    """
+    Battement de cœur dans la boucle Qt : un tick en retard de plus de
+    `threshold_ms` signifie que l’UI n’a pas pu traiter ses événements.
+    """
+
+    def __init__(self, interval_ms: int = 50, threshold_ms: int = 100):
+        super().__init__()
+        self.interval_ms = interval_ms
+        self.threshold_ms = threshold_ms
+        self.stalls = 0
+        self.longest_stall_ms = 0.0
+        self._last_tick: Optional[float] = None
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._on_tick)
+
+    def start(self):
+        self._last_tick = time.monotonic()
+        self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def reset(self):
+        self.stalls = 0
+        self.longest_stall_ms = 0.0
+
+    def _on_tick(self):
+        now = time.monotonic()
+        late_ms = (now - self._last_tick) * 1000 - self.interval_ms
+        self._last_tick = now
+
+        if late_ms > self.threshold_ms:
+            self.stalls += 1
+            self.longest_stall_ms = max(self.longest_stall_ms, late_ms)
+
+
+class CpuGovernor(QObject):
+    """
+    Applique le préréglage choisi à chaque changement d’état de Parlia
+    (début/fin d’enregistrement, modèle prêt).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.preset_name = get_cpu_preset()
+        self.ui_monitor = UiStallMonitor()
+        self._started = False
+        self._applied_state: Optional[tuple[bool, bool]] = None
+        self._interop_configured = False
+
+    @property
+    def preset(self) -> GovernorPreset:
+        return PRESETS.get(self.preset_name, PRESETS[PRESET_BALANCED])
+
+    def start(self):
+        if self._started:
+            return
+        self._started = True
+        parlia_state.subscribe(self._on_state_changed)
+        self.ui_monitor.start()
+        self.apply()
+
+    def stop(self):
+        if not self._started:
+            return
+        self._started = False
+        parlia_state.unsubscribe(self._on_state_changed)
+        self.ui_monitor.stop()
+
+    def set_preset(self, name: str):
+        if name not in PRESETS:
+            raise ValueError(f"Préréglage CPU inconnu : {name}")
+        self.preset_name = name
+        set_cpu_preset(name)
+        self.apply()
+
+    def stats(self) -> dict:
+        return {
+            "audio_overflows": audio_service.overflow_count,
+            "audio_underflows": audio_service.underflow_count,
+            "ui_stalls": self.ui_monitor.stalls,
+            "longest_ui_stall_ms": round(self.ui_monitor.longest_stall_ms),
+        }
+
+    def reset_counters(self):
+        audio_service.overflow_count = 0
+        audio_service.underflow_count = 0
+        self.ui_monitor.reset()
+
+    def _on_state_changed(self):
+        state = (parlia_state.is_recording, parlia_state.whisper_ready)
+        if state != self._applied_state:
+            self.apply()
+
+    def apply(self):
+        recording = parlia_state.is_recording
+        self._applied_state = (recording, parlia_state.whisper_ready)
+        preset = self.preset
+
+        reserved = (
+            preset.reserved_cores_recording if recording else preset.reserved_cores_idle
+        )
+        threads = max(1, (os.cpu_count() or 1) - reserved)
+        self._configure_torch(threads, preset.interop_threads)
+
+        lower = recording and preset.lower_transcription_priority
+        whisper_service.set_thread_priority(
+            QThread.Priority.LowPriority if lower else QThread.Priority.NormalPriority
+        )
+
+        boost = recording and preset.raise_capture_priority
+        audio_service.set_thread_priority(
+            QThread.Priority.TimeCriticalPriority
+            if boost
+            else QThread.Priority.HighPriority
+        )
+        self._set_process_priority(boost)
+
+        print(
+            f"[INFO] Gouverneur CPU ({self.preset_name}) : "
+            f"{threads} threads torch, enregistrement={recording}"
+        )
+
+    def _configure_torch(self, threads: int, interop_threads: int):
+        # Pas d’import ici : torch n’est réglé que si un moteur l’a déjà chargé
+        torch = sys.modules.get("torch")
+        if torch is None:
+            return
+
+        if not self._interop_configured:
+            self._interop_configured = True
+            try:
+                torch.set_num_interop_threads(interop_threads)
+            except RuntimeError as e:
+                print(f"[WARN] Threads inter-op torch non modifiables : {e}")
+
+        torch.set_num_threads(threads)
+
+    def _set_process_priority(self, high: bool):
+        """
+        Priorité du processus (Windows). Ailleurs, seules les priorités
+        de threads Qt s’appliquent : la niceness ne peut pas redescendre sans droits.
+        """
+        if win32process is None:
+            return
+        priority_class = (
+            win32process.ABOVE_NORMAL_PRIORITY_CLASS
+            if high
+            else win32process.NORMAL_PRIORITY_CLASS
+        )
+        win32process.SetPriorityClass(win32api.GetCurrentProcess(), priority_class)
+
+
+# ✅ Singleton global
+cpu_governor = CpuGovernor()
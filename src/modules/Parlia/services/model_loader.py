@@ -0,0 +1,110 @@
+# modules/parlia/services/model_loader.py
+
+# Chargement des modèles Whisper hors du thread UI.
+# Le worker remonte les étapes (lecture, construction, préchauffage) ;
+# l’état Parlia n’est modifié que depuis le thread principal.
+
+from typing import Callable, Optional
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+from modules.parlia.core.whisper_manager import (
+    get_current_model_key,
+    get_last_load_seconds,
+    load_model,
+)
+from modules.parlia.services.parlia_data import record_model_benchmark
+from modules.parlia.services.parlia_state_manager import parlia_state
+
+
+class _ModelLoadWorker(QObject):
+    progress = Signal(int, str)
+    finished = Signal(bool)
+
+    def __init__(self, model_name: str):
+        super().__init__()
+        self.model_name = model_name
+
+    def run(self):
+        try:
+            ok = load_model(self.model_name, progress_callback=self.progress.emit)
+        except Exception as e:
+            print(f"[ERREUR] Chargement du modèle échoué : {e}")
+            ok = False
+        self.finished.emit(ok)
+
+
+class ModelLoader(QObject):
+    def __init__(self):
+        super().__init__()
+        self._thread: Optional[QThread] = None
+        self._worker: Optional[_ModelLoadWorker] = None
+        self._pending: Optional[str] = None
+        self._on_done: Optional[Callable[[bool], None]] = None
+
+    def is_loading(self) -> bool:
+        return self._worker is not None
+
+    def load_async(
+        self, model_name: str, on_done: Optional[Callable[[bool], None]] = None
+    ):
+        """
+        Charge un modèle dans un QThread.
+        Si un chargement est déjà en cours, seul le dernier modèle demandé
+        est chargé ensuite.
+        :param on_done: Appelé dans le thread UI avec True si le modèle est prêt.
+        """
+        self._on_done = on_done
+
+        if self.is_loading():
+            print(f"[INFO] Chargement en cours, {model_name} sera chargé ensuite.")
+            self._pending = model_name
+            return
+
+        parlia_state.set_whisper_ready(False)
+        parlia_state.set_loading_model(True, 0, model_name)
+
+        self._thread = QThread()
+        self._worker = _ModelLoadWorker(model_name)
+        self._worker.moveToThread(self._thread)
+
+        self._thread.started.connect(self._worker.run)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.finished.connect(self._on_finished)
+        self._worker.finished.connect(self._thread.quit)
+        self._worker.finished.connect(self._worker.deleteLater)
+        self._thread.finished.connect(self._thread.deleteLater)
+
+        self._thread.start()
+
+    def _on_progress(self, progress: int, phase: str):
+        parlia_state.set_loading_model(True, progress, phase)
+
+    def _on_finished(self, ok: bool):
+        self._worker = None
+        self._thread = None
+        parlia_state.set_loading_model(False)
+
+        load_seconds = get_last_load_seconds()
+        if ok and load_seconds is not None:
+            record_model_benchmark(get_current_model_key(), load_seconds=load_seconds)
+
+        pending, self._pending = self._pending, None
+        if pending:
+            self.load_async(pending, on_done=self._on_done)
+            return
+
+        # Le bouton d’enregistrement s’active dès que le modèle est préchauffé
+        parlia_state.set_whisper_ready(ok)
+        if self._on_done:
+            self._on_done(ok)
+
+    def cleanup(self):
+        if self._thread is not None and self._thread.isRunning():
+            print("[INFO] Attente de la fin du chargement du modèle...")
+            self._thread.quit()
+            self._thread.wait()
+
+
+# ✅ Singleton global
+model_loader = ModelLoader()
@@ -10,6 +10,21 @@ KEY_MODEL_FOLDER = "model_folder_path"
 KEY_INCLUDE_CONCLUSION = "include_conclusion"
 KEY_CONCLUSION_TEXT = "conclusion_text"
 KEY_PROMPT_CODE_VS_CODE = "prompt_code_vs_code"
+KEY_STREAMING_ENABLED = "streaming_enabled"
+KEY_ARCHIVE_AUDIO = "archive_audio"
+KEY_MODEL_CACHE_BUDGET_MB = "model_cache_budget_mb"
+KEY_ENGINE = "engine"
+KEY_MODEL_BENCHMARKS = "model_benchmarks"
+KEY_CPU_PRESET = "cpu_preset"
+KEY_TRIM_SILENCE = "trim_silence"
+KEY_DEVICE_CAPS = "device_caps"
+KEY_PREROLL_ENABLED = "preroll_enabled"
+KEY_AUTO_STOP_SILENCE = "auto_stop_silence_seconds"
+KEY_DISK_RECORDING = "disk_recording"
+KEY_ARCHIVE_FORMAT = "archive_format"
+KEY_CAPTURE_PROCESS = "capture_process"
+
+DEFAULT_MODEL_CACHE_BUDGET_MB = 4096
 
 PROMPT_DEFINITIONS = {
     "prompt_code_comments": "Code les commentaires (focus VS Code et code)",
@@ -51,6 +66,66 @@ def set_model_folder_path(path: str):
     user_data.set(MODULE_NAME, KEY_MODEL_FOLDER, path)
 
 
+def get_engine_name() -> str:
+    value = user_data.get(MODULE_NAME, KEY_ENGINE)
+    return value if isinstance(value, str) else "whisper"
+
+
+def set_engine_name(name: str):
+    user_data.set(MODULE_NAME, KEY_ENGINE, name)
+
+
+def get_model_benchmark(model_key: str) -> dict:
+    """
+    Mesures d’un modèle ("<moteur>:<référence>") : load_seconds et rtf, si connus.
+    """
+    value = user_data.get(MODULE_NAME, KEY_MODEL_BENCHMARKS)
+    if isinstance(value, dict) and isinstance(value.get(model_key), dict):
+        return value[model_key]
+    return {}
+
+
+def record_model_benchmark(model_key: str, **measures: float):
+    # Appelé depuis le thread de chargement : lecture-modification-écriture atomique
+    with user_data.batch():
+        value = user_data.get(MODULE_NAME, KEY_MODEL_BENCHMARKS)
+        benchmarks = value if isinstance(value, dict) else {}
+        benchmarks.setdefault(model_key, {}).update(
+            {name: round(measure, 3) for name, measure in measures.items()}
+        )
+        user_data.set(MODULE_NAME, KEY_MODEL_BENCHMARKS, benchmarks)
+
+
+def get_device_caps() -> dict:
+    """Table {périphérique: fréquences acceptées} sondée par audio_service."""
+    value = user_data.get(MODULE_NAME, KEY_DEVICE_CAPS)
+    return value if isinstance(value, dict) else {}
+
+
+def set_device_caps(table: dict):
+    user_data.set(MODULE_NAME, KEY_DEVICE_CAPS, table)
+
+
+def get_cpu_preset() -> str:
+    value = user_data.get(MODULE_NAME, KEY_CPU_PRESET)
+    return value if isinstance(value, str) else "balanced"
+
+
+def set_cpu_preset(name: str):
+    user_data.set(MODULE_NAME, KEY_CPU_PRESET, name)
+
+
+def get_model_cache_budget_mb() -> int:
+    value = user_data.get(MODULE_NAME, KEY_MODEL_CACHE_BUDGET_MB)
+    if isinstance(value, int) and value > 0:
+        return value
+    return DEFAULT_MODEL_CACHE_BUDGET_MB
+
+
+def set_model_cache_budget_mb(value: int):
+    user_data.set(MODULE_NAME, KEY_MODEL_CACHE_BUDGET_MB, int(value))
+
+
 def get_include_conclusion() -> bool:
     value = user_data.get(MODULE_NAME, KEY_INCLUDE_CONCLUSION)
     return bool(value)
@@ -69,6 +144,82 @@ def set_conclusion_text(text: str):
     user_data.set(MODULE_NAME, KEY_CONCLUSION_TEXT, text)
 
 
+def get_streaming_enabled() -> bool:
+    value = user_data.get(MODULE_NAME, KEY_STREAMING_ENABLED)
+    return bool(value)
+
+
+def set_streaming_enabled(enabled: bool):
+    user_data.set(MODULE_NAME, KEY_STREAMING_ENABLED, enabled)
+
+
+def get_archive_audio() -> bool:
+    value = user_data.get(MODULE_NAME, KEY_ARCHIVE_AUDIO)
+    return bool(value)
+
+
+def set_archive_audio(enabled: bool):
+    user_data.set(MODULE_NAME, KEY_ARCHIVE_AUDIO, enabled)
+
+
+def get_disk_recording() -> bool:
+    value = user_data.get(MODULE_NAME, KEY_DISK_RECORDING)
+    return value if isinstance(value, bool) else False
+
+
+def set_disk_recording(enabled: bool):
+    user_data.set(MODULE_NAME, KEY_DISK_RECORDING, enabled)
+
+
+def get_archive_format() -> str:
+    """ "wav", "flac" ou "opus" (voir core.disk_audio)."""
+    value = user_data.get(MODULE_NAME, KEY_ARCHIVE_FORMAT)
+    return value if isinstance(value, str) else "wav"
+
+
+def set_archive_format(archive_format: str):
+    user_data.set(MODULE_NAME, KEY_ARCHIVE_FORMAT, archive_format)
+
+
+def get_trim_silence() -> bool:
+    value = user_data.get(MODULE_NAME, KEY_TRIM_SILENCE)
+    return value if isinstance(value, bool) else True
+
+
+def set_trim_silence(enabled: bool):
+    user_data.set(MODULE_NAME, KEY_TRIM_SILENCE, enabled)
+
+
+def get_preroll_enabled() -> bool:
+    value = user_data.get(MODULE_NAME, KEY_PREROLL_ENABLED)
+    return value if isinstance(value, bool) else False
+
+
+def set_preroll_enabled(enabled: bool):
+    user_data.set(MODULE_NAME, KEY_PREROLL_ENABLED, enabled)
+
+
+def get_capture_process() -> bool:
+    value = user_data.get(MODULE_NAME, KEY_CAPTURE_PROCESS)
+    return value if isinstance(value, bool) else False
+
+
+def set_capture_process(enabled: bool):
+    user_data.set(MODULE_NAME, KEY_CAPTURE_PROCESS, enabled)
+
+
+def get_auto_stop_silence() -> float:
+    """Silence final (secondes) qui arrête la prise ; 0 : arrêt manuel seulement."""
+    value = user_data.get(MODULE_NAME, KEY_AUTO_STOP_SILENCE)
+    if isinstance(value, (int, float)) and not isinstance(value, bool) and value > 0:
+        return float(value)
+    return 0.0
+
+
+def set_auto_stop_silence(seconds: float):
+    user_data.set(MODULE_NAME, KEY_AUTO_STOP_SILENCE, float(seconds))
+
+
 def set_prompt_code_vs_code(prompt: str):
     user_data.set(MODULE_NAME, KEY_PROMPT_CODE_VS_CODE, prompt)
 
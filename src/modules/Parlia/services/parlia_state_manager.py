@@ -7,9 +7,14 @@ from config.env import is_dev
 class ParliaStateManager:
     def __init__(self):
         self.max_duration = 0
+        self.disk_recording = False
         self.whisper_ready = False
         self.is_recording = False
         self.is_transcribing = False
+        self.pending_jobs = 0
+        self.is_loading_model = False
+        self.loading_progress = 0
+        self.loading_phase = ""
 
         self._subscribers = []
         self._ui_components = []
@@ -35,11 +40,23 @@ class ParliaStateManager:
         self.notify()
         self._refresh_ui_state()
 
+    def set_disk_recording(self, enabled: bool):
+        self.disk_recording = enabled
+        self.notify()
+        self._refresh_ui_state()
+
     def set_whisper_ready(self, ready: bool):
         self.whisper_ready = ready
         self.notify()
         self._refresh_ui_state()
 
+    def set_loading_model(self, state: bool, progress: int = 0, phase: str = ""):
+        self.is_loading_model = state
+        self.loading_progress = progress
+        self.loading_phase = phase
+        self.notify()
+        self._refresh_ui_state()
+
     def set_recording(self, state: bool):
         self.is_recording = state
         self.notify()
@@ -50,6 +67,13 @@ class ParliaStateManager:
         self.notify()
         self._refresh_ui_state()
 
+    def set_pending_jobs(self, count: int):
+        """Nombre de prises en file de transcription (is_transcribing tant qu’il y en a)."""
+        self.pending_jobs = count
+        self.is_transcribing = count > 0
+        self.notify()
+        self._refresh_ui_state()
+
     def get_status_info(self) -> tuple[str, str]:
         """
         Retourne un tuple (texte, status_type) où status_type ∈
@@ -58,15 +82,25 @@ class ParliaStateManager:
         if is_dev():
             print("=== [DEBUG] get_status_info ===")
             print(f"[DEBUG] is_transcribing : {self.is_transcribing}")
+            print(f"[DEBUG] pending_jobs    : {self.pending_jobs}")
             print(f"[DEBUG] is_recording    : {self.is_recording}")
             print(f"[DEBUG] whisper_ready   : {self.whisper_ready}")
+            print(f"[DEBUG] loading_model   : {self.is_loading_model}")
             print(f"[DEBUG] max_duration    : {self.max_duration}")
+            print(f"[DEBUG] disk_recording  : {self.disk_recording}")
 
-        if self.is_transcribing:
-            return "Transcription en cours", "warning"
-        elif self.is_recording:
+        if self.is_recording:
             return "Enregistrement en cours", "warning"
-        elif self.whisper_ready and self.max_duration > 0:
+        elif self.is_transcribing:
+            if self.pending_jobs > 1:
+                return f"Transcription en cours ({self.pending_jobs} prises)", "warning"
+            return "Transcription en cours", "warning"
+        elif self.is_loading_model:
+            return (
+                f"Chargement du modèle ({self.loading_progress} %) : {self.loading_phase}",
+                "warning",
+            )
+        elif self.whisper_ready and self.has_valid_duration():
             return "Prêt", "ready"
         elif not self.whisper_ready:
             return "Whisper non prêt", "error"
@@ -89,9 +123,21 @@ class ParliaStateManager:
 
     # === Logique de validation ===
 
+    def has_valid_duration(self) -> bool:
+        """
+        Une durée max est choisie, ou « Aucun temps » avec l’enregistrement sur disque
+        (le tampon en mémoire, lui, est préalloué à la durée max).
+        """
+        return self.max_duration > 0 or self.disk_recording
+
     def is_ready_to_record(self) -> bool:
         """Indique si l'on peut lancer un enregistrement."""
-        return self.whisper_ready and self.max_duration > 0 and not self.is_transcribing
+        # Les prises précédentes peuvent encore être en file de transcription
+        return (
+            self.whisper_ready
+            and self.has_valid_duration()
+            and not self.is_loading_model
+        )
 
     def is_ui_locked(self) -> bool:
         """Indique si l'interface doit être bloquée (ex: boutons désactivés)."""
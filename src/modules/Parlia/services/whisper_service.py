@@ -1,66 +1,285 @@
-import os
+import queue
+import sqlite3
 import time
+from dataclasses import dataclass, field
+from threading import Thread
 from typing import Callable, Optional
 
-from PySide6.QtCore import QObject, QThread, Signal
+from PySide6.QtCore import QObject, QThread, QTimer, Signal
 
-from modules.parlia.core.whisper_manager import is_model_loaded, transcribe
+from core.user_data_manager import USER_DATA_DIR
+from modules.parlia.config import config
+from modules.parlia.core.audio_utils import WHISPER_SAMPLE_RATE
+from modules.parlia.core.parallel_transcriber import ParallelTranscriber
+from modules.parlia.core.transcription_cache import TranscriptionCache, cache_key
+from modules.parlia.core.vad import trim_silence
+from modules.parlia.core.whisper_manager import (
+    get_current_model_key,
+    is_model_loaded,
+    transcribe,
+)
+from modules.parlia.db.history_db import TranscriptionHistory
 from modules.parlia.services.audioService import audio_service
 from modules.parlia.services.parlia_data import (
     get_conclusion_text,
     get_include_conclusion,
+    get_trim_silence,
+    record_model_benchmark,
+)
+from modules.parlia.services.parlia_state_manager import parlia_state
+
+# Types d’éléments de la file de transcription
+ITEM_TAKE = "take"  # Prise complète (AudioBuffer)
+ITEM_SEGMENT = "segment"  # Segment d’une prise en mode continu (float32 16 kHz)
+ITEM_END = "end"  # Fin d’une prise en mode continu
+
+# En dessous, le temps de décodage est dominé par les coûts fixes : RTF peu significatif
+MIN_BENCHMARK_AUDIO_SECONDS = 1.0
+
+# Longues prises découpées sur les silences et décodées dans un pool de processus
+_parallel = ParallelTranscriber(config.chunking.workers)
+
+# Textes déjà transcrits, sans la phrase de conclusion (ajoutée à la sortie du cache)
+_result_cache = TranscriptionCache(
+    USER_DATA_DIR / config.transcription_cache.file_name,
+    max_entries=config.transcription_cache.max_entries,
+    flush_delay=config.transcription_cache.flush_delay_seconds,
 )
 
+# Historique des dictées terminées (recherche plein texte dans le panneau Historique)
+transcription_history = TranscriptionHistory(USER_DATA_DIR / config.history.file_name)
+
+
+@dataclass
+class TranscriptionResult:
+    job_id: int
+    text: Optional[str]
+    audio_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    latency_seconds: float = 0.0  # Entre l’arrêt de l’enregistrement et le texte
+    model: str = ""
+    cache_hits: int = 0  # Prises/segments servis par le cache (hors audio_seconds)
+    silence_removed_seconds: float = 0.0
+
+
+@dataclass
+class _JobState:
+    texts: list[str] = field(default_factory=list)
+    audio_seconds: float = 0.0
+    decode_seconds: float = 0.0
+    cache_hits: int = 0
+    silence_removed_seconds: float = 0.0
+    failed: bool = False
+
+
+def _with_conclusion(text: str) -> str:
+    if get_include_conclusion():
+        conclusion = get_conclusion_text()
+        if conclusion:
+            text += f"\n\n{conclusion}"
+    return text
 
-class _AsyncTranscriber(QObject):
-    finished = Signal(object)
-    update_time = Signal(float)
 
-    def __init__(self, path: str):
+def _trim_silence(audio) -> tuple[object, float]:
+    """
+    Retire les silences (si l’option est active) : (audio, secondes retirées).
+    """
+    if not get_trim_silence():
+        return audio, 0.0
+    return trim_silence(
+        audio,
+        WHISPER_SAMPLE_RATE,
+        frame_ms=config.vad.frame_ms,
+        padding_ms=config.vad.padding_ms,
+        max_pause_seconds=config.vad.max_pause_seconds,
+    )
+
+
+def _cached_transcribe(audio, initial_prompt: Optional[str] = None) -> tuple[str, bool]:
+    """
+    Transcrit via le cache : (texte, True) si le résultat était déjà connu.
+    """
+    key = cache_key(audio, get_current_model_key() or "", initial_prompt=initial_prompt)
+    text = _result_cache.get(key)
+    if text is not None:
+        return text, True
+
+    if initial_prompt is None and _parallel.is_long(audio):
+        text = _parallel.transcribe(audio)
+    else:
+        text = transcribe(audio, initial_prompt=initial_prompt)
+    _result_cache.put(key, text)
+    return text, False
+
+
+class _TranscriptionWorker(QObject):
+    """
+    Consomme la file des prises à transcrire, dans l’ordre d’arrivée.
+    Un seul thread utilise le modèle : prises complètes et segments du mode continu
+    passent par la même file.
+    """
+
+    partial = Signal(int, str)
+    job_done = Signal(object)
+    update_time = Signal(int, float)
+
+    def __init__(self):
         super().__init__()
-        self.audio_path = path
+        self._items: queue.Queue = queue.Queue()
+        self._jobs: dict[int, _JobState] = {}
+        self._stopped_at: dict[int, float] = {}
+        self._current_job: Optional[int] = None
         self._running = True
 
+    def put(self, item):
+        self._items.put(item)
+
+    def mark_stopped(self, job_id: int):
+        self._stopped_at.setdefault(job_id, time.monotonic())
+
+    def stop(self):
+        self._running = False
+        self._items.put(None)
+
     def run(self):
+        print("[INFO] File de transcription démarrée.")
+        Thread(target=self._ticker, daemon=True).start()
+
+        while True:
+            item = self._items.get()
+            if item is None:
+                break
+
+            kind, job_id, payload = item
+            self._current_job = job_id
+            try:
+                if kind == ITEM_TAKE:
+                    self._transcribe_take(job_id, payload)
+                elif kind == ITEM_SEGMENT:
+                    self._transcribe_segment(job_id, payload)
+                elif kind == ITEM_END:
+                    self._finish_job(job_id)
+            except Exception as e:
+                print(f"[ERREUR ASYNC] Transcription échouée (prise {job_id}) : {e}")
+                self._job(job_id).failed = True
+                if kind != ITEM_SEGMENT:
+                    self._finish_job(job_id)
+            finally:
+                self._current_job = None
+
+        self._running = False
+        print("[INFO] File de transcription arrêtée.")
+
+    def _ticker(self):
+        """
+        Émet le temps écoulé depuis l’arrêt de la prise en cours de décodage.
+        """
+        while self._running:
+            job_id = self._current_job
+            if job_id is not None and job_id in self._stopped_at:
+                self.update_time.emit(
+                    job_id, time.monotonic() - self._stopped_at[job_id]
+                )
+            time.sleep(0.2)
+
+    def _job(self, job_id: int) -> _JobState:
+        return self._jobs.setdefault(job_id, _JobState())
+
+    def _decode(self, job_id: int, audio, initial_prompt: Optional[str] = None) -> str:
+        job = self._job(job_id)
+        audio, removed = _trim_silence(audio)
+        job.silence_removed_seconds += removed
+        if len(audio) == 0:
+            return ""
+
         start = time.monotonic()
-        print("[INFO] Lancement de la transcription réelle via Whisper.")
+        text, cached = _cached_transcribe(audio, initial_prompt=initial_prompt)
+        if cached:
+            # Hors mesures : le RTF ne doit refléter que du décodage réel
+            job.cache_hits += 1
+            return text
 
-        try:
-            # Lancer dans un thread de mesure
-            def ticker():
-                while self._running:
-                    elapsed = time.monotonic() - start
-                    self.update_time.emit(elapsed)
-                    time.sleep(0.2)
-
-            from threading import Thread
-
-            timer_thread = Thread(target=ticker, daemon=True)
-            timer_thread.start()
-
-            # Transcription bloquante
-            text = transcribe(self.audio_path)
-            if get_include_conclusion():
-                conclusion = get_conclusion_text()
-                if conclusion:
-                    text += f"\n\n{conclusion}"
-            self.finished.emit(text)
+        job.decode_seconds += time.monotonic() - start
+        job.audio_seconds += len(audio) / WHISPER_SAMPLE_RATE
+        return text
 
-        except Exception as e:
-            print(f"[ERREUR ASYNC] Transcription échouée : {e}")
-            self.finished.emit(None)
-        finally:
-            self._running = False
+    def _transcribe_take(self, job_id: int, buffer):
+        self.mark_stopped(job_id)
+        text = self._decode(job_id, buffer.to_whisper_input())
+        self._job(job_id).texts.append(text)
+        self._finish_job(job_id)
+
+    def _transcribe_segment(self, job_id: int, samples):
+        job = self._job(job_id)
+        if job.failed:
+            return
 
+        # Le texte déjà transcrit sert de contexte au segment suivant
+        context = " ".join(job.texts)
+        prompt = context[-config.streaming.prompt_context_chars :] or None
+
+        text = self._decode(job_id, samples, initial_prompt=prompt)
+        if text:
+            job.texts.append(text)
+            self.partial.emit(job_id, text)
+
+    def _finish_job(self, job_id: int):
+        job = self._jobs.pop(job_id, _JobState())
+        stopped_at = self._stopped_at.pop(job_id, time.monotonic())
+        latency = time.monotonic() - stopped_at
+
+        text = None if job.failed else _with_conclusion(" ".join(job.texts))
+        print(
+            f"[INFO] Prise {job_id} : texte final {latency:.2f}s après l'arrêt "
+            f"({job.silence_removed_seconds:.1f}s de silence retirées)."
+        )
+
+        self.update_time.emit(job_id, latency)
+        self.job_done.emit(
+            TranscriptionResult(
+                job_id=job_id,
+                text=text,
+                audio_seconds=job.audio_seconds,
+                decode_seconds=job.decode_seconds,
+                latency_seconds=latency,
+                model=get_current_model_key() or "",
+                cache_hits=job.cache_hits,
+                silence_removed_seconds=job.silence_removed_seconds,
+            )
+        )
+
+
+class WhisperService(QObject):
+    """
+    File de transcription : chaque prise reçoit un identifiant, les prises sont
+    transcrites dans l’ordre pendant que l’utilisateur peut déjà enregistrer la suivante,
+    et chaque résultat est livré au callback de sa prise (thread UI).
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._thread: Optional[QThread] = None
+        self._worker: Optional[_TranscriptionWorker] = None
+        self._next_job_id = 1
+        self._on_done: dict[int, Callable[[TranscriptionResult], None]] = {}
+        self._on_partial: dict[int, Callable[[int, str], None]] = {}
+        self._timer_slots: list[Callable[[float], None]] = []
+        self._history_slots: list[Callable[[int], None]] = []
+        self._thread_priority = QThread.Priority.NormalPriority
+
+        # Pool de décodage parallèle arrêté quand plus aucune prise n’est en cours
+        self._pool_idle_timer = QTimer(self)
+        self._pool_idle_timer.setSingleShot(True)
+        self._pool_idle_timer.setInterval(int(config.chunking.pool_idle_seconds * 1000))
+        self._pool_idle_timer.timeout.connect(self._shutdown_idle_pool)
 
-class WhisperService:
     def transcribe(self, callback: Callable[[Optional[str]], None]):
         """
-        Transcrit un fichier audio via WhisperManager et transmet le texte au callback.
-        :param audio_path: Chemin vers le fichier .wav à transcrire.
+        Transcrit la dernière prise (en mémoire) via WhisperManager
+        et transmet le texte au callback.
         :param callback: Fonction à appeler une fois la transcription terminée.
         """
-        audio_path = audio_service.get_last_audio_path()
+        audio = audio_service.get_last_audio()
 
         # Vérifier si un modèle est chargé
         if not is_model_loaded():
@@ -68,22 +287,21 @@ class WhisperService:
             callback(None)
             return
 
-        # Vérifier si le fichier audio existe
-        if not os.path.exists(audio_path):
-            print(f"[ERREUR] Fichier audio introuvable : {audio_path}")
+        # Vérifier qu’une prise est disponible
+        if audio is None:
+            print("[ERREUR] Aucune prise audio disponible.")
             callback(None)
             return
 
         try:
             # Lancer la transcription
-            print(f"[INFO] Début de la transcription pour : {audio_path}")
-            transcribed_text = transcribe(audio_path)
-
-            # Ajouter la phrase de conclusion si activée
-            if get_include_conclusion():
-                conclusion_text = get_conclusion_text()
-                if conclusion_text:
-                    transcribed_text += f"\n\n{conclusion_text}"
+            print(f"[INFO] Début de la transcription ({len(audio)} échantillons)")
+            audio, removed = _trim_silence(audio)
+            print(f"[INFO] {removed:.1f}s de silence retirées.")
+            text, cached = _cached_transcribe(audio) if len(audio) else ("", False)
+            if cached:
+                print("[INFO] Transcription servie par le cache.")
+            transcribed_text = _with_conclusion(text)
 
             print("[INFO] Transcription terminée.")
             callback(transcribed_text)
@@ -91,45 +309,203 @@ class WhisperService:
             print(f"[ERREUR] Échec de la transcription : {e}")
             callback(None)
 
-    def transcribe_async(self, callback: Callable[[Optional[str]], None]):
-        audio_path = audio_service.get_last_audio_path()
+    # === File de transcription ===
 
+    def start_job(
+        self,
+        on_done: Callable[[TranscriptionResult], None],
+        on_partial: Optional[Callable[[int, str], None]] = None,
+    ) -> Optional[int]:
+        """
+        Réserve un identifiant pour une nouvelle prise.
+        :param on_done: Reçoit le TranscriptionResult de la prise.
+        :param on_partial: Reçoit (job_id, texte) pour chaque segment en mode continu.
+        :return: L’identifiant de la prise, ou None si aucun modèle n’est chargé.
+        """
         if not is_model_loaded():
             print("[ERREUR] Aucun modèle chargé.")
-            callback(None)
+            return None
+
+        self._ensure_worker()
+
+        self._pool_idle_timer.stop()
+
+        job_id = self._next_job_id
+        self._next_job_id += 1
+        self._on_done[job_id] = on_done
+        if on_partial:
+            self._on_partial[job_id] = on_partial
+
+        self._update_pending_state()
+        return job_id
+
+    def on_recording_time(self, seconds: float):
+        """
+        Slot du chronomètre d’une prise complète (pas en mode continu) : le pool
+        de décodage parallèle est chargé dès que la prise devient longue,
+        pendant que l’enregistrement continue.
+        """
+        if seconds >= config.chunking.min_parallel_seconds:
+            _parallel.prepare()
+
+    def submit_take(self, job_id: int, buffer):
+        """
+        Met en file une prise complète (AudioBuffer), convertie dans le thread de travail.
+        """
+        if buffer is None or len(buffer) == 0:
+            print(f"[ERREUR] Prise {job_id} vide.")
+            self._deliver(TranscriptionResult(job_id=job_id, text=None))
             return
+        self._worker.put((ITEM_TAKE, job_id, buffer))
 
-        if not os.path.exists(audio_path):
-            print(f"[ERREUR] Fichier audio introuvable : {audio_path}")
-            callback(None)
+    def segment_sink(self, job_id: int) -> Callable:
+        """
+        Retourne le segment_sink d’une prise en mode continu pour audio_service :
+        chaque segment est mis en file, None termine la prise.
+        """
+        worker = self._worker
+
+        def sink(samples):
+            if samples is None:
+                worker.put((ITEM_END, job_id, None))
+            else:
+                worker.put((ITEM_SEGMENT, job_id, samples))
+
+        return sink
+
+    def mark_stopped(self, job_id: int):
+        """
+        Signale l’arrêt de l’enregistrement de la prise (référence des latences).
+        """
+        if self._worker:
+            self._worker.mark_stopped(job_id)
+
+    def pending_jobs(self) -> int:
+        return len(self._on_done)
+
+    def transcribe_async(self, callback: Callable[[TranscriptionResult], None]):
+        """
+        Met en file la dernière prise enregistrée.
+        """
+        job_id = self.start_job(callback)
+        if job_id is None:
+            callback(TranscriptionResult(job_id=0, text=None))
+            return
+        self.submit_take(job_id, audio_service.last_buffer)
+
+    def _ensure_worker(self):
+        if self._worker is not None:
             return
 
         self._thread = QThread()
-        self._worker = _AsyncTranscriber(audio_path)
+        self._worker = _TranscriptionWorker()
         self._worker.moveToThread(self._thread)
 
         self._thread.started.connect(self._worker.run)
-        self._worker.finished.connect(callback)
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
+        self._worker.partial.connect(self._dispatch_partial)
+        self._worker.job_done.connect(self._deliver)
+        self._worker.update_time.connect(self._dispatch_time)
+
+        self._thread.start(self._thread_priority)
+
+    def set_thread_priority(self, priority: QThread.Priority):
+        """
+        Priorité du thread de transcription (baissée pendant les enregistrements).
+        """
+        self._thread_priority = priority
+        if self._thread is not None and self._thread.isRunning():
+            self._thread.setPriority(priority)
+
+    def _dispatch_partial(self, job_id: int, text: str):
+        callback = self._on_partial.get(job_id)
+        if callback:
+            callback(job_id, text)
 
-        self._thread.start()
+    def _dispatch_time(self, job_id: int, seconds: float):
+        for slot in self._timer_slots[:]:
+            try:
+                slot(seconds)
+            except RuntimeError:
+                self._timer_slots.remove(slot)
 
-        def on_thread_finished():
-            print("[DEBUG] Thread transcription terminé proprement.")
+    def _deliver(self, result: TranscriptionResult):
+        callback = self._on_done.pop(result.job_id, None)
+        self._on_partial.pop(result.job_id, None)
+        self._record_benchmark(result)
+        self._record_history(result)
+        self._update_pending_state()
+        if self.pending_jobs() == 0 and _parallel.is_running:
+            self._pool_idle_timer.start()
+        if callback:
+            callback(result)
 
-        self._thread.finished.connect(on_thread_finished)
+    def _record_benchmark(self, result: TranscriptionResult):
+        """
+        Mémorise le facteur temps réel (décodage / durée audio) du modèle utilisé.
+        """
+        if result.text is None or not result.model:
+            return
+        if result.audio_seconds < MIN_BENCHMARK_AUDIO_SECONDS:
+            return
+        record_model_benchmark(
+            result.model, rtf=result.decode_seconds / result.audio_seconds
+        )
+
+    def _record_history(self, result: TranscriptionResult):
+        """
+        Garde la dictée dans l’historique, avec le fichier audio de la prise s’il a été archivé.
+        """
+        audio_path = audio_service.pop_take_audio_path(result.job_id)
+        if not result.text:
+            return
+
+        try:
+            entry_id = transcription_history.add(
+                result.text,
+                audio_seconds=result.audio_seconds,
+                decode_seconds=result.decode_seconds,
+                latency_seconds=result.latency_seconds,
+                silence_removed_seconds=result.silence_removed_seconds,
+                model=result.model,
+                audio_path=str(audio_path) if audio_path else None,
+            )
+        except sqlite3.Error as e:
+            print(f"[ERREUR] Historique non enregistré : {e}")
+            return
+
+        for slot in self._history_slots[:]:
+            try:
+                slot(entry_id)
+            except RuntimeError:
+                self._history_slots.remove(slot)
+
+    def _update_pending_state(self):
+        parlia_state.set_pending_jobs(self.pending_jobs())
+
+    def _shutdown_idle_pool(self):
+        if self.pending_jobs() == 0:
+            print("[INFO] Pool de décodage parallèle arrêté (inactif).")
+            _parallel.shutdown()
 
     def connect_transcription_timer(self, slot):
-        if hasattr(self, "_worker") and self._worker:
-            self._worker.update_time.connect(slot)
+        if slot not in self._timer_slots:
+            self._timer_slots.append(slot)
+
+    def connect_history_added(self, slot):
+        if slot not in self._history_slots:
+            self._history_slots.append(slot)
 
     def cleanup(self):
-        if hasattr(self, "_thread") and self._thread.isRunning():
+        self._pool_idle_timer.stop()
+        _parallel.shutdown()
+        _result_cache.flush()
+        if self._thread is not None and self._thread.isRunning():
             print("[INFO] Attente de la fin du thread transcription...")
+            self._worker.stop()
             self._thread.quit()
             self._thread.wait()
+        self._thread = None
+        self._worker = None
 
 
 whisper_service = WhisperService()
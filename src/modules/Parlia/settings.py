@@ -7,6 +7,14 @@ class ParliaSettings:
     LABEL_MAX_DURATION: str = "Durée max :"
     LABEL_RECORDING_TIME: str = "Temps d'enregistrement :"
     LABEL_TRANSCRIPTION_TIME: str = "Temps de transcription :"
+    LABEL_TAKE_DEGRADED: str = "⚠ Prise dégradée : de l’audio a pu manquer"
+    LABEL_TAKE_HEALTH_DETAILS: str = (
+        "Débordements : {overflows} · Échantillons perdus : {dropped}\n"
+        "Vidages en retard : {late} · Gigue : {jitter:.1f} ms\n"
+        "Fréquence effective : {rate:.0f} Hz ({error:+.2%})"
+    )
+    LABEL_LEVEL_METER: str = "{dbfs:.0f} dB"
+    LABEL_LEVEL_CLIPPING: str = "Saturation : baissez le gain du micro"
     LABEL_TIMER_DEFAULT: str = "00:00"
 
     LABEL_TRANSCRIBED_TEXT: str = "Texte transcrit..."
@@ -31,6 +39,14 @@ class ParliaSettings:
     LABEL_EXPLAIN_CODE: str = "Expliquer le code"
     LABEL_ANALYZE_CODE: str = "Analyser le code"
 
+    # History Panel Labels
+    LABEL_HISTORY_SEARCH: str = "Rechercher dans les dictées..."
+    LABEL_HISTORY_COUNT: str = "{count} dictée(s)"
+    LABEL_HISTORY_COPY: str = "Copier"
+    LABEL_HISTORY_REUSE: str = "Réutiliser"
+    LABEL_HISTORY_ITEM_DETAILS: str = "{date} · {seconds:.0f} s · {model}"
+    LABEL_HISTORY_AUDIO: str = "Audio : {path}"
+
     # Settings Panel Labels
     LABEL_CURRENT_MODEL: str = "Modèle en cours : Aucun"
     LABEL_CHOOSE_FOLDER: str = "Choisir dossier"
@@ -47,6 +63,36 @@ class ParliaSettings:
     LABEL_NO_MODEL_SELECTED: str = "Aucun modèle sélectionné"
     LABEL_NO_MODEL_FOUND: str = "Aucun modèle trouvé dans le dossier."
 
+    LABEL_STREAMING: str = "Transcrire pendant l'enregistrement (mode continu)"
+    LABEL_ARCHIVE_AUDIO: str = "Archiver l'audio de chaque prise (WAV)"
+    LABEL_TRIM_SILENCE: str = "Retirer les silences avant la transcription"
+    LABEL_PREROLL: str = "Garder le micro armé (capte les mots dits avant le raccourci)"
+    LABEL_MODEL_CACHE_BUDGET: str = "Mémoire max des modèles (Mo) :"
+    LABEL_ENGINE: str = "Moteur :"
+    LABEL_MODEL_INT8: str = "{name} (int8)"
+    LABEL_MODEL_LOAD_TIME: str = "chargement {seconds:.1f} s"
+    LABEL_MODEL_RTF: str = "RTF {rtf:.2f}"
+    LABEL_DISK_RECORDING: str = (
+        "Enregistrer sur disque (sessions longues, récupérables après un crash)"
+    )
+    LABEL_ARCHIVE_FORMAT: str = "Format d’archive :"
+    LABEL_ARCHIVE_FORMAT_WAV: str = "WAV (sans compression)"
+    LABEL_ARCHIVE_FORMAT_FLAC: str = "FLAC (sans perte)"
+    LABEL_ARCHIVE_FORMAT_OPUS: str = "Opus (compact)"
+    LABEL_CAPTURE_PROCESS: str = (
+        "Capturer dans un processus séparé (aucune coupure pendant le décodage)"
+    )
+    LABEL_AUTO_STOP: str = "Arrêt automatique :"
+    LABEL_AUTO_STOP_OFF: str = "Désactivé"
+    LABEL_AUTO_STOP_SILENCE: str = "après {seconds:g} s de silence"
+    LABEL_CPU_PRESET: str = "Priorité CPU :"
+    LABEL_CPU_PRESET_LATENCY: str = "Latence (capture prioritaire)"
+    LABEL_CPU_PRESET_BALANCED: str = "Équilibré"
+    LABEL_CPU_PRESET_THROUGHPUT: str = "Débit (transcription prioritaire)"
+    LABEL_CPU_COUNTERS: str = (
+        "Débordements audio : {overflows} · Blocages UI : {stalls}"
+    )
+
     LABEL_CURRENT_MODEL: str = "Modèle en cours : {model_name}"
     LABEL_CURRENT_FOLDER: str = "Dossier sélectionné : {folder}"
 
@@ -54,3 +100,4 @@ class ParliaSettings:
     LABEL_SETTINGS_TITLE: str = "⚙️ Paramètres Whisper"
     LABEL_TRANSCRIPTION_TITLE: str = "📝 Transcription"
     LABEL_ACTIONS_TITLE: str = "🔧 Actions"
+    LABEL_HISTORY_TITLE: str = "🕘 Historique"
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from modules.parlia.batch import (
+    FORMAT_JSONL,
+    FORMAT_TEXT,
+    collect_files,
+    format_result,
+    read_done_files,
+)
+
+SRC_DIR = Path(__file__).resolve().parents[3]
+
+
+def test_collect_files_keeps_audio_only(tmp_path):
+    # Arrange
+    (tmp_path / "b.wav").touch()
+    (tmp_path / "a.MP3").touch()
+    (tmp_path / "notes.txt").touch()
+
+    # Act
+    files = collect_files(str(tmp_path))
+
+    # Assert
+    assert [f.name for f in files] == ["a.MP3", "b.wav"]
+
+
+def test_done_files_are_read_back_for_resume(tmp_path):
+    for output_format in (FORMAT_JSONL, FORMAT_TEXT):
+        # Arrange
+        output = tmp_path / f"out.{output_format}"
+        with open(output, "w", encoding="utf-8") as f:
+            f.write(format_result({"file": "/a.wav", "text": "bonjour"}, output_format))
+            if output_format == FORMAT_JSONL:
+                f.write(format_result({"file": "/b.wav", "error": "x"}, output_format))
+                f.write('{"file": "/c.wav", "te')  # Ligne tronquée
+
+        # Act
+        done = read_done_files(output, output_format)
+
+        # Assert : les échecs et les lignes tronquées sont retentés
+        assert done == {"/a.wav"}
+
+
+def test_batch_does_not_import_qt(tmp_path):
+    # Arrange : user_data/ est créé dans le dossier courant, pas dans src/
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+
+    # Act
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, modules.parlia.batch; sys.exit('PySide6' in sys.modules)",
+        ],
+        cwd=tmp_path,
+        env=env,
+    )
+
+    # Assert
+    assert result.returncode == 0
@@ -0,0 +1,35 @@
+import time
+
+import pytest
+
+from modules.parlia.core.capture_process import CaptureProcess
+
+
+def test_begin_does_not_wait_for_a_dead_process():
+    # Arrange
+    capture = CaptureProcess(16, timeout=30.0)
+    capture._process.terminate()
+    capture._process.join()
+    start = time.monotonic()
+
+    # Act / Assert : redémarré, puis échec ou accusé bien avant le délai
+    try:
+        capture.begin(16000, 1024)
+    except OSError:
+        pass
+    else:
+        capture.end()
+        capture.release()
+    assert time.monotonic() - start < capture.timeout / 2
+    capture.shutdown()
+
+
+def test_a_busy_process_is_reported():
+    # Arrange
+    capture = CaptureProcess(16, timeout=0.1)
+    capture._in_use.acquire()
+
+    # Act / Assert
+    with pytest.raises(OSError):
+        capture.begin(16000, 1024)
+    capture.shutdown()
@@ -0,0 +1,42 @@
+import numpy as np
+
+from modules.parlia.core.chunking import plan_chunks, stitch_texts
+
+RATE = 1000
+
+
+def test_chunks_cover_audio_and_overlap_at_quiet_points():
+    # Arrange : du "son" avec un silence vers 9 s et vers 18 s
+    audio = np.ones(25 * RATE, dtype=np.float32)
+    audio[9 * RATE : 9 * RATE + 200] = 0
+    audio[18 * RATE : 18 * RATE + 200] = 0
+
+    # Act
+    chunks = plan_chunks(
+        audio, RATE, chunk_seconds=10, search_seconds=2, overlap_seconds=0.5
+    )
+
+    # Assert
+    assert len(chunks) == 3
+    assert chunks[0][0] == 0 and chunks[-1][1] == len(audio)
+    assert 9 * RATE <= chunks[0][1] < 9 * RATE + 200
+    for (_, previous_end), (start, _) in zip(chunks, chunks[1:]):
+        assert start == previous_end - RATE // 2
+
+
+def test_short_audio_is_a_single_chunk():
+    # Act
+    chunks = plan_chunks(np.zeros(RATE), RATE, 10, 2, 0.5)
+
+    # Assert
+    assert chunks == [(0, RATE)]
+
+
+def test_stitch_removes_words_repeated_at_seams():
+    # Act
+    text = stitch_texts(
+        ["Bonjour à tous, merci d'être", "Merci d'être venus ce matin.", "Ce matin."]
+    )
+
+    # Assert
+    assert text == "Bonjour à tous, merci d'être venus ce matin."
@@ -0,0 +1,53 @@
+import wave
+
+import numpy as np
+
+from modules.parlia.core.disk_audio import DiskAudioBuffer, recover_partial_recordings
+
+
+def test_streams_blocks_to_disk_and_reads_them_back(tmp_path):
+    # Arrange
+    buffer = DiskAudioBuffer(tmp_path / "take.wav", 16000, block_seconds=0.001)
+    samples = np.arange(100, dtype=np.int16)
+
+    # Act
+    buffer.append(samples[:37])
+    buffer.append(samples[37:])
+    during = buffer.samples(10, 90)
+    path = buffer.finalize()
+
+    # Assert
+    assert during.tolist() == list(range(10, 90))
+    assert buffer.samples().tolist() == list(range(100))
+    with wave.open(str(path), "rb") as wf:
+        assert wf.getnframes() == 100
+        assert wf.getframerate() == 16000
+
+
+def test_capacity_limits_the_take(tmp_path):
+    # Arrange
+    buffer = DiskAudioBuffer(tmp_path / "take.wav", 100, capacity_seconds=0.5)
+
+    # Act
+    complete = buffer.append(np.ones(80, dtype=np.int16))
+
+    # Assert
+    assert not complete
+    assert len(buffer) == 50
+    assert buffer.is_full
+
+
+def test_interrupted_take_is_recovered(tmp_path):
+    # Arrange : bloc de 16 échantillons, prise jamais finalisée (crash simulé)
+    buffer = DiskAudioBuffer(tmp_path / "take.wav", 16000, block_seconds=0.001)
+    buffer.append(np.arange(40, dtype=np.int16))
+    buffer._file.close()
+
+    # Act
+    recovered = recover_partial_recordings(tmp_path)
+
+    # Assert
+    assert [p.name for p in recovered] == ["take.recovered.wav"]
+    with wave.open(str(recovered[0]), "rb") as wf:
+        frames = np.frombuffer(wf.readframes(wf.getnframes()), dtype=np.int16)
+    assert frames.tolist() == list(range(32))
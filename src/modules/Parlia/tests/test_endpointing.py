@@ -0,0 +1,60 @@
+import numpy as np
+
+from modules.parlia.core.endpointing import EndpointDetector
+
+RATE = 16000
+
+
+def _blocks(signal: np.ndarray, size: int = 800):
+    return [signal[i : i + size] for i in range(0, len(signal), size)]
+
+
+def _noise(seconds: float, level: float = 0.001) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (rng.standard_normal(int(seconds * RATE)) * level).astype(np.float32)
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def test_stops_after_trailing_silence_following_speech():
+    # Arrange
+    detector = EndpointDetector(RATE, silence_seconds=1.0)
+    signal = np.concatenate((_noise(0.5), _tone(1.0), _noise(2.0)))
+
+    # Act
+    stopped_at = None
+    for index, block in enumerate(_blocks(signal)):
+        if detector.process(block):
+            stopped_at = (index + 1) * 800 / RATE
+            break
+
+    # Assert
+    assert stopped_at is not None
+    assert 2.4 <= stopped_at <= 2.7
+
+
+def test_silence_alone_never_ends_the_take():
+    # Arrange
+    detector = EndpointDetector(RATE, silence_seconds=0.5)
+
+    # Act
+    results = [detector.process(block) for block in _blocks(_noise(3.0))]
+
+    # Assert
+    assert not any(results)
+
+
+def test_accepts_int16_blocks():
+    # Arrange
+    detector = EndpointDetector(RATE, silence_seconds=0.5)
+    signal = np.concatenate((_noise(0.3), _tone(0.6), _noise(1.0)))
+    pcm = (signal * 32767).astype(np.int16)
+
+    # Act
+    results = [detector.process(block) for block in _blocks(pcm, 1000)]
+
+    # Assert
+    assert results[-1]
@@ -0,0 +1,48 @@
+from modules.parlia.db.history_db import TranscriptionHistory, fts_query
+
+
+def test_fts_query_ignores_punctuation():
+    # Act
+    query = fts_query('réunion "budget" (2024) -')
+
+    # Assert
+    assert query == '"réunion"* "budget"* "2024"*'
+
+
+def test_search_matches_prefixes_without_accents(tmp_path):
+    # Arrange
+    history = TranscriptionHistory(tmp_path / "history.db")
+    history.add("Compte rendu de la réunion budget", model="openai:small")
+    history.add("Liste de courses : pain, lait")
+    history.add("Prochaine reunion lundi")
+
+    # Act
+    results = history.search("REUN")
+
+    # Assert : les plus récentes d’abord
+    assert [entry.text for entry in results] == [
+        "Prochaine reunion lundi",
+        "Compte rendu de la réunion budget",
+    ]
+    assert results[1].model == "openai:small"
+    assert history.count("reun") == 2
+    assert history.count() == 3
+    history.close()
+
+
+def test_pages_follow_the_last_id(tmp_path):
+    # Arrange
+    history = TranscriptionHistory(tmp_path / "history.db")
+    for index in range(7):
+        history.add(f"Dictée {index}")
+
+    # Act
+    first = history.search(limit=3)
+    second = history.search(before_id=first[-1].id, limit=3)
+    last = history.search(before_id=second[-1].id, limit=3)
+
+    # Assert
+    assert [e.text for e in first] == ["Dictée 6", "Dictée 5", "Dictée 4"]
+    assert [e.text for e in second] == ["Dictée 3", "Dictée 2", "Dictée 1"]
+    assert [e.text for e in last] == ["Dictée 0"]
+    history.close()
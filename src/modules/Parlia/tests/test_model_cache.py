@@ -0,0 +1,52 @@
+from modules.parlia.core.model_cache import ModelCache
+
+
+def _cache(budget: int) -> ModelCache:
+    # Les "modèles" sont des entiers : leur taille est leur valeur
+    return ModelCache(budget, size_of=lambda model: model)
+
+
+def test_get_counts_hits_and_misses():
+    # Arrange
+    cache = _cache(100)
+    cache.put("tiny", 10)
+
+    # Act
+    hit = cache.get("tiny")
+    miss = cache.get("small")
+
+    # Assert
+    assert hit == 10
+    assert miss is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_put_evicts_least_recently_used_over_budget():
+    # Arrange
+    cache = _cache(100)
+    cache.put("tiny", 40)
+    cache.put("base", 40)
+    cache.get("tiny")  # "base" devient le moins récent
+
+    # Act
+    evicted = cache.put("small", 40)
+
+    # Assert
+    assert evicted == ["base"]
+    assert cache.keys() == ["tiny", "small"]
+    assert cache.evictions == 1
+
+
+def test_put_never_evicts_the_new_model():
+    # Arrange
+    cache = _cache(50)
+    cache.put("tiny", 10)
+
+    # Act
+    evicted = cache.put("large", 500)
+
+    # Assert
+    assert evicted == ["tiny"]
+    assert "large" in cache
+    assert cache.total_bytes == 500
@@ -0,0 +1,41 @@
+from modules.parlia.core import whisper_manager
+from modules.parlia.core.parallel_transcriber import ParallelTranscriber
+
+
+def test_single_worker_never_starts_a_pool():
+    # Arrange
+    parallel = ParallelTranscriber(workers=1)
+
+    # Act
+    parallel.prepare()
+
+    # Assert : un seul processus ne découperait rien, inutile d’en charger le modèle
+    assert not parallel.is_running
+
+
+def test_no_pool_without_a_loaded_model():
+    # Arrange
+    parallel = ParallelTranscriber(workers=2)
+
+    # Act
+    parallel.prepare()
+
+    # Assert
+    assert not parallel.is_running
+
+
+def test_pool_is_started_once_then_shut_down(monkeypatch):
+    # Arrange : modèle "chargé" sans rien charger (les processus ne démarrent qu’à la 1re tâche)
+    monkeypatch.setattr(
+        whisper_manager, "get_current_model_key", lambda: "whisper:tiny"
+    )
+    parallel = ParallelTranscriber(workers=2)
+
+    # Act
+    pool = parallel._ensure_pool()
+    same_pool = parallel._ensure_pool()
+    parallel.shutdown()
+
+    # Assert
+    assert pool is not None and same_pool is pool
+    assert not parallel.is_running
@@ -0,0 +1,18 @@
+from modules.parlia.services.parlia_state_manager import ParliaStateManager
+
+
+def test_no_duration_requires_disk_recording():
+    # Arrange : attributs posés directement, les setters rafraîchissent l’interface Qt
+    state = ParliaStateManager()
+    state.whisper_ready = True
+    state.max_duration = 0
+
+    # Act
+    in_memory = state.is_ready_to_record()
+    state.disk_recording = True
+    on_disk = state.is_ready_to_record()
+
+    # Assert : « Aucun temps » = prise sur disque sans limite
+    assert not in_memory
+    assert on_disk
+    assert state.get_status_info() == ("Prêt", "ready")
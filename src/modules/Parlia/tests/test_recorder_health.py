@@ -0,0 +1,68 @@
+from modules.parlia.core.recorder_health import HealthMonitor
+
+
+def test_steady_drains_give_nominal_rate_and_no_jitter():
+    # Arrange
+    monitor = HealthMonitor(16000, interval_seconds=0.05)
+
+    # Act
+    for index in range(101):
+        monitor.on_drain(800, now=index * 0.05)
+    health = monitor.finish()
+
+    # Assert
+    assert abs(health.effective_rate - 16000) < 1
+    assert health.drain_jitter_ms < 1e-6
+    assert health.late_drains == 0
+    assert not health.is_degraded()
+
+
+def test_late_drain_and_dropped_samples_degrade_the_take():
+    # Arrange
+    monitor = HealthMonitor(16000, interval_seconds=0.05)
+    times = (
+        [i * 0.05 for i in range(50)]
+        + [2.45 + 0.3]
+        + [2.8 + i * 0.05 for i in range(10)]
+    )
+
+    # Act
+    for now in times:
+        monitor.on_drain(800, now=now)
+    health = monitor.finish(ring_overflows=1, dropped_samples=1200)
+
+    # Assert
+    assert health.late_drains == 1
+    assert health.max_drain_delay_ms > 200
+    assert health.drain_jitter_ms > 0
+    assert health.is_degraded()
+    assert health.to_dict()["dropped_samples"] == 1200
+
+
+def _simulate(rate, duration, phase, block=1024, interval=0.05, block_frames=1024):
+    """Vidages toutes les `interval` s d’un micro qui livre des blocs de `block` trames."""
+    monitor = HealthMonitor(16000, interval_seconds=interval, block_frames=block_frames)
+    delivered = 0
+    for index in range(int(duration / interval) + 1):
+        now = index * interval
+        available = int((now + phase) * rate / block) * block
+        monitor.on_drain(available - delivered, now=now)
+        delivered = available
+    return monitor.finish()
+
+
+def test_block_quantization_does_not_degrade_short_takes():
+    # Act : prises de 2,1 s à fréquence exacte, blocs de 64 ms à toutes les phases
+    takes = [_simulate(16000, 2.1, phase / 100) for phase in range(7)]
+
+    # Assert
+    assert all(health.effective_rate for health in takes)
+    assert not any(health.is_degraded(0.01) for health in takes)
+
+
+def test_real_clock_drift_still_degrades_the_take():
+    # Act : micro 3 % trop lent sur 10 s
+    health = _simulate(15520, 10.0, 0.02)
+
+    # Assert
+    assert health.is_degraded(0.01)
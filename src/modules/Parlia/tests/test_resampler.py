@@ -0,0 +1,39 @@
+import numpy as np
+
+from modules.parlia.core.resampler import PolyphaseResampler
+
+
+def _tone(frequency: float, rate: int, seconds: float = 2.0) -> np.ndarray:
+    t = np.arange(int(rate * seconds)) / rate
+    return (10000 * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+
+
+def _rms(samples: np.ndarray) -> float:
+    return float(np.sqrt(np.mean(samples[500:-500] ** 2)))
+
+
+def test_block_by_block_output_matches_rate_and_level():
+    for src_rate in (48000, 44100):
+        # Arrange
+        resampler = PolyphaseResampler(src_rate, 16000)
+        tone = _tone(440, src_rate)
+
+        # Act : blocs de tailles irrégulières, comme ceux du callback audio
+        out = np.concatenate(
+            [resampler.process(block) for block in np.array_split(tone, 37)]
+        )
+
+        # Assert
+        assert abs(len(out) - 32000) <= 1
+        assert abs(_rms(out) - 10000 / np.sqrt(2)) < 100
+
+
+def test_frequencies_above_new_nyquist_are_filtered():
+    # Arrange
+    resampler = PolyphaseResampler(48000, 16000)
+
+    # Act
+    out = resampler.process(_tone(10000, 48000))
+
+    # Assert
+    assert _rms(out) < 100
@@ -0,0 +1,51 @@
+import numpy as np
+
+from modules.parlia.core.ring_buffer import HistoryBuffer, RingBuffer
+
+
+def test_reads_back_in_order_across_the_wrap():
+    # Arrange
+    ring = RingBuffer(8)
+    ring.write(np.arange(6, dtype=np.int16))
+    ring.read(4)
+
+    # Act
+    ring.write(np.arange(6, 12, dtype=np.int16))
+    out = ring.read()
+
+    # Assert
+    assert out.tolist() == [4, 5, 6, 7, 8, 9, 10, 11]
+    assert len(ring) == 0
+
+
+def test_counts_overflow_and_underflow():
+    # Arrange
+    ring = RingBuffer(4)
+
+    # Act
+    written = ring.write(np.arange(6, dtype=np.int16))
+    ring.read()
+    empty = ring.read()
+
+    # Assert
+    assert written == 4
+    assert ring.overflows == 1
+    assert ring.dropped_samples == 2
+    assert ring.underflows == 1
+    assert len(empty) == 0
+
+
+def test_history_keeps_only_the_latest_samples():
+    # Arrange
+    history = HistoryBuffer(5)
+    history.write(np.arange(3, dtype=np.int16))
+
+    # Act
+    partial = history.snapshot()
+    history.write(np.arange(3, 7, dtype=np.int16))
+    history.write(np.arange(7, 20, dtype=np.int16))
+
+    # Assert
+    assert partial.tolist() == [0, 1, 2]
+    assert history.snapshot().tolist() == [15, 16, 17, 18, 19]
+    assert len(history) == 5
@@ -0,0 +1,48 @@
+import multiprocessing
+
+import numpy as np
+
+from modules.parlia.core.shared_ring_buffer import SharedRingBuffer
+
+
+def _produce(name: str, capacity: int):
+    ring = SharedRingBuffer.attach(name, capacity)
+    ring.write(np.arange(10, dtype=np.int16))
+    ring.count_device_status(overflow=True, underflow=False)
+    ring.close()
+
+
+def test_attached_producer_and_owner_share_the_same_ring():
+    # Arrange
+    owner = SharedRingBuffer.create(16)
+    producer = SharedRingBuffer.attach(owner.name, 16)
+
+    # Act
+    producer.write(np.arange(20, dtype=np.int16))
+    out = owner.read()
+
+    # Assert
+    assert out.tolist() == list(range(16))
+    assert owner.overflows == 1
+    assert owner.dropped_samples == 4
+    producer.close()
+    owner.close()
+
+
+def test_samples_written_by_another_process_are_read():
+    # Arrange
+    owner = SharedRingBuffer.create(32)
+    process = multiprocessing.get_context("spawn").Process(
+        target=_produce, args=(owner.name, 32)
+    )
+
+    # Act
+    process.start()
+    process.join(30)
+    out = owner.read()
+
+    # Assert
+    assert process.exitcode == 0
+    assert out.tolist() == list(range(10))
+    assert owner.device_overflows == 1
+    owner.close()
@@ -0,0 +1,48 @@
+import numpy as np
+
+from modules.parlia.core.telemetry import CoalescingChannel, InputLevels, measure_levels
+
+
+def test_measure_levels_reports_rms_peak_and_clipping():
+    # Arrange
+    samples = np.array([16384, -16384, 32767, -32768], dtype=np.int16)
+
+    # Act
+    levels = measure_levels(samples)
+
+    # Assert
+    assert levels.clipped_samples == 2
+    assert levels.peak == 1.0
+    assert abs(levels.rms - np.sqrt((0.25 + 0.25 + 1 + 1) / 4)) < 1e-3
+    assert levels.sample_count == 4
+
+
+def test_merge_weights_rms_by_sample_count():
+    # Arrange
+    loud = InputLevels(rms=1.0, peak=1.0, clipped_samples=1, sample_count=100)
+    silent = InputLevels(rms=0.0, peak=0.0, clipped_samples=0, sample_count=300)
+
+    # Act
+    merged = loud.merge(silent)
+
+    # Assert
+    assert merged.rms == 0.5
+    assert merged.peak == 1.0
+    assert merged.clipped_samples == 1
+    assert merged.sample_count == 400
+
+
+def test_channel_coalesces_values_between_deliveries():
+    # Arrange
+    channel = CoalescingChannel(max_rate_hz=20, merge=lambda a, b: a + b)
+
+    # Act
+    first = channel.publish(1, now=0.0)
+    held = [channel.publish(value, now=0.01 * value) for value in (2, 3, 4)]
+    second = channel.publish(5, now=0.06)
+
+    # Assert
+    assert first == 1
+    assert held == [None, None, None]
+    assert second == 2 + 3 + 4 + 5
+    assert channel.flush() is None
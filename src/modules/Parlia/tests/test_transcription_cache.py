@@ -0,0 +1,64 @@
+import numpy as np
+
+from modules.parlia.core.transcription_cache import TranscriptionCache, cache_key
+
+
+def test_cache_key_depends_on_audio_model_and_options():
+    # Arrange
+    audio = np.linspace(-1, 1, 16000, dtype=np.float32)
+
+    # Act
+    key = cache_key(audio, "whisper:tiny")
+
+    # Assert
+    assert key == cache_key(audio.copy(), "whisper:tiny", initial_prompt=None)
+    assert key != cache_key(audio, "whisper:base")
+    assert key != cache_key(audio, "whisper:tiny", initial_prompt="Bonjour")
+    assert key != cache_key(audio[::-1], "whisper:tiny")
+
+
+def test_put_evicts_least_recently_used():
+    # Arrange
+    cache = TranscriptionCache(None, max_entries=2)
+    cache.put("a", "premier")
+    cache.put("b", "second")
+    cache.get("a")  # "b" devient le moins récent
+
+    # Act
+    cache.put("c", "troisième")
+
+    # Assert
+    assert cache.get("b") is None
+    assert cache.get("a") == "premier"
+    assert cache.get("c") == "troisième"
+
+
+def test_entries_are_reloaded_from_disk(tmp_path):
+    # Arrange
+    path = tmp_path / "transcriptions.json"
+    cache = TranscriptionCache(path, max_entries=10)
+    cache.put("a", "texte transcrit")
+    cache.flush()
+
+    # Act
+    reloaded = TranscriptionCache(path, max_entries=10)
+
+    # Assert
+    assert reloaded.get("a") == "texte transcrit"
+    assert len(reloaded) == 1
+
+
+def test_puts_are_saved_together_after_the_delay(tmp_path):
+    # Arrange
+    path = tmp_path / "transcriptions.json"
+    cache = TranscriptionCache(path, max_entries=10, flush_delay=60)
+
+    # Act
+    cache.put("a", "premier")
+    cache.put("b", "second")
+    pending = path.exists()
+    cache.flush()
+
+    # Assert : rien n’est écrit pendant la transcription, tout part au flush
+    assert not pending
+    assert len(TranscriptionCache(path, max_entries=10)) == 2
@@ -0,0 +1,48 @@
+import pytest
+
+from modules.parlia.core.transcription_engines import (
+    TranscriptionEngine,
+    quantize_linear_layers,
+)
+
+
+class _IncompleteEngine(TranscriptionEngine):
+    name = "incomplet"
+
+    def is_available(self) -> bool:
+        return True
+
+
+def test_an_incomplete_engine_fails_at_construction():
+    # Act / Assert : pas d’échec différé en pleine transcription
+    with pytest.raises(TypeError):
+        _IncompleteEngine()
+
+
+def test_whisper_linear_layers_are_quantized():
+    # Arrange : Whisper utilise sa propre sous-classe de nn.Linear
+    torch = pytest.importorskip("torch")
+    whisper_model = pytest.importorskip("whisper.model")
+    model = torch.nn.Sequential(
+        whisper_model.Linear(8, 4), torch.nn.ReLU(), torch.nn.Linear(4, 2)
+    )
+
+    # Act
+    quantized = quantize_linear_layers(model)
+
+    # Assert
+    dynamic_linear = torch.ao.nn.quantized.dynamic.Linear
+    assert type(quantized[0]) is dynamic_linear
+    assert type(quantized[2]) is dynamic_linear
+    assert quantized(torch.randn(3, 8)).shape == (3, 2)
+
+
+def test_a_model_without_linear_layers_is_refused():
+    # Arrange
+    torch = pytest.importorskip("torch")
+    pytest.importorskip("whisper.model")
+    model = torch.nn.Sequential(torch.nn.ReLU())
+
+    # Act / Assert
+    with pytest.raises(RuntimeError):
+        quantize_linear_layers(model)
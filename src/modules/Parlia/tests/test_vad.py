@@ -0,0 +1,53 @@
+import numpy as np
+
+from modules.parlia.core.vad import trim_silence
+
+RATE = 16000
+
+
+def _tone(seconds: float) -> np.ndarray:
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (0.3 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    return (0.001 * rng.standard_normal(int(seconds * RATE))).astype(np.float32)
+
+
+def test_trims_edges_and_squeezes_long_pauses():
+    # Arrange
+    audio = np.concatenate([_silence(1), _tone(1), _silence(3), _tone(1), _silence(2)])
+
+    # Act
+    trimmed, removed = trim_silence(audio, RATE, max_pause_seconds=0.6)
+
+    # Assert : 2 s de son, 0,2 s de marge de part et d’autre de chaque son,
+    # et 0,6 s de la pause interne
+    assert 2.0 <= len(trimmed) / RATE <= 3.5
+    assert removed == (len(audio) - len(trimmed)) / RATE
+    assert removed > 4.5
+
+
+def test_keeps_continuous_speech_untouched():
+    # Arrange
+    audio = _tone(2)
+
+    # Act
+    trimmed, removed = trim_silence(audio, RATE)
+
+    # Assert
+    assert removed == 0.0
+    assert trimmed is audio
+
+
+def test_silence_only_is_removed_entirely():
+    # Arrange
+    audio = np.zeros(RATE, dtype=np.float32)
+
+    # Act
+    trimmed, removed = trim_silence(audio, RATE)
+
+    # Assert
+    assert len(trimmed) == 0
+    assert removed == 1.0
@@ -0,0 +1,191 @@
+from typing import Optional
+
+from PySide6.QtCore import Qt, QTimer
+from PySide6.QtWidgets import (
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QPushButton,
+    QVBoxLayout,
+    QWidget,
+)
+
+from modules.parlia.config import config
+from modules.parlia.db.history_db import HistoryEntry
+from modules.parlia.services.action_service import copy_to_clipboard
+from modules.parlia.services.parlia_state_manager import parlia_state
+from modules.parlia.services.whisper_service import (
+    transcription_history,
+    whisper_service,
+)
+from modules.parlia.settings import ParliaSettings
+from modules.parlia.ui.transcription_panel import TranscriptionPanel
+from modules.parlia.utils.stylesheet_loader import load_qss_for
+
+# Pages suivantes chargées quand il reste moins de ce nombre de lignes sous la vue
+LOAD_MORE_MARGIN_ROWS = 5
+
+
+class HistoryPanel(QWidget):
+    """
+    Dictées passées, des plus récentes aux plus anciennes. La recherche part
+    après une courte pause de frappe ; les pages suivantes se chargent au défilement.
+    """
+
+    def __init__(self, transcription_panel: TranscriptionPanel, parent=None):
+        super().__init__(parent)
+        self.transcription_panel = transcription_panel
+
+        self._search = ""
+        self._last_id: Optional[int] = None
+        self._has_more = False
+
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(config.history.search_delay_ms)
+        self._search_timer.timeout.connect(self.reload)
+
+        main_layout = QVBoxLayout()
+        main_layout.addLayout(self.create_search_line())
+        main_layout.addWidget(self.create_history_list())
+        main_layout.addLayout(self.create_buttons_line())
+        self.setLayout(main_layout)
+
+        load_qss_for(self)
+        parlia_state.register_ui_component(self)
+        whisper_service.connect_history_added(self._on_history_added)
+        self.reload()
+
+    def create_search_line(self) -> QHBoxLayout:
+        search_layout = QHBoxLayout()
+
+        self.search_input = QLineEdit()
+        self.search_input.setObjectName("historySearch")
+        self.search_input.setPlaceholderText(ParliaSettings.LABEL_HISTORY_SEARCH)
+        self.search_input.setClearButtonEnabled(True)
+        self.search_input.textChanged.connect(self._on_search_changed)
+
+        self.count_label = QLabel()
+        self.count_label.setObjectName("historyCount")
+
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(self.count_label)
+        return search_layout
+
+    def create_history_list(self) -> QListWidget:
+        self.history_list = QListWidget()
+        self.history_list.setObjectName("historyList")
+        self.history_list.setMaximumHeight(240)
+        # Lignes de même hauteur : Qt ne mesure pas chaque entrée au défilement
+        self.history_list.setUniformItemSizes(True)
+        self.history_list.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.history_list.currentItemChanged.connect(self.apply_ui_state)
+        self.history_list.itemDoubleClicked.connect(self._reuse_selected)
+        return self.history_list
+
+    def create_buttons_line(self) -> QHBoxLayout:
+        buttons_layout = QHBoxLayout()
+
+        self.copy_button = QPushButton(ParliaSettings.LABEL_HISTORY_COPY)
+        self.copy_button.setObjectName("historyCopyButton")
+        self.copy_button.clicked.connect(self._copy_selected)
+
+        self.reuse_button = QPushButton(ParliaSettings.LABEL_HISTORY_REUSE)
+        self.reuse_button.setObjectName("historyReuseButton")
+        self.reuse_button.clicked.connect(self._reuse_selected)
+
+        buttons_layout.addStretch()
+        buttons_layout.addWidget(self.copy_button)
+        buttons_layout.addWidget(self.reuse_button)
+        return buttons_layout
+
+    # === Chargement ===
+
+    def reload(self):
+        """
+        Recharge la première page pour la recherche en cours.
+        """
+        self._search = self.search_input.text().strip()
+        self._last_id = None
+        self._has_more = True
+        self.history_list.clear()
+        self.count_label.setText(
+            ParliaSettings.LABEL_HISTORY_COUNT.format(
+                count=transcription_history.count(self._search)
+            )
+        )
+        self._load_next_page()
+        self.apply_ui_state()
+
+    def _load_next_page(self):
+        page_size = config.history.page_size
+        entries = transcription_history.search(
+            self._search, before_id=self._last_id, limit=page_size
+        )
+        self._has_more = len(entries) == page_size
+        if entries:
+            self._last_id = entries[-1].id
+
+        for entry in entries:
+            self.history_list.addItem(self._create_item(entry))
+
+    def _create_item(self, entry: HistoryEntry) -> QListWidgetItem:
+        text = " ".join(entry.text.split())
+        preview_chars = config.history.preview_chars
+        if len(text) > preview_chars:
+            text = text[:preview_chars].rstrip() + "…"
+
+        details = ParliaSettings.LABEL_HISTORY_ITEM_DETAILS.format(
+            date=entry.created_at, seconds=entry.audio_seconds, model=entry.model
+        )
+        item = QListWidgetItem(f"{text}\n{details}")
+        item.setData(Qt.ItemDataRole.UserRole, entry)
+        if entry.audio_path:
+            item.setToolTip(
+                ParliaSettings.LABEL_HISTORY_AUDIO.format(path=entry.audio_path)
+            )
+        return item
+
+    def _on_search_changed(self, _text: str):
+        # Chaque frappe repousse la recherche : une seule requête par pause
+        self._search_timer.start()
+
+    def _on_scrolled(self, value: int):
+        if not self._has_more:
+            return
+        scroll_bar = self.history_list.verticalScrollBar()
+        if scroll_bar.maximum() - value <= LOAD_MORE_MARGIN_ROWS:
+            self._load_next_page()
+
+    def _on_history_added(self, entry_id: int):
+        self.reload()
+
+    # === Actions ===
+
+    def _selected_entry(self) -> Optional[HistoryEntry]:
+        item = self.history_list.currentItem()
+        return item.data(Qt.ItemDataRole.UserRole) if item else None
+
+    def _copy_selected(self):
+        entry = self._selected_entry()
+        if entry:
+            copy_to_clipboard(entry.text)
+
+    def _reuse_selected(self):
+        """
+        Remet la dictée dans la zone de transcription (actions, ChatGPT, VS Code…).
+        """
+        entry = self._selected_entry()
+        if entry is None or parlia_state.is_ui_locked():
+            return
+        self.transcription_panel.transcription_text.setPlainText(entry.text)
+
+    def apply_ui_state(self):
+        if not hasattr(self, "reuse_button"):
+            return
+        selected = self.history_list.currentItem() is not None
+        self.copy_button.setEnabled(selected)
+        # Pendant une prise, la zone de transcription reçoit le texte en cours
+        self.reuse_button.setEnabled(selected and not parlia_state.is_ui_locked())
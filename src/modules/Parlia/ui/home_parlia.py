@@ -10,10 +10,17 @@ from PySide6.QtWidgets import (
 
 from modules.parlia import ModuleInfo
 from modules.parlia.services import parlia_data
-from modules.parlia.services.parlia_data import get_max_duration
+from modules.parlia.services.audioService import audio_service
+from modules.parlia.services.cpu_governor import cpu_governor
+from modules.parlia.services.parlia_data import (
+    get_capture_process,
+    get_max_duration,
+    get_preroll_enabled,
+)
 from modules.parlia.services.parlia_state_manager import parlia_state
 from modules.parlia.settings import ParliaSettings
 from modules.parlia.ui.action_panel import ActionPanel
+from modules.parlia.ui.history_panel import HistoryPanel
 from modules.parlia.ui.settings_panel import SettingsPanel
 from modules.parlia.ui.transcription_panel import TranscriptionPanel
 from modules.parlia.utils import hotkeys
@@ -25,6 +32,9 @@ class ParliaHome(QWidget):
         print("[DEBUG] ✅ ParliaHome instancié")
         self.main_window = main_window
         self._build_ui()
+        cpu_governor.start()
+        audio_service.set_preroll_enabled(get_preroll_enabled())
+        audio_service.set_capture_process_enabled(get_capture_process())
         hotkeys.start_hotkey_listener(
             get_main_window=lambda: self.main_window,
             get_transcription_panel=lambda: self.transcription_panel,
@@ -48,6 +58,8 @@ class ParliaHome(QWidget):
         separator2 = self._create_separator()
         separator3 = self._create_separator()
         action_block = self._create_action_block()
+        separator4 = self._create_separator()
+        history_block = self._create_history_block()
 
         # On ajoute tout dans le bon ordre dans le layout
         layout.addWidget(title)
@@ -57,6 +69,8 @@ class ParliaHome(QWidget):
         layout.addWidget(transcription_block)
         layout.addWidget(separator3)
         layout.addWidget(action_block)
+        layout.addWidget(separator4)
+        layout.addWidget(history_block)
         layout.addStretch()
 
         self.setLayout(layout)
@@ -133,10 +147,36 @@ class ParliaHome(QWidget):
         container.setLayout(layout)
         return container
 
+    def _create_history_block(self) -> QWidget:
+        """
+        Crée un bloc pour l’historique des dictées.
+        """
+        container = QWidget()
+        layout = QVBoxLayout()
+        layout.setAlignment(Qt.AlignmentFlag.AlignTop)
+
+        label = QLabel(ParliaSettings.LABEL_HISTORY_TITLE)
+        label.setFont(QFont("Arial", 14, QFont.Weight.Normal))
+        layout.addWidget(label)
+
+        self.history_panel = HistoryPanel(
+            transcription_panel=self.transcription_panel, parent=self
+        )
+        layout.addWidget(self.history_panel)
+
+        container.setLayout(layout)
+        return container
+
     def cleanup(self):
+        cpu_governor.stop()
+        if not audio_service.is_recording:
+            audio_service.set_preroll_enabled(False)
+            audio_service.set_capture_process_enabled(False)
         if hasattr(self, "transcription_panel"):
             parlia_state.unregister_ui_component(self.transcription_panel)
         if hasattr(self, "action_panel"):
             parlia_state.unregister_ui_component(self.action_panel)
         if hasattr(self, "settings_panel"):
             parlia_state.unregister_ui_component(self.settings_panel)
+        if hasattr(self, "history_panel"):
+            parlia_state.unregister_ui_component(self.history_panel)
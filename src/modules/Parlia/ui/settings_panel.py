@@ -9,24 +9,59 @@ from PySide6.QtWidgets import (
     QLabel,
     QLineEdit,
     QPushButton,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
 
-from modules.parlia.core.whisper_manager import (
-    load_model,
-    unload_model,
+from modules.parlia.config import config
+from modules.parlia.core.disk_audio import FORMAT_FLAC, FORMAT_OPUS, FORMAT_WAV
+from modules.parlia.core.transcription_engines import (
+    INT8_SUFFIX,
+    available_engines,
+    get_engine,
 )
+from modules.parlia.core.whisper_manager import get_model_key, unload_model
+from modules.parlia.services.audioService import audio_service
+from modules.parlia.services.cpu_governor import (
+    PRESET_BALANCED,
+    PRESET_LATENCY,
+    PRESET_THROUGHPUT,
+    cpu_governor,
+)
+from modules.parlia.services.model_loader import model_loader
 from modules.parlia.services.parlia_data import (
+    get_archive_audio,
+    get_archive_format,
+    get_auto_stop_silence,
+    get_capture_process,
     get_conclusion_text,
+    get_disk_recording,
+    get_engine_name,
     get_include_conclusion,
+    get_model_benchmark,
+    get_model_cache_budget_mb,
     get_model_folder_path,
     get_model_name,
+    get_preroll_enabled,
+    get_streaming_enabled,
+    get_trim_silence,
+    set_archive_audio,
+    set_archive_format,
+    set_auto_stop_silence,
+    set_capture_process,
     set_conclusion_text,
+    set_disk_recording,
+    set_engine_name,
     set_include_conclusion,
+    set_model_cache_budget_mb,
     set_model_folder_path,
     set_model_name,
+    set_preroll_enabled,
+    set_streaming_enabled,
+    set_trim_silence,
 )
+from modules.parlia.services.parlia_state_manager import parlia_state
 from modules.parlia.settings import ParliaSettings
 from modules.parlia.utils.stylesheet_loader import load_qss_for
 
@@ -37,10 +72,15 @@ class SettingsPanel(QWidget):
         self.update_record_callback = update_record_callback
         self.current_folder = None
         self.model_list = []
+        self._was_transcribing = False
+        self._was_recording = False
         self._load_user_preferences()
         self._build_ui()
         load_qss_for(self)
 
+        # Les mesures (RTF) sont rafraîchies à la fin des transcriptions
+        parlia_state.register_ui_component(self)
+
     def _load_user_preferences(self):
         """
         Charger les préférences utilisateur sauvegardées.
@@ -57,6 +97,25 @@ class SettingsPanel(QWidget):
         # Charger le texte de la phrase de conclusion
         self.custom_conclusion_phrase = get_conclusion_text()
 
+        # Charger le mode de transcription en continu
+        self.streaming_state = get_streaming_enabled()
+
+        # Charger l’option d’archivage des prises
+        self.archive_audio_state = get_archive_audio()
+
+        # Charger l’enregistrement sur disque et le format d’archive
+        self.disk_recording_state = get_disk_recording()
+        self.archive_format = get_archive_format()
+
+        # Charger l’option de suppression des silences
+        self.trim_silence_state = get_trim_silence()
+
+        # Charger l’option de pré-enregistrement
+        self.preroll_state = get_preroll_enabled()
+
+        # Charger l’option de capture hors processus
+        self.capture_process_state = get_capture_process()
+
     def _build_ui(self):
         """
         Construire l'interface utilisateur principale.
@@ -67,6 +126,9 @@ class SettingsPanel(QWidget):
         # Ajouter la section du modèle
         self._add_model_section()
 
+        # Ajouter les options d’enregistrement (mode continu, archivage)
+        self._add_recording_options_section()
+
         # Ajouter la section de la phrase de conclusion
         self._add_conclusion_phrase_section()
 
@@ -92,6 +154,9 @@ class SettingsPanel(QWidget):
 
         self.main_layout.addSpacing(10)
 
+        # Ligne : moteur de transcription
+        self._add_engine_line()
+
         # ✅ Ligne combo + label
         model_line_layout = QHBoxLayout()
 
@@ -106,13 +171,24 @@ class SettingsPanel(QWidget):
         self.model_combobox.setObjectName("ModelComboBox")
         self.model_combobox.setWindowFlags(Qt.WindowType.Widget)
         self.model_combobox.setVisible(False)
-        self.model_combobox.currentTextChanged.connect(self._on_model_selected)
-        self.model_combobox.setFixedWidth(220)  # 🔧 Largeur fixe élégante
+        self.model_combobox.currentIndexChanged.connect(self._on_model_index_changed)
+        self.model_combobox.setFixedWidth(340)  # 🔧 Place pour les mesures du modèle
 
         # Ajout dans layout horizontal
         model_line_layout.addWidget(label)
         model_line_layout.addSpacing(10)  # 🔧 Petit écart visuel
         model_line_layout.addWidget(self.model_combobox)
+        model_line_layout.addSpacing(20)
+
+        # Budget mémoire du cache de modèles (LRU)
+        budget_label = QLabel(ParliaSettings.LABEL_MODEL_CACHE_BUDGET)
+        self.cache_budget_spinbox = QSpinBox()
+        self.cache_budget_spinbox.setRange(256, 65536)
+        self.cache_budget_spinbox.setSingleStep(256)
+        self.cache_budget_spinbox.setValue(get_model_cache_budget_mb())
+        self.cache_budget_spinbox.valueChanged.connect(set_model_cache_budget_mb)
+        model_line_layout.addWidget(budget_label)
+        model_line_layout.addWidget(self.cache_budget_spinbox)
         model_line_layout.addStretch()  # ✅ Repousse le reste à droite
 
         self.main_layout.addLayout(model_line_layout)
@@ -122,6 +198,238 @@ class SettingsPanel(QWidget):
             self._update_model_list()
             self._set_initial_model_selection()
 
+    def _add_engine_line(self):
+        """
+        Choix du moteur de transcription (seuls les moteurs installés sont proposés).
+        """
+        engine_line_layout = QHBoxLayout()
+
+        label = QLabel(ParliaSettings.LABEL_ENGINE)
+        label.setObjectName("ModelLabel")
+        label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        label.setFixedWidth(150)
+
+        self.engine_combobox = QComboBox(self)
+        self.engine_combobox.setObjectName("ModelComboBox")
+        self.engine_combobox.setFixedWidth(220)
+        for engine in available_engines():
+            self.engine_combobox.addItem(engine.label, userData=engine.name)
+
+        index = self.engine_combobox.findData(get_engine_name())
+        if index != -1:
+            self.engine_combobox.setCurrentIndex(index)
+        self.engine_combobox.currentIndexChanged.connect(self._on_engine_selected)
+
+        engine_line_layout.addWidget(label)
+        engine_line_layout.addSpacing(10)
+        engine_line_layout.addWidget(self.engine_combobox)
+        engine_line_layout.addStretch()
+
+        self.main_layout.addLayout(engine_line_layout)
+        self.main_layout.addSpacing(10)
+
+    def _on_engine_selected(self, index: int):
+        """
+        Change de moteur : la liste des modèles est reconstruite pour ce moteur,
+        ce qui recharge le modèle sélectionné avec lui.
+        """
+        engine_name = self.engine_combobox.itemData(index)
+        if not engine_name:
+            return
+
+        print(f"[INFO] Moteur sélectionné : {engine_name}")
+        set_engine_name(engine_name)
+        unload_model()
+        self._update_model_list()
+
+    def _add_recording_options_section(self):
+        """
+        Cases à cocher des options d’enregistrement :
+        - mode continu : les segments sont transcrits pendant l’enregistrement ;
+        - archivage : chaque prise est aussi écrite en WAV (ou FLAC/Opus) ;
+        - disque : la prise est écrite au fil de l’eau, sans limite de durée ;
+        - silences : retirés de l’audio avant le décodage.
+        """
+        self.main_layout.addSpacing(10)
+
+        self.streaming_checkbox = QCheckBox(ParliaSettings.LABEL_STREAMING)
+        self.streaming_checkbox.setChecked(self.streaming_state)
+        self.streaming_checkbox.toggled.connect(set_streaming_enabled)
+        self.main_layout.addWidget(self.streaming_checkbox)
+
+        self.archive_audio_checkbox = QCheckBox(ParliaSettings.LABEL_ARCHIVE_AUDIO)
+        self.archive_audio_checkbox.setChecked(self.archive_audio_state)
+        self.archive_audio_checkbox.toggled.connect(set_archive_audio)
+        self.main_layout.addWidget(self.archive_audio_checkbox)
+
+        self.disk_recording_checkbox = QCheckBox(ParliaSettings.LABEL_DISK_RECORDING)
+        self.disk_recording_checkbox.setChecked(self.disk_recording_state)
+        self.disk_recording_checkbox.toggled.connect(self._on_disk_recording_toggled)
+        self.main_layout.addWidget(self.disk_recording_checkbox)
+
+        self._add_archive_format_line()
+
+        self.trim_silence_checkbox = QCheckBox(ParliaSettings.LABEL_TRIM_SILENCE)
+        self.trim_silence_checkbox.setChecked(self.trim_silence_state)
+        self.trim_silence_checkbox.toggled.connect(set_trim_silence)
+        self.main_layout.addWidget(self.trim_silence_checkbox)
+
+        self.preroll_checkbox = QCheckBox(ParliaSettings.LABEL_PREROLL)
+        self.preroll_checkbox.setChecked(self.preroll_state)
+        self.preroll_checkbox.toggled.connect(self._on_preroll_toggled)
+        self.main_layout.addWidget(self.preroll_checkbox)
+
+        self.capture_process_checkbox = QCheckBox(ParliaSettings.LABEL_CAPTURE_PROCESS)
+        self.capture_process_checkbox.setChecked(self.capture_process_state)
+        self.capture_process_checkbox.toggled.connect(self._on_capture_process_toggled)
+        self.main_layout.addWidget(self.capture_process_checkbox)
+
+        self._add_auto_stop_line()
+        self._add_cpu_preset_line()
+
+    def _on_disk_recording_toggled(self, enabled: bool):
+        set_disk_recording(enabled)
+        parlia_state.set_disk_recording(enabled)
+
+    def _on_preroll_toggled(self, enabled: bool):
+        set_preroll_enabled(enabled)
+        audio_service.set_preroll_enabled(enabled)
+
+    def _add_archive_format_line(self):
+        """
+        Format des prises archivées ou enregistrées sur disque.
+        """
+        format_layout = QHBoxLayout()
+
+        label = QLabel(ParliaSettings.LABEL_ARCHIVE_FORMAT)
+        label.setObjectName("ModelLabel")
+        label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        label.setFixedWidth(150)
+
+        self.archive_format_combobox = QComboBox(self)
+        self.archive_format_combobox.setObjectName("ModelComboBox")
+        self.archive_format_combobox.setFixedWidth(220)
+        for archive_format, format_label in (
+            (FORMAT_WAV, ParliaSettings.LABEL_ARCHIVE_FORMAT_WAV),
+            (FORMAT_FLAC, ParliaSettings.LABEL_ARCHIVE_FORMAT_FLAC),
+            (FORMAT_OPUS, ParliaSettings.LABEL_ARCHIVE_FORMAT_OPUS),
+        ):
+            self.archive_format_combobox.addItem(format_label, userData=archive_format)
+
+        index = self.archive_format_combobox.findData(self.archive_format)
+        if index != -1:
+            self.archive_format_combobox.setCurrentIndex(index)
+        self.archive_format_combobox.currentIndexChanged.connect(
+            lambda i: set_archive_format(self.archive_format_combobox.itemData(i))
+        )
+
+        format_layout.addWidget(label)
+        format_layout.addSpacing(10)
+        format_layout.addWidget(self.archive_format_combobox)
+        format_layout.addStretch()
+        self.main_layout.addLayout(format_layout)
+
+    def _on_capture_process_toggled(self, enabled: bool):
+        set_capture_process(enabled)
+        audio_service.set_capture_process_enabled(enabled)
+
+    def _add_auto_stop_line(self):
+        """
+        Arrêt de la prise après un silence final (dictée mains libres).
+        """
+        self.main_layout.addSpacing(10)
+        auto_stop_layout = QHBoxLayout()
+
+        label = QLabel(ParliaSettings.LABEL_AUTO_STOP)
+        label.setObjectName("ModelLabel")
+        label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        label.setFixedWidth(150)
+
+        self.auto_stop_combobox = QComboBox(self)
+        self.auto_stop_combobox.setObjectName("ModelComboBox")
+        self.auto_stop_combobox.setFixedWidth(220)
+        for seconds in config.endpointing.silence_options:
+            option_label = (
+                ParliaSettings.LABEL_AUTO_STOP_SILENCE.format(seconds=seconds)
+                if seconds
+                else ParliaSettings.LABEL_AUTO_STOP_OFF
+            )
+            self.auto_stop_combobox.addItem(option_label, userData=seconds)
+
+        index = self.auto_stop_combobox.findData(get_auto_stop_silence())
+        if index != -1:
+            self.auto_stop_combobox.setCurrentIndex(index)
+        self.auto_stop_combobox.currentIndexChanged.connect(
+            lambda i: set_auto_stop_silence(self.auto_stop_combobox.itemData(i))
+        )
+
+        auto_stop_layout.addWidget(label)
+        auto_stop_layout.addSpacing(10)
+        auto_stop_layout.addWidget(self.auto_stop_combobox)
+        auto_stop_layout.addStretch()
+        self.main_layout.addLayout(auto_stop_layout)
+
+    def _add_cpu_preset_line(self):
+        """
+        Préréglage du gouverneur CPU, avec ses compteurs pour en mesurer l’effet.
+        """
+        self.main_layout.addSpacing(10)
+        cpu_line_layout = QHBoxLayout()
+
+        label = QLabel(ParliaSettings.LABEL_CPU_PRESET)
+        label.setObjectName("ModelLabel")
+        label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
+        label.setFixedWidth(150)
+
+        self.cpu_preset_combobox = QComboBox(self)
+        self.cpu_preset_combobox.setObjectName("ModelComboBox")
+        self.cpu_preset_combobox.setFixedWidth(220)
+        for preset, preset_label in (
+            (PRESET_LATENCY, ParliaSettings.LABEL_CPU_PRESET_LATENCY),
+            (PRESET_BALANCED, ParliaSettings.LABEL_CPU_PRESET_BALANCED),
+            (PRESET_THROUGHPUT, ParliaSettings.LABEL_CPU_PRESET_THROUGHPUT),
+        ):
+            self.cpu_preset_combobox.addItem(preset_label, userData=preset)
+
+        index = self.cpu_preset_combobox.findData(cpu_governor.preset_name)
+        if index != -1:
+            self.cpu_preset_combobox.setCurrentIndex(index)
+        self.cpu_preset_combobox.currentIndexChanged.connect(
+            self._on_cpu_preset_selected
+        )
+
+        self.cpu_counters_label = QLabel()
+        self.cpu_counters_label.setObjectName("PathLabel")
+        self._update_cpu_counters()
+
+        cpu_line_layout.addWidget(label)
+        cpu_line_layout.addSpacing(10)
+        cpu_line_layout.addWidget(self.cpu_preset_combobox)
+        cpu_line_layout.addSpacing(20)
+        cpu_line_layout.addWidget(self.cpu_counters_label)
+        cpu_line_layout.addStretch()
+
+        self.main_layout.addLayout(cpu_line_layout)
+
+    def _on_cpu_preset_selected(self, index: int):
+        preset = self.cpu_preset_combobox.itemData(index)
+        if not preset:
+            return
+
+        print(f"[INFO] Préréglage CPU sélectionné : {preset}")
+        cpu_governor.set_preset(preset)
+        # Compteurs remis à zéro : ils mesurent le nouveau préréglage
+        cpu_governor.reset_counters()
+        self._update_cpu_counters()
+
+    def _update_cpu_counters(self):
+        stats = cpu_governor.stats()
+        self.cpu_counters_label.setText(
+            ParliaSettings.LABEL_CPU_COUNTERS.format(
+                overflows=stats["audio_overflows"], stalls=stats["ui_stalls"]
+            )
+        )
+
     def _update_path_label(self):
         """Met à jour le texte du label du chemin du dossier."""
         if self.current_folder:
@@ -134,7 +442,7 @@ class SettingsPanel(QWidget):
     def _set_initial_model_selection(self):
         """Configure la sélection initiale dans la combo box des modèles."""
         if self.selected_model_name in self.model_list:
-            self.model_combobox.setCurrentText(self.selected_model_name)
+            self._select_model(self.selected_model_name)
             self.model_combobox.setVisible(True)
 
     def _add_conclusion_phrase_section(self):
@@ -271,9 +579,10 @@ class SettingsPanel(QWidget):
     def _update_model_list(self):
         """
         Met à jour la liste déroulante avec les modèles disponibles dans le dossier sélectionné.
-        - Affiche uniquement les fichiers .pt ou .bin.
+        - Affiche uniquement les modèles du moteur choisi (fichiers .pt/.bin pour Whisper,
+          dossiers convertis pour CTranslate2).
         - Sélectionne automatiquement le modèle sauvegardé si présent.
-        - Sinon, tente de sélectionner "tiny.pt" ou "tiny.bin" si présent.
+        - Sinon, tente de sélectionner "tiny.pt", "tiny.bin" ou "tiny" si présent.
         - Sinon, ne sélectionne rien.
         """
         if not self.current_folder or not os.path.isdir(self.current_folder):
@@ -281,26 +590,30 @@ class SettingsPanel(QWidget):
             self.model_combobox.setVisible(False)
             return
 
-        # Liste des fichiers .pt ou .bin
-        self.model_list = [
-            f for f in os.listdir(self.current_folder) if f.endswith((".pt", ".bin"))
-        ]
+        # Liste des modèles utilisables par le moteur choisi
+        engine = get_engine(get_engine_name())
+        self.model_list = engine.list_models(self.current_folder)
 
         if self.model_list:
             self.model_combobox.clear()
             self.model_combobox.addItem(
                 ParliaSettings.LABEL_NO_MODEL_SELECTED, userData=None
             )  # Valeur neutre
-            self.model_combobox.addItems(self.model_list)
+            for model_name in self.model_list:
+                self.model_combobox.addItem(
+                    self._model_label(model_name), userData=model_name
+                )
             self.model_combobox.setVisible(True)
 
             # Sélection modèle sauvegardé ou fallback tiny
             if self.selected_model_name and self.selected_model_name in self.model_list:
-                self.model_combobox.setCurrentText(self.selected_model_name)
+                self._select_model(self.selected_model_name)
             elif "tiny.pt" in self.model_list:
-                self.model_combobox.setCurrentText("tiny.pt")
+                self._select_model("tiny.pt")
             elif "tiny.bin" in self.model_list:
-                self.model_combobox.setCurrentText("tiny.bin")
+                self._select_model("tiny.bin")
+            elif "tiny" in self.model_list:
+                self._select_model("tiny")
             else:
                 # Aucun modèle par défaut trouvé, ne rien sélectionner
                 pass
@@ -308,11 +621,57 @@ class SettingsPanel(QWidget):
             self.model_combobox.setVisible(False)
             self.path_label.setText(ParliaSettings.LABEL_NO_MODEL_SELECTED)
 
+    def _select_model(self, model_name: str):
+        index = self.model_combobox.findData(model_name)
+        if index != -1:
+            self.model_combobox.setCurrentIndex(index)
+
+    def _model_label(self, model_name: str) -> str:
+        """
+        Libellé d’un modèle dans la liste : variante int8 signalée,
+        temps de chargement et facteur temps réel mesurés s’ils sont connus.
+        """
+        if model_name.endswith(INT8_SUFFIX):
+            label = ParliaSettings.LABEL_MODEL_INT8.format(
+                name=model_name[: -len(INT8_SUFFIX)]
+            )
+        else:
+            label = model_name
+
+        model_key = get_model_key(model_name)
+        benchmark = get_model_benchmark(model_key) if model_key else {}
+
+        measures = []
+        if "load_seconds" in benchmark:
+            measures.append(
+                ParliaSettings.LABEL_MODEL_LOAD_TIME.format(
+                    seconds=benchmark["load_seconds"]
+                )
+            )
+        if "rtf" in benchmark:
+            measures.append(ParliaSettings.LABEL_MODEL_RTF.format(rtf=benchmark["rtf"]))
+
+        if measures:
+            label += f" — {', '.join(measures)}"
+        return label
+
+    def _refresh_model_labels(self):
+        # L’entrée 0 est "Aucun modèle sélectionné"
+        for index in range(1, self.model_combobox.count()):
+            model_name = self.model_combobox.itemData(index)
+            self.model_combobox.setItemText(index, self._model_label(model_name))
+
+    def _on_model_index_changed(self, index: int):
+        if index < 0:
+            return
+        model_name = self.model_combobox.itemData(index)
+        self._on_model_selected(model_name or ParliaSettings.LABEL_NO_MODEL_SELECTED)
+
     def _on_model_selected(self, model_name):
         """
         Gère la sélection d’un modèle dans la liste déroulante.
         - Si "Aucun modèle sélectionné" : décharge le modèle en cours.
-        - Sinon : charge le modèle choisi.
+        - Sinon : charge le modèle choisi en arrière-plan.
         Met à jour l'affichage et les boutons d’enregistrement.
         """
         if model_name == ParliaSettings.LABEL_NO_MODEL_SELECTED:
@@ -329,10 +688,21 @@ class SettingsPanel(QWidget):
         if model_name:
             print(f"Modèle sélectionné _on_model_selected : {model_name}")
             set_model_name(model_name)
-            load_model(model_name)
 
-            if self.update_record_callback:
-                self.update_record_callback()
+            # Chargement en arrière-plan : l’UI reste réactive pendant ce temps
+            model_loader.load_async(model_name, on_done=self._on_model_loaded)
+
+    def _on_model_loaded(self, ok: bool):
+        """
+        Appelé dans le thread UI quand le modèle est chargé et préchauffé.
+        """
+        if not ok:
+            print("[ERREUR] Le modèle n'a pas pu être chargé.")
+
+        self._refresh_model_labels()
+
+        if self.update_record_callback:
+            self.update_record_callback()
 
     def set_conclusion_text(self, custom_phrase: str):
         """
@@ -349,6 +719,17 @@ class SettingsPanel(QWidget):
     def apply_ui_state(self):
         """
         Méthode obligatoire pour que ParliaStateManager puisse rafraîchir l'état des composants enregistrés.
-        Ici, on ne fait rien car SettingsPanel n'a pas de logique d'état dynamique.
+        Ici, seules les mesures sont mises à jour : compteurs CPU à la fin d’un enregistrement,
+        mesures des modèles quand la file de transcription se vide.
         """
-        pass
+        # Le flux armé et le processus de capture ne changent pas pendant une prise
+        self.preroll_checkbox.setEnabled(not parlia_state.is_recording)
+        self.capture_process_checkbox.setEnabled(not parlia_state.is_recording)
+
+        if self._was_recording and not parlia_state.is_recording:
+            self._update_cpu_counters()
+        if self._was_transcribing and not parlia_state.is_transcribing:
+            self._refresh_model_labels()
+            self._update_cpu_counters()
+        self._was_recording = parlia_state.is_recording
+        self._was_transcribing = parlia_state.is_transcribing
@@ -1,11 +1,13 @@
+import time
 from typing import Optional
 
 from PySide6.QtCore import Qt, Slot
-from PySide6.QtGui import QFont, QTextCharFormat
+from PySide6.QtGui import QFont, QTextCharFormat, QTextCursor
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
     QLabel,
+    QProgressBar,
     QPushButton,
     QStyle,
     QTextEdit,
@@ -13,13 +15,28 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from modules.parlia.config import config
+from modules.parlia.core.recorder_health import RecorderHealth
+from modules.parlia.core.telemetry import InputLevels
 from modules.parlia.services.audioService import audio_service
-from modules.parlia.services.parlia_data import get_max_duration, set_max_duration
+from modules.parlia.services.parlia_data import (
+    get_auto_stop_silence,
+    get_disk_recording,
+    get_max_duration,
+    get_streaming_enabled,
+    set_max_duration,
+)
 from modules.parlia.services.parlia_state_manager import parlia_state
-from modules.parlia.services.whisper_service import whisper_service
+from modules.parlia.services.whisper_service import (
+    TranscriptionResult,
+    whisper_service,
+)
 from modules.parlia.settings import ParliaSettings
 from modules.parlia.utils.stylesheet_loader import load_qss_for
 
+LEVEL_FLOOR_DBFS = -60.0  # Bas de l’indicateur de niveau
+CLIPPING_HOLD_SECONDS = 1.0  # Durée d’affichage d’une saturation
+
 
 class TranscriptionPanel(QWidget):
     def __init__(self, parent=None):
@@ -39,6 +56,7 @@ class TranscriptionPanel(QWidget):
 
         # ✅ Maintenant que tous les attributs sont là, on peut s’abonner en toute sécurité
         parlia_state.register_ui_component(self)
+        whisper_service.connect_transcription_timer(self.update_transcription_timer)
         self.apply_ui_state()
 
     def create_left_side(self):
@@ -66,6 +84,12 @@ class TranscriptionPanel(QWidget):
         left_layout.addSpacing(10)
         left_layout.addWidget(record_button)
 
+        # Avertissement si la prise précédente a perdu de l’audio
+        self.take_health_label = QLabel(ParliaSettings.LABEL_TAKE_DEGRADED)
+        self.take_health_label.setObjectName("statusLabel_warning")
+        self.take_health_label.hide()
+        left_layout.addWidget(self.take_health_label)
+
         self.update_record_button_state()
 
         left_widget.setLayout(left_layout)
@@ -76,6 +100,9 @@ class TranscriptionPanel(QWidget):
         Create and configure the record button with toggle behavior.
         """
         self.is_recording = False  # Initial recording state
+        self.current_job_id: Optional[int] = None  # Prise en cours d’enregistrement
+        self._streaming_jobs: set[int] = set()  # Prises transcrites en continu
+        self._job_text_starts: dict[int, int] = {}  # Début du texte de chaque prise
 
         self.record_button = QPushButton(ParliaSettings.LABEL_RECORD)
         self.record_button.setObjectName("recordButton")
@@ -97,6 +124,20 @@ class TranscriptionPanel(QWidget):
         print("[PANEL] toggle_recording() exécuté")
 
         if not self.is_recording:
+            # Pas de prise en attente : nouvelle dictée, on repart d’une zone vide
+            if whisper_service.pending_jobs() == 0:
+                self.transcription_text.clear()
+                self._job_text_starts.clear()
+
+            streaming = get_streaming_enabled()
+            job_id = whisper_service.start_job(
+                on_done=self._on_transcription_done,
+                on_partial=self._on_partial_transcription if streaming else None,
+            )
+            if job_id is None:
+                print("[PANEL] Impossible de démarrer une prise sans modèle.")
+                return
+
             print("Starting recording...")
             self.is_recording = True
             self.record_button.setText(ParliaSettings.LABEL_STOP)
@@ -106,8 +147,27 @@ class TranscriptionPanel(QWidget):
             )
             self.record_button.style().unpolish(self.record_button)
             self.record_button.style().polish(self.record_button)
-            audio_service.start_recording()
+
+            segment_sink = None
+            if streaming:
+                segment_sink = whisper_service.segment_sink(job_id)
+                self._streaming_jobs.add(job_id)
+
+            self.current_job_id = audio_service.start_recording(
+                max_duration=parlia_state.max_duration * 60,
+                segment_sink=segment_sink,
+                take_id=job_id,
+                auto_stop_silence=get_auto_stop_silence(),
+            )
             audio_service.connect_timer(self.update_timer_label)
+            if not streaming:
+                audio_service.connect_timer(whisper_service.on_recording_time)
+            audio_service.connect_levels(self.update_level_meter)
+            audio_service.connect_health(self._on_take_health)
+            self.take_health_label.hide()
+            audio_service.connect_auto_stopped(self._on_recording_auto_stopped)
+            audio_service.connect_finished(self._on_recording_finished)
+            parlia_state.set_recording(True)
             print("Recording started...")
         else:
             print("Stopping recording...")
@@ -120,12 +180,47 @@ class TranscriptionPanel(QWidget):
             self.record_button.style().unpolish(self.record_button)
             self.record_button.style().polish(self.record_button)
             audio_service.stop_recording()
+            self.reset_level_meter()
             print("Recording stopped...")
 
-            # ⏳ Transcription asynchrone
-            parlia_state.set_transcribing(True)
-            whisper_service.transcribe_async(callback=self._on_transcription_done)
-            whisper_service.connect_transcription_timer(self.update_transcription_timer)
+            # ⏳ La prise part en file : on peut enchaîner sur la suivante tout de suite
+            whisper_service.mark_stopped(self.current_job_id)
+            parlia_state.set_recording(False)
+
+    def _on_take_health(self, take_id: int, health: RecorderHealth):
+        if not health.is_degraded(config.capture.max_rate_error):
+            return
+        self.take_health_label.setToolTip(
+            ParliaSettings.LABEL_TAKE_HEALTH_DETAILS.format(
+                overflows=health.device_overflows + health.ring_overflows,
+                dropped=health.dropped_samples,
+                late=health.late_drains,
+                jitter=health.drain_jitter_ms,
+                rate=health.effective_rate,
+                error=health.rate_error,
+            )
+        )
+        self.take_health_label.show()
+
+    def _on_recording_auto_stopped(self, take_id: int):
+        """
+        La prise s’est arrêtée seule : même chemin qu’un appui sur stop,
+        la transcription part sans attendre le raccourci.
+        """
+        if self.is_recording and take_id == self.current_job_id:
+            print("[PANEL] Arrêt automatique de l’enregistrement.")
+            self.toggle_recording()
+
+    def _on_recording_finished(self, take_id: int, buffer):
+        """
+        Appelé quand l’AudioRecorder a fini d’écrire la prise dans son tampon.
+        En mode continu, les segments sont déjà en file.
+        """
+        if take_id in self._streaming_jobs:
+            self._streaming_jobs.discard(take_id)
+            return
+
+        whisper_service.submit_take(take_id, buffer)
 
     def manage_times(self, layout: QVBoxLayout):
         """
@@ -195,6 +290,8 @@ class TranscriptionPanel(QWidget):
             self.max_duration_combobox.setCurrentIndex(0)
 
         # ✅ Ajout essentiel : forcer la mise à jour de l’état global
+        # (« Aucun temps » n’est valable qu’avec l’enregistrement sur disque)
+        parlia_state.set_disk_recording(get_disk_recording())
         current_key = self.max_duration_combobox.currentData()
         parlia_state.set_max_duration(current_key)
 
@@ -214,9 +311,18 @@ class TranscriptionPanel(QWidget):
         self.recording_timer_label = QLabel(ParliaSettings.LABEL_TIMER_DEFAULT)
         self.recording_timer_label.setProperty("class", "timerLabel")
 
+        # Niveau du micro (RMS en dBFS), rouge tant que le signal sature
+        self.level_meter = QProgressBar()
+        self.level_meter.setObjectName("levelMeter")
+        self.level_meter.setRange(int(LEVEL_FLOOR_DBFS), 0)
+        self.level_meter.setFixedWidth(120)
+        self._clipping_until = 0.0
+        self.reset_level_meter()
+
         recording_time_layout = QHBoxLayout()
         recording_time_layout.addWidget(recording_time_label)
         recording_time_layout.addWidget(self.recording_timer_label)
+        recording_time_layout.addWidget(self.level_meter)
 
         return recording_time_layout
 
@@ -225,6 +331,33 @@ class TranscriptionPanel(QWidget):
         sec = int(seconds) % 60
         self.recording_timer_label.setText(f"{minutes:02}:{sec:02}")
 
+    def update_level_meter(self, levels: InputLevels):
+        dbfs = max(LEVEL_FLOOR_DBFS, levels.rms_dbfs)
+        self.level_meter.setValue(int(dbfs))
+        self.level_meter.setFormat(ParliaSettings.LABEL_LEVEL_METER.format(dbfs=dbfs))
+
+        now = time.monotonic()
+        if levels.clipped_samples:
+            self._clipping_until = now + CLIPPING_HOLD_SECONDS
+        self._set_level_meter_clipping(now < self._clipping_until)
+
+    def reset_level_meter(self):
+        self.level_meter.setValue(int(LEVEL_FLOOR_DBFS))
+        self.level_meter.setFormat("")
+        self._clipping_until = 0.0
+        self._set_level_meter_clipping(False)
+
+    def _set_level_meter_clipping(self, clipping: bool):
+        name = "levelMeter_clipping" if clipping else "levelMeter"
+        if self.level_meter.objectName() == name:
+            return
+        self.level_meter.setObjectName(name)
+        self.level_meter.setToolTip(
+            ParliaSettings.LABEL_LEVEL_CLIPPING if clipping else ""
+        )
+        self.level_meter.style().unpolish(self.level_meter)
+        self.level_meter.style().polish(self.level_meter)
+
     def create_transcription_time_section(self):
         transcription_time_label = QLabel(ParliaSettings.LABEL_TRANSCRIPTION_TIME)
         self.transcription_timer_label = QLabel(ParliaSettings.LABEL_TIMER_DEFAULT)
@@ -305,18 +438,49 @@ class TranscriptionPanel(QWidget):
         self.transcription_text = transcription_text
         return transcription_text
 
-    def _on_transcription_done(self, text: Optional[str]):
+    def _job_text_start(self, job_id: int) -> int:
+        """
+        Position où commence le texte de la prise. Les prises se terminent dans
+        l’ordre : le texte d’une prise est toujours ajouté en fin de zone.
         """
-        Callback appelé automatiquement à la fin de la transcription.
-        Affiche le texte transcrit ou un message d’erreur.
+        if job_id not in self._job_text_starts:
+            cursor = self.transcription_text.textCursor()
+            cursor.movePosition(QTextCursor.MoveOperation.End)
+            if not self.transcription_text.document().isEmpty():
+                cursor.insertText("\n\n")
+            self._job_text_starts[job_id] = cursor.position()
+        return self._job_text_starts[job_id]
+
+    def _on_partial_transcription(self, job_id: int, text: str):
         """
-        if text is None:
-            self.transcription_text.setPlainText("⚠️ Erreur lors de la transcription.")
+        Ajoute le texte d’un segment transcrit pendant l’enregistrement.
+        """
+        start = self._job_text_start(job_id)
+        cursor = self.transcription_text.textCursor()
+        cursor.movePosition(QTextCursor.MoveOperation.End)
+        if cursor.position() > start:
+            cursor.insertText(" ")
+        cursor.insertText(text)
+        self.transcription_text.setTextCursor(cursor)
+
+    def _on_transcription_done(self, result: TranscriptionResult):
+        """
+        Callback appelé automatiquement à la fin de la transcription d’une prise.
+        Remplace le texte partiel de la prise par le texte final ou un message d’erreur.
+        """
+        start = self._job_text_start(result.job_id)
+        self._job_text_starts.pop(result.job_id, None)
+
+        cursor = self.transcription_text.textCursor()
+        cursor.setPosition(start)
+        cursor.movePosition(
+            QTextCursor.MoveOperation.End, QTextCursor.MoveMode.KeepAnchor
+        )
+        if result.text is None:
+            cursor.insertText("⚠️ Erreur lors de la transcription.")
         else:
-            self.transcription_text.setPlainText(text)
+            cursor.insertText(result.text)
 
-        # Réactiver les boutons, réinitialiser l’état
-        parlia_state.set_transcribing(False)
         self.update_record_button_state()
 
     def apply_bold_formatting(self):
@@ -25,11 +25,12 @@ def save_module_state(data: dict) -> None:
 def set_module_favorite(module_name: str, is_favorite: bool) -> None:
     """
     Modifie ou ajoute le champ `favorite` pour le module donné dans le fichier user_data.
+    Rien n’est écrit si la valeur enregistrée est déjà la bonne.
     """
-    data = load_module_state()
+    with user_data.batch():
+        data = load_module_state()
+        if data.get(module_name, {}).get("favorite") == is_favorite:
+            return
 
-    if module_name not in data:
-        data[module_name] = {}
-
-    data[module_name]["favorite"] = is_favorite
-    save_module_state(data)
+        data.setdefault(module_name, {})["favorite"] = is_favorite
+        save_module_state(data)
@@ -19,6 +19,10 @@ class Settings:
     # MODULES_PATH: str = "src/modules"
     # CONFIG_PATH: str = "config/settings.json"
 
+    # Stockage des données utilisateur, choisi au démarrage :
+    # "json" (un fichier par module) ou "sqlite" (une ligne par clé, user_data/user_data.db)
+    USER_DATA_BACKEND: str = "json"
+
     # labels
     LABEL_HOME: str = "Accueil"
     LABEL_SETTINGS: str = "Paramètres"
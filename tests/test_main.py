@@ -0,0 +1,22 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
+
+def test_spawned_children_do_not_import_the_gui(tmp_path):
+    # Arrange : un fils "spawn" réimporte main.py sous le nom __mp_main__
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+    script = (
+        "import runpy, sys; "
+        f"runpy.run_path({str(SRC_DIR / 'main.py')!r}, run_name='__mp_main__'); "
+        "sys.exit(any(m in sys.modules for m in ('PySide6', 'gui.main_window')))"
+    )
+
+    # Act
+    result = subprocess.run([sys.executable, "-c", script], cwd=tmp_path, env=env)
+
+    # Assert
+    assert result.returncode == 0
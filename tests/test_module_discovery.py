@@ -0,0 +1,61 @@
+import os
+
+from core.module_discovery import ModuleIndex, read_module_info
+
+INIT_SOURCE = """
+import module_qui_n_existe_pas
+
+from models.module_info import ModuleInfo as BaseModuleInfo
+
+name = "Demo"
+description = "Module de test"
+tags = ["audio"]
+
+raise RuntimeError("le module ne doit pas être exécuté")
+
+ModuleInfo = BaseModuleInfo(name=name, description=description, tags=tags, mobile=True)
+"""
+
+
+def _write_module(tmp_path, source=INIT_SOURCE):
+    module_dir = tmp_path / "demo"
+    module_dir.mkdir(exist_ok=True)
+    init_path = module_dir / "__init__.py"
+    init_path.write_text(source, encoding="utf-8")
+    return init_path
+
+
+def test_module_info_is_read_without_import(tmp_path):
+    # Arrange
+    init_path = _write_module(tmp_path)
+
+    # Act
+    info = read_module_info(init_path)
+
+    # Assert
+    assert info.name == "Demo"
+    assert info.description == "Module de test"
+    assert info.tags == ["audio"]
+    assert info.mobile is True
+    assert info.version == "0.1.0"
+
+
+def test_index_is_reused_until_the_file_changes(tmp_path):
+    # Arrange
+    init_path = _write_module(tmp_path)
+    index_path = tmp_path / "module_index.json"
+    ModuleIndex(index_path).module_info(init_path)
+    saved = index_path.read_text(encoding="utf-8")
+
+    # Act : nouvelle session, fichier inchangé puis modifié
+    unchanged = ModuleIndex(index_path).module_info(init_path)
+    rewritten = index_path.read_text(encoding="utf-8")
+    _write_module(tmp_path, INIT_SOURCE.replace('"Demo"', '"Démo 2"'))
+    stat = init_path.stat()
+    os.utime(init_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    changed = ModuleIndex(index_path).module_info(init_path)
+
+    # Assert
+    assert unchanged.name == "Demo"
+    assert rewritten == saved
+    assert changed.name == "Démo 2"
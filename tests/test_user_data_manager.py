@@ -0,0 +1,105 @@
+import json
+import os
+
+from core.user_data_manager import UserDataManager
+
+
+def test_writes_are_coalesced_into_one_flush(tmp_path):
+    # Arrange
+    manager = UserDataManager(tmp_path, flush_delay=60)
+    path = tmp_path / "parlia.json"
+    before = path.read_text(encoding="utf-8")
+
+    # Act
+    manager.set("parlia", "a", 1)
+    manager.set("parlia", "b", 2)
+    pending = path.read_text(encoding="utf-8")
+    manager.flush()
+
+    # Assert
+    assert pending == before
+    assert json.loads(path.read_text(encoding="utf-8"))["data"] == {"a": 1, "b": 2}
+    assert not (tmp_path / "parlia.json.tmp").exists()
+
+
+def test_external_change_invalidates_the_cache(tmp_path):
+    # Arrange
+    manager = UserDataManager(tmp_path, flush_delay=0)
+    manager.set("volund", "theme", "dark")
+    path = tmp_path / "volund.json"
+
+    # Act : modification par un autre programme (mtime différent)
+    path.write_text(
+        json.dumps({"version": 1, "data": {"theme": "light"}}), encoding="utf-8"
+    )
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    # Assert
+    assert manager.get("volund", "theme") == "light"
+
+
+def test_returned_values_are_copies(tmp_path):
+    # Arrange
+    manager = UserDataManager(tmp_path, flush_delay=60)
+    manager.set("volund", "module_state", {"parlia": {"favorite": True}})
+
+    # Act
+    state = manager.get("volund", "module_state")
+    state["parlia"]["favorite"] = False
+
+    # Assert
+    assert manager.get("volund", "module_state") == {"parlia": {"favorite": True}}
+
+
+def test_batch_writes_once_at_the_end(tmp_path):
+    # Arrange
+    manager = UserDataManager(tmp_path, flush_delay=0)
+    path = tmp_path / "volund.json"
+    before = path.read_text(encoding="utf-8")
+
+    # Act
+    with manager.batch():
+        manager.set("volund", "a", 1)
+        with manager.batch():
+            manager.set("volund", "b", 2)
+        pending = path.read_text(encoding="utf-8")
+
+    # Assert
+    assert pending == before
+    assert json.loads(path.read_text(encoding="utf-8"))["data"] == {"a": 1, "b": 2}
+
+
+def test_unchanged_value_is_not_written(tmp_path):
+    # Arrange : fichier compact, qu’une sauvegarde réécrirait indenté
+    content = json.dumps({"version": 1, "data": {"theme": "dark"}})
+    (tmp_path / "volund.json").write_text(content, encoding="utf-8")
+    manager = UserDataManager(tmp_path, flush_delay=0)
+
+    # Act
+    manager.set("volund", "theme", "dark")
+    manager.save("volund", {"theme": "dark"})
+
+    # Assert
+    assert (tmp_path / "volund.json").read_text(encoding="utf-8") == content
+
+
+def test_failed_write_is_retried(tmp_path, monkeypatch):
+    # Arrange
+    manager = UserDataManager(tmp_path, flush_delay=60)
+    manager.set("volund", "theme", "dark")
+
+    def fail(*args):
+        raise OSError("disque plein")
+
+    # Act
+    with monkeypatch.context() as patch:
+        patch.setattr(os, "replace", fail)
+        manager.flush()
+    failed = json.loads((tmp_path / "volund.json").read_text(encoding="utf-8"))
+    manager.flush()
+
+    # Assert
+    assert failed["data"] == {}
+    saved = json.loads((tmp_path / "volund.json").read_text(encoding="utf-8"))
+    assert saved["data"] == {"theme": "dark"}
@@ -0,0 +1,103 @@
+import json
+import threading
+
+from core.user_data_sqlite import DATABASE_NAME, SqliteUserDataManager
+
+
+def test_json_files_are_migrated_once(tmp_path):
+    # Arrange
+    path = tmp_path / "parlia.json"
+    path.write_text(
+        json.dumps({"version": 1, "data": {"model": "small.pt", "max_duration": 60}}),
+        encoding="utf-8",
+    )
+
+    # Act
+    first = SqliteUserDataManager(tmp_path)
+    first.set("parlia", "model", "medium.pt")
+    first.close()
+    second = SqliteUserDataManager(tmp_path)
+
+    # Assert : le JSON n’est pas réimporté par-dessus la base
+    assert (tmp_path / DATABASE_NAME).exists()
+    assert second.load("parlia") == {"model": "medium.pt", "max_duration": 60}
+    assert second.get_version("parlia") == 1
+    second.close()
+
+
+def test_set_and_save_round_trip(tmp_path):
+    # Arrange
+    manager = SqliteUserDataManager(tmp_path)
+
+    # Act
+    manager.set("volund", "module_state", {"parlia": {"favorite": True}})
+    manager.save("tracker", {"a": [1, 2], "b": None})
+    state = manager.get("volund", "module_state")
+    state["parlia"]["favorite"] = False
+
+    # Assert
+    assert manager.get("volund", "module_state") == {"parlia": {"favorite": True}}
+    assert manager.load("tracker") == {"a": [1, 2], "b": None}
+    assert manager.get("volund", "missing") is None
+    manager.close()
+
+
+def test_concurrent_batches_do_not_lose_updates(tmp_path):
+    # Arrange
+    manager = SqliteUserDataManager(tmp_path)
+    manager.set("volund", "counter", 0)
+
+    def increment():
+        for _ in range(50):
+            with manager.batch():
+                value = manager.get("volund", "counter")
+                manager.set("volund", "counter", value + 1)
+
+    # Act
+    threads = [threading.Thread(target=increment) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Assert
+    assert manager.get("volund", "counter") == 200
+    manager.close()
+
+
+def test_failed_batch_is_rolled_back(tmp_path):
+    # Arrange
+    manager = SqliteUserDataManager(tmp_path)
+    manager.set("volund", "theme", "dark")
+
+    # Act
+    try:
+        with manager.batch():
+            manager.set("volund", "theme", "light")
+            manager.set("volund", "zoom", 2)
+            raise RuntimeError("interrompu")
+    except RuntimeError:
+        pass
+
+    # Assert
+    assert manager.load("volund") == {"theme": "dark"}
+    manager.close()
+
+
+def test_only_user_data_documents_are_migrated(tmp_path):
+    # Arrange : caches rangés à côté des données utilisateur
+    (tmp_path / "parlia_transcriptions.json").write_text(
+        json.dumps({"version": 1, "entries": [["abc", "bonjour"]]}), encoding="utf-8"
+    )
+    (tmp_path / "module_index.json").write_text(
+        json.dumps({"version": 1, "entries": {}}), encoding="utf-8"
+    )
+
+    # Act
+    manager = SqliteUserDataManager(tmp_path)
+
+    # Assert
+    assert manager.get_version("parlia_transcriptions") == 0
+    assert manager.get_version("module_index") == 0
+    assert manager.get_version("parlia") == 1
+    manager.close()